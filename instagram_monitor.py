@@ -63,6 +63,21 @@ SMTP_SSL = True
 SENDER_EMAIL = "your_sender_email"
 RECEIVER_EMAIL = "your_receiver_email"
 
+# Email and webhook notifications are written to an outbox file and delivered by a background sender thread, so
+# monitoring never waits for the SMTP or webhook server; the sender keeps one SMTP connection logged in between emails
+# and notifications still undelivered at exit are sent after the next start
+NOTIFICATION_OUTBOX = True
+
+# Path of the outbox file; leave empty to use .notification_outbox.json in OUTPUT_DIR (or the current directory)
+NOTIFICATION_OUTBOX_FILE = ""
+
+# Emails waiting in the outbox together are merged into one digest email
+# Set above 0 to hold every email up to this many seconds, so bursts spread over that time are merged as well
+NOTIFICATION_DIGEST_INTERVAL = 0
+
+# How many times a failed email or webhook delivery is tried before it is dropped (waiting 30s, 60s, 120s, ... between tries)
+NOTIFICATION_RETRY_ATTEMPTS = 5
+
 # Whether to send an email on new post/reel/story, bio change, new follow, profile pic or visibility change
 # Can also be enabled via the -s flag
 STATUS_NOTIFICATION = False
@@ -106,7 +121,8 @@ TIME_FORMAT_12H = False
 # If enabled, the current profile picture is saved as:
 #   - instagram_<username>_profile_pic.jpg (initial)
 #   - instagram_<username>_profile_pic_YYmmdd_HHMM.jpg (on change)
-# The binary JPGs are compared to detect changes
+# The picture's CDN asset id is checked first (conditional request if it changed), a downloaded JPG is compared by SHA-256
+# digest with the saved one kept in instagram_<username>_profile_pic.meta.json
 # Can also be disabled by using -k flag
 DETECT_CHANGED_PROFILE_PIC = True
 
@@ -114,6 +130,31 @@ DETECT_CHANGED_PROFILE_PIC = True
 # If False, only videos (if available) will be downloaded
 DOWNLOAD_THUMBNAILS = True
 
+# Keep downloaded post, reel and story media in a shared content-addressed store and hard-link it into the per-target
+# images / videos dirs, so media seen again (collab posts shared by several targets, re-detections after a restart)
+# is not downloaded twice
+MEDIA_STORE_ENABLED = True
+
+# Location of the shared media store, empty = .media_store inside OUTPUT_DIR (or the current dir without OUTPUT_DIR)
+MEDIA_STORE_DIR = ""
+
+# Post, reel, story and collab videos are downloaded in the background by this many worker threads, so a large video
+# never delays the next check; an interrupted download continues where it stopped (HTTP Range request) when retried
+# Set to 0 to download videos in the monitoring thread
+MEDIA_DOWNLOAD_WORKERS = 2
+
+# Media downloads larger than this many megabytes are abandoned, set to 0 for no limit
+MEDIA_DOWNLOAD_MAX_MB = 1024
+
+# How many recent posts, reels and stories per target the dashboards keep in their recent updates history
+FETCHED_UPDATES_DEPTH = 10
+
+# Save the recent updates history to disk, so the dashboards show it again right after a restart
+FETCHED_UPDATES_PERSIST = True
+
+# Location of the recent updates history file, empty = .fetched_updates.json inside OUTPUT_DIR (or the current dir)
+FETCHED_UPDATES_FILE = ""
+
 # Location of the optional file with the empty profile picture template
 #
 # Path resolution logic (if relative path):
@@ -165,6 +206,35 @@ DETECT_COLLAB_POSTS = True
 # This is useful for detecting when someone unfollows and someone else follows in the same interval, keeping the count unchanged
 FOLLOWERS_CHURN_DETECTION = False
 
+# Follower and following lists are saved as a base JSON snapshot plus a history of per-check changes
+# (instagram_<username>_followers_history.jsonl), so large lists are not rewritten in full on every check
+# The base snapshot is rewritten (compacted) after this many change entries and a new history is started, set to 0 to never compact
+# The previous base and history are kept (..._base.<N>.json, ..._history.<N>.jsonl), so older lists can still be rebuilt
+FOLLOW_SNAPSHOT_COMPACT_EVERY = 50
+
+# Story checks of all targets sharing a session are batched into one multi-user request
+# A check waits up to STORY_BATCH_WINDOW seconds for other targets' story checks to join its batch; the batch also covers
+# targets whose next check is due within STORY_BATCH_TTL seconds, and results are reused for that long
+STORY_BATCH_WINDOW = 2
+STORY_BATCH_TTL = 60
+
+# Save each target's monitoring state (counts, bio, latest post / story timestamps, profile picture digest and
+# session user) to instagram_<username>_state.json after every check, so a restart resumes from it instead of
+# repeating the initial profile, reels, stories, own profile, profile picture and latest post requests per target
+STATE_CHECKPOINT_ENABLED = True
+
+# Checkpoints older than this (in seconds) are ignored and the target starts with a full baseline; 0 = no limit
+STATE_CHECKPOINT_MAX_AGE = 86400
+
+# Incremental follower / following fetching: Instagram lists accounts newest first, so paging can stop once it reaches
+# a run of FOLLOW_INCREMENTAL_MATCH_RUN consecutive usernames matching the saved list; the rest is taken from the saved
+# list and checked against the reported count, any mismatch falls back to a full scan
+# A full scan is also done at startup and every FOLLOW_INCREMENTAL_FULL_SCAN_INTERVAL seconds (0 = only at startup)
+# Not used when FOLLOWER_LIMIT_TO_FETCH / FOLLOWEE_LIMIT_TO_FETCH cap the list
+FOLLOW_INCREMENTAL_FETCH = False
+FOLLOW_INCREMENTAL_MATCH_RUN = 20
+FOLLOW_INCREMENTAL_FULL_SCAN_INTERVAL = 86400  # 24 hours
+
 # Whether to skip reporting and notifications for follower and following changes
 # (new follows, unfollows and count changes)
 SKIP_FOLLOW_CHANGES = False
@@ -179,6 +249,12 @@ DAILY_HUMAN_HITS = 5
 # List of hashtags to browse
 MY_HASHTAGS = ["travel", "food", "nature"]
 
+# Visiting a random followee picks from a sample of the session user's followees shared by all targets
+# Only the first OWN_FOLLOWEES_SAMPLE_SIZE followees are fetched, and the sample is refreshed after
+# OWN_FOLLOWEES_SAMPLE_TTL seconds
+OWN_FOLLOWEES_SAMPLE_SIZE = 50
+OWN_FOLLOWEES_SAMPLE_TTL = 21600
+
 # Set to True to enable verbose output during human simulation actions
 BE_HUMAN_VERBOSE = False
 
@@ -315,6 +391,12 @@ MAX_H2 = 23
 # Delay for fetching other data to avoid captcha checks and detection of automated tools
 NEXT_OPERATION_DELAY = 0.7
 
+# How long (in seconds) a web_profile_info response is reused within a single check cycle
+# The profile lookup, reels count, latest post and collab checks of one poll then share a single request
+# The cache is always cleared when the cycle ends, so the TTL only caps unusually long cycles
+# Set to 0 to disable the cache
+PROFILE_INFO_CACHE_TTL = 120
+
 # CSV file to write all activities and profile changes
 # Can also be set using the -b flag
 #
@@ -330,6 +412,13 @@ NEXT_OPERATION_DELAY = 0.7
 #    - Single-target mode: OUTPUT_DIR/csvs/<filename> (uses basename of CSV_FILE)
 CSV_FILE = ""
 
+# Events written to the CSV files are also stored in one indexed SQLite database (target, date, type, old, new),
+# so the history of a target can be queried by date range and exported with --export-events
+EVENTS_DB_ENABLED = True
+
+# Location of the events database, empty = instagram_monitor_events.db inside OUTPUT_DIR (or the current dir)
+EVENTS_DB_FILE = ""
+
 # Location of the optional dotenv file which can keep secrets
 # If not specified it will try to auto-search for .env files
 # To disable auto-search, set this to the literal string "none"
@@ -376,6 +465,12 @@ OUTPUT_DIR = ""
 # Can also be disabled via the -d flag
 DISABLE_LOGGING = False
 
+# How often (in seconds) the background log writer writes queued lines to the log files and flushes them
+# Lines are written sooner once LOG_WRITE_BATCH_SIZE of them are waiting, and always on exit
+# Set to 0 to write and flush every line straight from the printing thread
+LOG_WRITE_INTERVAL = 1
+LOG_WRITE_BATCH_SIZE = 500
+
 # Width of horizontal line
 HORIZONTAL_LINE = 113
 
@@ -417,9 +512,37 @@ MULTI_TARGET_STAGGER = 0
 MULTI_TARGET_STAGGER_JITTER = 5
 
 #
-# If True, serializes all HTTP calls (via a global lock) across targets. Recommended for multi-target mode.
+# If True, serializes all HTTP calls (via a global lock) across targets
+# Not used while the rate limiter below is active, the rate limiter is the recommended way to stay ban-safe
 MULTI_TARGET_SERIALIZE_HTTP = True
 
+#
+# Token-bucket rate limiting of Instagram requests shared by all targets
+# Only active when more than one target is monitored, a single target is never throttled
+# Requests may run concurrently, but each endpoint class and the global budget only allow the configured
+# sustained number of requests per minute (bursts of up to RATE_LIMIT_BURST requests are allowed)
+# Requests to non-Instagram hosts (webhooks, ntfy, IP checks) are never limited
+RATE_LIMIT_ENABLED = True
+
+# Sustained requests per minute for all Instagram requests combined (0 = no global budget)
+RATE_LIMIT_GLOBAL_PER_MIN = 90
+
+# Sustained requests per minute per endpoint class: GraphQL queries, iPhone API (i.instagram.com / api/v1)
+# and CDN media downloads (0 = no limit for that class)
+RATE_LIMIT_GRAPHQL_PER_MIN = 30
+RATE_LIMIT_IPHONE_PER_MIN = 30
+RATE_LIMIT_CDN_PER_MIN = 60
+
+# Maximum number of requests a bucket allows back-to-back after being idle
+RATE_LIMIT_BURST = 10
+
+#
+# Maximum number of targets allowed to run a check at the same time in multi-target mode
+# Targets that become due while all slots are busy are queued and dispatched earliest-due first
+# Manual rechecks from the dashboards are not limited
+# Set to 0 for no limit
+MULTI_TARGET_MAX_CONCURRENT_CHECKS = 0
+
 # ----------------------------
 # Terminal Dashboard Settings
 # ----------------------------
@@ -449,6 +572,18 @@ WEB_DASHBOARD_HOST = '127.0.0.1'
 # Can also be set via --web-dashboard-template-dir flag
 WEB_DASHBOARD_TEMPLATE_DIR = ""
 
+# The web dashboard receives changes over a push stream (/api/events) instead of polling /api/status
+# While nothing changes, global fields (uptime, session state) are refreshed this often, in seconds
+WEB_DASHBOARD_PUSH_IDLE_INTERVAL = 5
+
+# /api/status and /api/settings answer repeated requests for unchanged data with 304 Not Modified (ETag)
+# Responses of at least this many bytes are gzip-compressed for clients which accept it; 0 disables compression
+WEB_DASHBOARD_GZIP_MIN_SIZE = 1024
+
+# How many activity log entries the web dashboard keeps for /api/activity?after=<seq> cursor reads
+# /api/status always carries only the newest 100 of them
+WEB_DASHBOARD_ACTIVITY_RETENTION = 500
+
 # ---------------------------------
 # Terminal + Web Dashboard Settings
 # ---------------------------------
@@ -812,6 +947,13 @@ RANDOM_SLEEP_DIFF_HIGH = 0
 LOCAL_TIMEZONE = ""
 DETECT_CHANGED_PROFILE_PIC = False
 DOWNLOAD_THUMBNAILS = False
+MEDIA_STORE_ENABLED = False
+MEDIA_STORE_DIR = ""
+MEDIA_DOWNLOAD_WORKERS = 0
+MEDIA_DOWNLOAD_MAX_MB = 0
+FETCHED_UPDATES_DEPTH = 0
+FETCHED_UPDATES_PERSIST = False
+FETCHED_UPDATES_FILE = ""
 PROFILE_PIC_FILE_EMPTY = ""
 IMGCAT_PATH = ""
 SKIP_SESSION = False
@@ -831,6 +973,8 @@ CURL_CFFI_IMPERSONATE = "auto"
 BE_HUMAN = False
 DAILY_HUMAN_HITS = 0
 MY_HASHTAGS = []
+OWN_FOLLOWEES_SAMPLE_SIZE = 0
+OWN_FOLLOWEES_SAMPLE_TTL = 0
 BE_HUMAN_VERBOSE = False
 ENABLE_JITTER = False
 JITTER_VERBOSE = False
@@ -854,7 +998,10 @@ MAX_H1 = 0
 MIN_H2 = 0
 MAX_H2 = 0
 NEXT_OPERATION_DELAY = 0
+PROFILE_INFO_CACHE_TTL = 0
 CSV_FILE = ""
+EVENTS_DB_ENABLED = False
+EVENTS_DB_FILE = ""
 DOTENV_FILE = ""
 FIREFOX_MACOS_COOKIE = ""
 FIREFOX_WINDOWS_COOKIE = ""
@@ -870,6 +1017,8 @@ CONTAINER_FIREFOX_HOSTS = {
 INSTA_LOGFILE = ""
 OUTPUT_DIR = ""
 DISABLE_LOGGING = False
+LOG_WRITE_INTERVAL = 0
+LOG_WRITE_BATCH_SIZE = 0
 HORIZONTAL_LINE = 0
 CLEAR_SCREEN = False
 INSTA_CHECK_SIGNAL_VALUE = 0
@@ -877,6 +1026,13 @@ TARGET_USERNAMES = []
 MULTI_TARGET_STAGGER = 0
 MULTI_TARGET_STAGGER_JITTER = 0
 MULTI_TARGET_SERIALIZE_HTTP = False
+MULTI_TARGET_MAX_CONCURRENT_CHECKS = 0
+RATE_LIMIT_ENABLED = False
+RATE_LIMIT_GLOBAL_PER_MIN = 0
+RATE_LIMIT_GRAPHQL_PER_MIN = 0
+RATE_LIMIT_IPHONE_PER_MIN = 0
+RATE_LIMIT_CDN_PER_MIN = 0
+RATE_LIMIT_BURST = 1
 WEBHOOK_ENABLED = False
 WEBHOOK_URL = ""
 WEBHOOK_PROVIDER = "discord"
@@ -902,9 +1058,24 @@ WEB_DASHBOARD_ENABLED = False
 WEB_DASHBOARD_PORT = 8000
 WEB_DASHBOARD_HOST = '127.0.0.1'
 WEB_DASHBOARD_TEMPLATE_DIR = ""
+WEB_DASHBOARD_PUSH_IDLE_INTERVAL = 5
+WEB_DASHBOARD_GZIP_MIN_SIZE = 0
+WEB_DASHBOARD_ACTIVITY_RETENTION = 0
 DASHBOARD_SHOW_CHECK_SECONDS = True
 THUMBNAILS_FORCED_BY_WEB = False
 FOLLOWERS_CHURN_DETECTION = False
+FOLLOW_SNAPSHOT_COMPACT_EVERY = 0
+STORY_BATCH_WINDOW = 0
+STORY_BATCH_TTL = 0
+STATE_CHECKPOINT_ENABLED = False
+STATE_CHECKPOINT_MAX_AGE = 0
+NOTIFICATION_OUTBOX = False
+NOTIFICATION_OUTBOX_FILE = ""
+NOTIFICATION_DIGEST_INTERVAL = 0
+NOTIFICATION_RETRY_ATTEMPTS = 0
+FOLLOW_INCREMENTAL_FETCH = False
+FOLLOW_INCREMENTAL_MATCH_RUN = 0
+FOLLOW_INCREMENTAL_FULL_SCAN_INTERVAL = 0
 TIME_FORMAT_12H = False
 PRIVACY_SUBSTITUTIONS = []
 mode_of_the_tool = "Unknown"
@@ -1000,13 +1171,13 @@ WEB_DASHBOARD_DATA = {
     'dashboard_mode': 'user',
     'uptime': None,
     'start_time': None,
-    'activities': [],
     'is_monitoring': False,
     'session': {'username': SESSION_USERNAME if SESSION_USERNAME else None, 'active': False}
 }
 WEB_DASHBOARD_MONITOR_THREADS = {}  # Active monitoring threads by username
 WEB_DASHBOARD_STOP_EVENTS = {}  # Stop events for each monitoring thread
 WEB_DASHBOARD_RECHECK_EVENTS = {}  # Recheck events for each monitoring thread
+FOLLOW_SNAPSHOT_STORES = {}  # Follower and following snapshot stores of monitored targets by username
 
 
 # ASCII art startup banner (pure ASCII for maximum terminal portability)
@@ -1026,6 +1197,7 @@ STARTUP_BANNER = r"""
 
 import sys
 import signal
+import atexit
 
 
 # Early signal handler to catch Ctrl+C during imports/initialization
@@ -1075,10 +1247,13 @@ import platform
 from platform import system
 import re
 import ipaddress
-from itertools import zip_longest
 import subprocess
 import threading
+from collections import deque, OrderedDict
+import heapq
+import bisect
 import hashlib
+import gzip
 
 # Initialize the web dashboard data lock now that threading is imported
 # Important: this lock is acquired from multiple call-sites that can nest (e.g. helpers called inside other locked
@@ -1530,12 +1705,12 @@ _install_copy_session_proxy_patch()
 from instaloader.exceptions import PrivateProfileNotFollowedException
 from html import escape
 from itertools import islice
-from typing import Optional, Tuple, Any, Callable, Dict, List, TypeVar, cast
+from typing import Optional, Tuple, Any, Dict, List, TypeVar, cast
 from glob import glob
 import sqlite3
 from sqlite3 import OperationalError, connect
 from pathlib import Path, PurePosixPath, PureWindowsPath
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
 from functools import wraps
 import traceback
 import copy
@@ -1565,15 +1740,18 @@ except ImportError:
     RICH_AVAILABLE = False
 
 try:
-    from flask import Flask, render_template, jsonify, request as flask_request, send_from_directory  # type: ignore
+    from flask import Flask, render_template, jsonify, json as flask_json, request as flask_request, send_from_directory, Response as FlaskResponse, stream_with_context  # type: ignore
     import jinja2
     FLASK_AVAILABLE = True
 except ImportError:
     Flask = None  # type: ignore
     render_template = None  # type: ignore
     jsonify = None  # type: ignore
+    flask_json = None  # type: ignore
     flask_request = None  # type: ignore
     send_from_directory = None  # type: ignore
+    FlaskResponse = None  # type: ignore
+    stream_with_context = None  # type: ignore
     jinja2 = None  # type: ignore
     FLASK_AVAILABLE = False
 
@@ -1669,7 +1847,7 @@ def _peek_web_dashboard_template_dir_autodetect() -> Optional[str]:
 # acquiring this lock) and then acquire it again for logging to files
 STDOUT_LOCK = threading.RLock()
 
-# Global lock for serializing HTTP calls (used by multi-target mode / optional)
+# Global lock for serializing HTTP calls (used by multi-target mode when the rate limiter is disabled)
 # Must be re-entrant because requests' request() calls send() internally and we may wrap both
 HTTP_SERIAL_LOCK = threading.RLock()
 
@@ -1882,6 +2060,34 @@ def create_web_dashboard_app():
     # Update global variable so it shows in dashboard
     WEB_DASHBOARD_TEMPLATE_DIR = template_dir
 
+    # Settings, mode, session and target changes all arrive as non-GET API requests, so drop the cached config snapshot after them
+    @app.after_request
+    def invalidate_config_after_change(response):  # type: ignore
+        if flask_request.method != 'GET' and flask_request.path.startswith('/api/'):  # type: ignore
+            invalidate_dashboard_config_cache()
+        return response
+
+    # Returns a JSON response with a content-hash ETag, answering 304 when the client already holds that content,
+    # and gzip-compressed when the client accepts it and the body is at least WEB_DASHBOARD_GZIP_MIN_SIZE bytes
+    # volatile_keys are left out of the hash (e.g. 'uptime', which the page derives from 'uptime_since' between changes)
+    def conditional_json_response(payload, volatile_keys=()):
+        body = flask_json.dumps(payload).encode('utf-8')  # type: ignore
+        hashed = flask_json.dumps({k: v for k, v in payload.items() if k not in volatile_keys}).encode('utf-8') if volatile_keys else body  # type: ignore
+        etag = hashlib.sha1(hashed).hexdigest()
+
+        if flask_request.if_none_match.contains_weak(etag):  # type: ignore
+            response = FlaskResponse(status=304)  # type: ignore
+        else:
+            response = FlaskResponse(body, mimetype='application/json')  # type: ignore
+            if WEB_DASHBOARD_GZIP_MIN_SIZE and len(body) >= WEB_DASHBOARD_GZIP_MIN_SIZE and 'gzip' in flask_request.accept_encodings:  # type: ignore
+                response.set_data(gzip.compress(body, compresslevel=6))
+                response.headers['Content-Encoding'] = 'gzip'
+        # Weak, since the gzip and plain bodies share the tag; no-cache makes browsers revalidate on every fetch
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept-Encoding')
+        return response
+
     @app.route('/')
     def index():  # type: ignore
         return render_template('index.html', version=VERSION)  # type: ignore[misc]
@@ -1949,74 +2155,147 @@ def create_web_dashboard_app():
 
         return data
 
-    @app.route('/api/status')
-    def api_status():  # type: ignore
+    # Builds the status payload with recomputed time labels and privacy substitutions applied
+    # users=None returns everything, a set of users returns only those targets (push deltas) plus the global fields
+    def build_web_dashboard_status(users=None, include_activities=True):
+        # Only the small global values are copied under the lock, targets come from their published snapshots
         with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
-            data = copy.deepcopy(WEB_DASHBOARD_DATA)
-            # Ensure targets key always exists
-            if 'targets' not in data:
-                data['targets'] = {}
-            # Calculate uptime
-            if data.get('start_time'):
-                uptime_delta = datetime.now() - data['start_time']
-                hours, remainder = divmod(int(uptime_delta.total_seconds()), 3600)
-                minutes, seconds = divmod(remainder, 60)
-                data['uptime'] = f"{hours}h {minutes}m {seconds}s"
-
-            # Use consistent session data
-            data['session'] = get_web_dashboard_session_data()
-
-            # Ensure targets is always a dict (not None)
-            if data.get('targets') is None:
-                data['targets'] = {}
-
-            # Recompute time labels dynamically from timestamps
-            now_ts = datetime.now().timestamp()
-            try:
-                if LAST_CHECK_TIME:
-                    data['last_check'] = get_squeezed_date_from_ts(LAST_CHECK_TIME, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
-                # Only expose a timestamp-based global next check when it is in the future
-                # Otherwise keep a meaningful label (e.g. "In Progress") to avoid showing stale times
-                if NEXT_CHECK_TIME and NEXT_CHECK_TIME > now_ts:
-                    data['next_check'] = get_squeezed_date_from_ts(NEXT_CHECK_TIME, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
-                elif NEXT_CHECK_DISPLAY:
-                    data['next_check'] = NEXT_CHECK_DISPLAY
-            except Exception:
-                # Never fail the status endpoint due to formatting issues
-                pass
+            data = {key: copy.deepcopy(value) for key, value in WEB_DASHBOARD_DATA.items() if key not in ('targets', 'activities')}
+            all_targets = WEB_DASHBOARD_DATA.get('targets') or {}
+            if users is None:
+                data['targets'] = {user: WEB_DASHBOARD_SNAPSHOTS.get(user, t_data) for user, t_data in all_targets.items()}
+            else:
+                data['targets'] = {user: WEB_DASHBOARD_SNAPSHOTS.get(user, all_targets[user]) for user in users if user in all_targets}
+                data['removed_targets'] = sorted(user for user in users if user not in all_targets)
+            if users is None or include_activities:
+                data['activities'] = WEB_DASHBOARD_ACTIVITY.latest(WEB_DASHBOARD_STATUS_ACTIVITIES)
+                data['activity_seq'] = WEB_DASHBOARD_ACTIVITY.last_seq
+
+        # Calculate uptime
+        if data.get('start_time'):
+            data['uptime_since'] = data['start_time'].timestamp()
+            uptime_delta = datetime.now() - data['start_time']
+            hours, remainder = divmod(int(uptime_delta.total_seconds()), 3600)
+            minutes, seconds = divmod(remainder, 60)
+            data['uptime'] = f"{hours}h {minutes}m {seconds}s"
+
+        # Use consistent session data
+        data['session'] = get_web_dashboard_session_data()
+
+        # Ensure targets is always a dict (not None)
+        if data.get('targets') is None:
+            data['targets'] = {}
+
+        # Recompute time labels dynamically from timestamps
+        now_ts = datetime.now().timestamp()
+        try:
+            if LAST_CHECK_TIME:
+                data['last_check'] = get_squeezed_date_from_ts(LAST_CHECK_TIME, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
+            # Only expose a timestamp-based global next check when it is in the future
+            # Otherwise keep a meaningful label (e.g. "In Progress") to avoid showing stale times
+            if NEXT_CHECK_TIME and NEXT_CHECK_TIME > now_ts:
+                data['next_check'] = get_squeezed_date_from_ts(NEXT_CHECK_TIME, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
+            elif NEXT_CHECK_DISPLAY:
+                data['next_check'] = NEXT_CHECK_DISPLAY
+        except Exception:
+            # Never fail the status endpoint due to formatting issues
+            pass
 
-            try:
-                for _user, t_data in (data.get('targets') or {}).items():
-                    if not isinstance(t_data, dict):
-                        continue
-                    last_ts = t_data.get('last_checked_ts')
-                    next_ts = t_data.get('next_check_ts')
-                    if isinstance(last_ts, (int, float)) and last_ts > 0:
-                        t_data['last_checked'] = get_squeezed_date_from_ts(last_ts, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
-                    # Only format next_check from ts when it is in the future, otherwise keep the label (e.g. "In Progress")
-                    if isinstance(next_ts, (int, float)) and next_ts > now_ts:
-                        t_data['next_check'] = get_squeezed_date_from_ts(next_ts, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
-            except Exception:
-                # Keep output best-effort; don't break dashboard on edge cases
-                pass
+        try:
+            for _user, t_data in (data.get('targets') or {}).items():
+                if not isinstance(t_data, dict):
+                    continue
+                # Snapshots are shared between requests, so the labels go into a per-request copy
+                t_data = data['targets'][_user] = dict(t_data)
+                last_ts = t_data.get('last_checked_ts')
+                next_ts = t_data.get('next_check_ts')
+                if isinstance(last_ts, (int, float)) and last_ts > 0:
+                    t_data['last_checked'] = get_squeezed_date_from_ts(last_ts, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
+                # Only format next_check from ts when it is in the future, otherwise keep the label (e.g. "In Progress")
+                if isinstance(next_ts, (int, float)) and next_ts > now_ts:
+                    t_data['next_check'] = get_squeezed_date_from_ts(next_ts, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
+        except Exception:
+            # Keep output best-effort; don't break dashboard on edge cases
+            pass
 
-            # Substitute values but preserve real username keys; add display_name for UI
-            if 'targets' in data:
-                raw_targets = data.pop('targets')  # remove before substituting data
-                data = apply_privacy_substitutions(data)  # substitute everything else
-                substituted_targets = {}
-                for username, t_data in raw_targets.items():
-                    if isinstance(t_data, dict):
-                        substituted_t_data = apply_privacy_substitutions(t_data)
-                        substituted_t_data['display_name'] = apply_privacy_substitutions(username)
-                    else:
-                        # Non-dict target payload: pass through unchanged, can't attach display_name
-                        substituted_t_data = t_data
-                    substituted_targets[username] = substituted_t_data
-                data['targets'] = substituted_targets
+        # Substitute values but preserve real username keys; add display_name for UI
+        if 'targets' in data:
+            raw_targets = data.pop('targets')  # remove before substituting data
+            removed_targets = data.pop('removed_targets', None)  # real usernames, like the targets keys
+            data = apply_privacy_substitutions(data)  # substitute everything else
+            if removed_targets is not None:
+                data['removed_targets'] = removed_targets
+            substituted_targets = {}
+            for username, t_data in raw_targets.items():
+                if isinstance(t_data, dict):
+                    substituted_t_data = apply_privacy_substitutions(t_data)
+                    substituted_t_data['display_name'] = apply_privacy_substitutions(username)
+                else:
+                    # Non-dict target payload: pass through unchanged, can't attach display_name
+                    substituted_t_data = t_data
+                substituted_targets[username] = substituted_t_data
+            data['targets'] = substituted_targets
+        else:
+            data = apply_privacy_substitutions(data)
+        return data
+
+    # Returns the full dashboard status, or with ?since=<version> only what changed after that change feed version
+    # ('delta' is true then, removed targets are listed in 'removed_targets'); 'version' is the version to ask for next
+    @app.route('/api/status')
+    def api_status():  # type: ignore
+        since = flask_request.args.get('since')  # type: ignore
+        try:
+            since = int(since) if since is not None else None
+        except (TypeError, ValueError):
+            since = None
+
+        if since is None:
+            version = WEB_DASHBOARD_CHANGES.version
+            data = build_web_dashboard_status()
+        else:
+            version, users, kinds = WEB_DASHBOARD_CHANGES.changes_since(since)
+            if users is None:
+                data = build_web_dashboard_status()
             else:
-                data = apply_privacy_substitutions(data)
-            return jsonify(data)  # type: ignore
+                data = build_web_dashboard_status(users, include_activities='activity' in kinds)
+                data['delta'] = True
+        data['version'] = version
+        return conditional_json_response(data, volatile_keys=('uptime',))
+
+    # Streams dashboard changes as Server-Sent Events: a full 'status' event first (or whenever the client must
+    # resync), then 'delta' events with only the changed targets; every event carries the change feed version
+    # When idle, a global-only delta is sent every WEB_DASHBOARD_PUSH_IDLE_INTERVAL seconds (uptime, session, keepalive)
+    @app.route('/api/events')
+    def api_events():  # type: ignore
+        try:
+            since = int(flask_request.args.get('since', -1))  # type: ignore
+        except (TypeError, ValueError):
+            since = -1
+
+        def _event(name, payload):
+            return f"event: {name}\ndata: {flask_json.dumps(payload)}\n\n"  # type: ignore
+
+        def _stream():
+            version = since
+            yield "retry: 3000\n\n"
+            if version < 0:
+                version = WEB_DASHBOARD_CHANGES.version
+                payload = build_web_dashboard_status()
+                payload['version'] = version
+                yield _event('status', payload)
+            while True:
+                current, users, kinds = WEB_DASHBOARD_CHANGES.changes_since(version, timeout=WEB_DASHBOARD_PUSH_IDLE_INTERVAL)
+                if users is None:
+                    payload = build_web_dashboard_status()
+                    payload['version'] = current
+                    yield _event('status', payload)
+                else:
+                    payload = build_web_dashboard_status(users, include_activities='activity' in kinds)
+                    payload['version'] = current
+                    yield _event('delta', payload)
+                version = current
+
+        return FlaskResponse(stream_with_context(_stream()), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})  # type: ignore
 
     # Catch TemplateNotFound specifically to show friendly error
     if jinja2 is not None:
@@ -2062,6 +2341,7 @@ def create_web_dashboard_app():
             with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
                 if target in WEB_DASHBOARD_RECHECK_EVENTS:
                     WEB_DASHBOARD_RECHECK_EVENTS[target].set()
+                    CHECK_SCHEDULER.wake(target)
                     if CHECK_POSTS_IN_HOURS_RANGE:
                         msg = "Recheck triggered (will override hours range for the next cycle)"
                     else:
@@ -2136,10 +2416,35 @@ def create_web_dashboard_app():
                 removed = False
 
         if removed:
+            CHECK_TIMES_INDEX.remove(username)
+            WEB_DASHBOARD_SNAPSHOTS.discard(username)
+            STORY_POLLER.discard(username)
             log_activity(f"Removed target", user=username, level='warning')
             return jsonify({'success': True})  # type: ignore
         return jsonify({'success': False, 'error': 'Target not found'}), 404  # type: ignore
 
+    # Returns the target's follower and following lists as they were at ?at=<unix timestamp> (default: now),
+    # rebuilt from the saved snapshots; a list is null if it was not saved yet at that time
+    @app.route('/api/targets/<username>/follow-lists')
+    def api_target_follow_lists(username):  # type: ignore
+        username = username.strip().lower()
+        stores = FOLLOW_SNAPSHOT_STORES.get(username)
+        if not stores:
+            return jsonify({'success': False, 'error': 'No saved follower lists for this target'}), 404  # type: ignore
+        try:
+            at = int(flask_request.args.get('at', time.time()))  # type: ignore
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'Invalid timestamp'}), 400  # type: ignore
+
+        data = {'success': True, 'username': username, 'at': at}
+        for kind, store in stores.items():
+            try:
+                snapshot = store.snapshot_at(at)
+            except (OSError, ValueError) as e:
+                return jsonify({'success': False, 'error': f"Cannot read {kind} snapshots: {e}"}), 500  # type: ignore
+            data[kind] = {'count': snapshot[0], 'usernames': snapshot[1]} if snapshot else None
+        return jsonify(apply_privacy_substitutions(data))  # type: ignore
+
     @app.route('/api/monitoring/start', methods=['POST'])
     def api_start_monitoring():  # type: ignore
         data = flask_request.get_json(silent=True) or {}  # type: ignore
@@ -2358,8 +2663,7 @@ def create_web_dashboard_app():
                 print_cur_ts(newline=True)
             except Exception:
                 pass
-            SESSION_REFRESHED_EVENT.set()
-            SESSION_REFRESHED_EVENT.clear()
+            signal_session_refreshed()
 
         return True, changes, None, 200
 
@@ -2440,8 +2744,7 @@ def create_web_dashboard_app():
                 'dashboard_show_check_seconds': DASHBOARD_SHOW_CHECK_SECONDS,
             }
             data = apply_privacy_substitutions(data)
-            jsonify_func = cast(Callable[..., Any], jsonify)
-            return jsonify_func(data)
+            return conditional_json_response(data)
         elif flask_request.method == 'POST':  # type: ignore
             data = flask_request.get_json(silent=True) or {}  # type: ignore
             ok, changes, err, code = apply_settings_update(data)
@@ -2517,8 +2820,7 @@ def create_web_dashboard_app():
                 print(f"* {mode_msg}")
                 print_cur_ts(newline=True)
 
-                SESSION_REFRESHED_EVENT.set()
-                SESSION_REFRESHED_EVENT.clear()
+                signal_session_refreshed()
                 return jsonify({'success': True, 'message': f'Session set for {username}'})  # type: ignore
             return jsonify({'success': False, 'error': 'Username required'}), 400  # type: ignore
 
@@ -2566,8 +2868,7 @@ def create_web_dashboard_app():
         print(f"* {mode_msg}")
         print_cur_ts(newline=True)
 
-        SESSION_REFRESHED_EVENT.set()
-        SESSION_REFRESHED_EVENT.clear()
+        signal_session_refreshed()
         return jsonify({'success': True, 'username': username})  # type: ignore
 
     @app.route('/api/session/firefox/import', methods=['POST'])
@@ -2679,8 +2980,7 @@ def create_web_dashboard_app():
                     print(f"\n* {msg}")
                     print_cur_ts(newline=True)
 
-                    SESSION_REFRESHED_EVENT.set()
-                    SESSION_REFRESHED_EVENT.clear()
+                    signal_session_refreshed()
                     return jsonify({'success': True, 'username': test_username, 'message': 'Session refreshed'})  # type: ignore
                 else:
                     # Session file exists but is invalid, try to re-login if password available
@@ -2696,8 +2996,7 @@ def create_web_dashboard_app():
                         print(f"* {msg}")
                         print_cur_ts(newline=True)
 
-                        SESSION_REFRESHED_EVENT.set()
-                        SESSION_REFRESHED_EVENT.clear()
+                        signal_session_refreshed()
                         return jsonify({'success': True, 'username': SESSION_USERNAME, 'message': 'Session re-authenticated'})  # type: ignore
                     else:
                         return jsonify({'success': False, 'error': 'Session expired and no password available for re-login'})  # type: ignore
@@ -2712,8 +3011,7 @@ def create_web_dashboard_app():
                     log_activity(f"Session created and saved", user=SESSION_USERNAME, level='system')
                     print(f"* Session created and saved for: {SESSION_USERNAME}")
                     print_cur_ts(newline=True)
-                    SESSION_REFRESHED_EVENT.set()
-                    SESSION_REFRESHED_EVENT.clear()
+                    signal_session_refreshed()
                     return jsonify({'success': True, 'username': SESSION_USERNAME, 'message': 'Session created'})  # type: ignore
                 else:
                     return jsonify({'success': False, 'error': 'Session file not found and no password available'})  # type: ignore
@@ -2759,14 +3057,23 @@ def create_web_dashboard_app():
         print(f"* {mode_msg}")
         print_cur_ts(newline=True)
 
-        SESSION_REFRESHED_EVENT.set()
-        SESSION_REFRESHED_EVENT.clear()
+        signal_session_refreshed()
         return jsonify({'success': True, 'message': f'Session cleared for {username}', 'file_removed': removed_file})  # type: ignore
 
+    # Cursor-based activity reads: entries after the given seq, oldest first, optionally for one target only
+    # 'missed' tells the client that entries after its cursor were already dropped from the retained feed
+    @app.route('/api/activity')
+    def api_activity():  # type: ignore
+        after = flask_request.args.get('after', 0, type=int)  # type: ignore
+        user = (flask_request.args.get('user') or '').strip() or None  # type: ignore
+        limit = flask_request.args.get('limit', WEB_DASHBOARD_STATUS_ACTIVITIES, type=int)  # type: ignore
+        items, missed = WEB_DASHBOARD_ACTIVITY.after(max(after or 0, 0), user=user, limit=max(limit or 1, 1))
+        return jsonify({'items': items, 'last_seq': WEB_DASHBOARD_ACTIVITY.last_seq, 'missed': missed})  # type: ignore
+
     @app.route('/api/activity/clear', methods=['POST'])
     def api_clear_activity():  # type: ignore
-        with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
-            WEB_DASHBOARD_DATA['activities'] = []
+        WEB_DASHBOARD_ACTIVITY.clear()
+        WEB_DASHBOARD_CHANGES.publish('activity')
         return jsonify({'success': True})  # type: ignore
 
     @app.route('/api/test-email', methods=['POST'])
@@ -2776,7 +3083,7 @@ def create_web_dashboard_app():
         m_subject = "instagram_monitor: test email"
         m_body = "This is test email - your SMTP settings seems to be correct !"
         m_body_html = "This is <b>test email</b> - your SMTP settings seems to be <b>correct</b> !"
-        res = send_email(m_subject, m_body, m_body_html, SMTP_SSL, smtp_timeout=5)
+        res = send_email(m_subject, m_body, m_body_html, SMTP_SSL, smtp_timeout=5, immediate=True)
         if res == 0:
             print("* Email notification sent successfully")
             print_cur_ts(newline=True)
@@ -2795,7 +3102,7 @@ def create_web_dashboard_app():
         # Temporarily enable if we are testing
         old_webhook_enabled = WEBHOOK_ENABLED
         WEBHOOK_ENABLED = True
-        res = send_webhook("instagram_monitor: test webhook", "This is **test webhook** - your settings seems to be **correct** !", color=0x7289DA)
+        res = send_webhook("instagram_monitor: test webhook", "This is **test webhook** - your settings seems to be **correct** !", color=0x7289DA, immediate=True)
         WEBHOOK_ENABLED = old_webhook_enabled
 
         if res == 0:
@@ -2808,6 +3115,217 @@ def create_web_dashboard_app():
     return app
 
 
+# Central queue of next-check due times for all targets: a single dispatcher thread wakes each target when its check
+# is due and a check slot is free, so idle targets block on one event instead of polling every second
+class CheckScheduler(object):
+    # Upper bound for a single idle wait, so a stop/recheck signal set without wake() is still noticed eventually
+    IDLE_WAKE = 30
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []  # (due monotonic ts, seq, user), stale entries are skipped lazily
+        self._pending = {}  # user -> seq of its valid heap entry
+        self._active = set()  # users currently holding a check slot
+        self._events = {}  # user -> wake event
+        self._seq = 0
+        self._thread = None
+
+    def _event_for(self, user):
+        event = self._events.get(user)
+        if event is None:
+            event = threading.Event()
+            self._events[user] = event
+        return event
+
+    # Queues the user's next check in delay_s seconds and gives back the check slot held by its previous check
+    def schedule(self, user, delay_s):
+        with self._cond:
+            self._active.discard(user)
+            self._seq += 1
+            self._pending[user] = self._seq
+            heapq.heappush(self._heap, (time.monotonic() + max(0, delay_s), self._seq, user))
+            self._event_for(user).clear()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._dispatch_loop, daemon=True, name="check_scheduler")
+                self._thread.start()
+            self._cond.notify_all()
+
+    # Blocks up to timeout seconds, returns True once the scheduler dispatched the user's check
+    def wait_turn(self, user, timeout=None):
+        with self._cond:
+            event = self._event_for(user)
+        event.wait(self.IDLE_WAKE if timeout is None else timeout)
+        with self._cond:
+            event.clear()
+            return user in self._active and user not in self._pending
+
+    # Starts the user's check immediately (manual recheck), bypassing the queue and the concurrency limit
+    def run_now(self, user):
+        with self._cond:
+            self._pending.pop(user, None)
+            self._active.add(user)
+            self._cond.notify_all()
+
+    # Wakes the user's waiter early so it re-evaluates its stop and recheck events
+    def wake(self, user):
+        with self._cond:
+            self._event_for(user).set()
+
+    # Returns the users whose queued check is due within the given number of seconds
+    def due_within(self, seconds):
+        with self._cond:
+            horizon = time.monotonic() + seconds
+            return {user for due_ts, seq, user in self._heap if due_ts <= horizon and self._pending.get(user) == seq}
+
+    # Forgets the user entirely and frees its check slot
+    def release(self, user):
+        with self._cond:
+            self._pending.pop(user, None)
+            self._active.discard(user)
+            self._events.pop(user, None)
+            self._cond.notify_all()
+
+    def _dispatch_loop(self):
+        with self._cond:
+            while True:
+                while self._heap and self._pending.get(self._heap[0][2]) != self._heap[0][1]:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                due_ts, _seq, user = self._heap[0]
+                remaining = due_ts - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                limit = MULTI_TARGET_MAX_CONCURRENT_CHECKS
+                if limit and limit > 0 and len(self._active) >= limit:
+                    # Slots are released via notify; the timeout picks up a limit raised from the settings
+                    self._cond.wait(self.IDLE_WAKE)
+                    continue
+                heapq.heappop(self._heap)
+                del self._pending[user]
+                self._active.add(user)
+                self._event_for(user).set()
+
+
+CHECK_SCHEDULER = CheckScheduler()
+
+
+# Waits until the target's next check is due (and a check slot is free), returns 'due', 'recheck' or 'stop'
+def wait_for_next_check(user, delay_s, stop_event=None, bot=None) -> str:
+    CHECK_SCHEDULER.schedule(user, delay_s)
+    while True:
+        if stop_event is not None and stop_event.is_set():
+            CHECK_SCHEDULER.release(user)
+            return 'stop'
+
+        recheck_triggered = False
+        with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
+            recheck_event = WEB_DASHBOARD_RECHECK_EVENTS.get(user)
+            if recheck_event is not None and recheck_event.is_set():
+                recheck_event.clear()
+                recheck_triggered = True
+        if recheck_triggered:
+            CHECK_SCHEDULER.run_now(user)
+            return 'recheck'
+
+        # Check for proxy changes from web dashboard
+        if bot is not None:
+            refresh_proxy_if_needed(bot, user)
+
+        if CHECK_SCHEDULER.wait_turn(user):
+            return 'due'
+
+
+# One pending multi-user story request: the user ids it covers, the stories it returned (or its error)
+class _StoryBatch(object):
+    def __init__(self):
+        self.userids = set()
+        self.stories = {}  # user id -> Story
+        self.error = None
+        self.done = threading.Event()
+
+
+# Batches the story requests of all targets sharing a session into one multi-user reel request
+# The first target asking for stories waits STORY_BATCH_WINDOW seconds for others to join, then fetches for all of them
+# plus the targets whose check is due within STORY_BATCH_TTL seconds; every result is reused for STORY_BATCH_TTL seconds,
+# so a check's "has story" probe and its item listing share one request as well
+class StoryPoller(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._userids = {}  # session key -> {target: user id}
+        self._results = {}  # (session key, user id) -> (fetched at monotonic time, Story or None)
+        self._open = {}  # session key -> batch still collecting user ids
+
+    # Returns the target's current Story (None without stories), fetched in a batch with other targets
+    # With expected=True (the profile already reports a story) a cached "no story" result is not trusted
+    def story(self, bot, user, userid, expected=False):
+        key = getattr(bot.context, 'username', None)
+        with self._lock:
+            self._userids.setdefault(key, {})[user] = userid
+            cached = self._results.get((key, userid))
+            if cached is not None and time.monotonic() - cached[0] < STORY_BATCH_TTL and (cached[1] is not None or not expected):
+                return cached[1]
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = _StoryBatch()
+                self._open[key] = batch
+            batch.userids.add(userid)
+            others = len(self._userids[key]) > 1
+
+        if not leader:
+            batch.done.wait()
+        else:
+            try:
+                if others and STORY_BATCH_WINDOW > 0:
+                    time.sleep(STORY_BATCH_WINDOW)
+                with self._lock:
+                    del self._open[key]
+                    batch.userids.update(self._prefetch_userids(key))
+                try:
+                    for fetched in bot.get_stories(userids=sorted(batch.userids)):
+                        batch.stories[fetched.owner_id] = fetched
+                except Exception as e:
+                    batch.error = e
+                else:
+                    now = time.monotonic()
+                    with self._lock:
+                        for batch_userid in batch.userids:
+                            self._results[(key, batch_userid)] = (now, batch.stories.get(batch_userid))
+            finally:
+                batch.done.set()
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.stories.get(userid)
+
+    # Returns user ids of the session's other targets whose check is due before a fetched result would expire (lock held)
+    def _prefetch_userids(self, key):
+        if STORY_BATCH_TTL <= 0:
+            return set()
+        registered = self._userids.get(key, {})
+        due = CHECK_SCHEDULER.due_within(STORY_BATCH_TTL)
+        now = time.monotonic()
+        userids = set()
+        for user in due:
+            userid = registered.get(user)
+            cached = self._results.get((key, userid))
+            if userid is not None and (cached is None or now - cached[0] >= STORY_BATCH_TTL):
+                userids.add(userid)
+        return userids
+
+    # Forgets a target which is no longer monitored
+    def discard(self, user):
+        with self._lock:
+            for userids in self._userids.values():
+                userids.pop(user, None)
+
+
+STORY_POLLER = StoryPoller()
+
+
 # Starts monitoring for a specific target in standalone mode
 def start_monitoring_for_target(username, wait_event=None, signal_event=None, delay_s=0):
     global WEB_DASHBOARD_MONITOR_THREADS, WEB_DASHBOARD_STOP_EVENTS
@@ -2829,25 +3347,14 @@ def start_monitoring_for_target(username, wait_event=None, signal_event=None, de
 
             manual_recheck = False
 
-            if sleep_s > 0:
-                # Interruptible wait for staggering
-                sleep_remaining = sleep_s
-                while sleep_remaining > 0:
-                    if stop_evt and stop_evt.is_set():
-                        return
-                    if recheck_event.is_set():
-                        recheck_event.clear()
-                        print(f"* Staggered start interrupted for {user} by recheck request!")
-                        print_cur_ts(newline=True)
-                        manual_recheck = True
-                        break
-
-                    wait_chunk = min(1, sleep_remaining)
-                    if stop_evt:
-                        stop_evt.wait(wait_chunk)
-                    else:
-                        time.sleep(wait_chunk)
-                    sleep_remaining -= wait_chunk
+            # Interruptible wait for staggering, the scheduler also bounds how many targets load at once
+            wait_result = wait_for_next_check(user, sleep_s, stop_evt)
+            if wait_result == 'stop':
+                return
+            if wait_result == 'recheck':
+                print(f"* Staggered start interrupted for {user} by recheck request!")
+                print_cur_ts(newline=True)
+                manual_recheck = True
 
             log_activity(f"Started monitoring", user=user, level='system')
             update_ui_data(targets={user: {'status': 'Pending'}})
@@ -2880,6 +3387,8 @@ def start_monitoring_for_target(username, wait_event=None, signal_event=None, de
             if signal_evt:
                 signal_evt.set()
         finally:
+            CHECK_SCHEDULER.release(user)
+            INSTALOADER_POOL.release(user)
             with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
                 if user in WEB_DASHBOARD_RECHECK_EVENTS:
                     del WEB_DASHBOARD_RECHECK_EVENTS[user]
@@ -2896,6 +3405,7 @@ def stop_monitoring_for_target(username):
 
     if username in WEB_DASHBOARD_STOP_EVENTS:
         WEB_DASHBOARD_STOP_EVENTS[username].set()
+        CHECK_SCHEDULER.wake(username)
         if username in WEB_DASHBOARD_MONITOR_THREADS:
             log_activity(f"Stopping monitoring", user=username, level='warning')
         update_ui_data(targets={username: {'status': 'Stopped'}})
@@ -3041,6 +3551,7 @@ def recheck_all_targets():
                     with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
                         if target_user in WEB_DASHBOARD_RECHECK_EVENTS:
                             WEB_DASHBOARD_RECHECK_EVENTS[target_user].set()
+                            CHECK_SCHEDULER.wake(target_user)
                             log_activity("Recheck triggered", user=target_user)
                         else:
                             debug_print("Recheck event not found (might have finished or pending start)")
@@ -3098,6 +3609,96 @@ def start_web_dashboard_server():
     return True
 
 
+# Per-target history of recently fetched posts, reels and stories shown by both dashboards (newest first)
+# Each target keeps at most FETCHED_UPDATES_DEPTH updates, deduplicated through a set of (type, timestamp, url) keys
+# With FETCHED_UPDATES_PERSIST the history is saved to FETCHED_UPDATES_FILE after every new update and loaded on first use
+class FetchedUpdatesHistory(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = None  # user -> deque of (key, update), oldest first
+        self._keys = {}  # user -> set of keys held in its deque
+
+    # Returns the dedup key of an update
+    @staticmethod
+    def key(update):
+        return (str(update.get('type')), str(update.get('timestamp')), str(update.get('url')))
+
+    # Returns the history file path
+    @staticmethod
+    def path():
+        path = FETCHED_UPDATES_FILE or os.path.join(OUTPUT_DIR or ".", ".fetched_updates.json")
+        return os.path.abspath(os.path.expanduser(path))
+
+    # Loads the saved history on first use (lock held)
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not FETCHED_UPDATES_PERSIST:
+            return
+        try:
+            with open(self.path(), 'r', encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, dict):
+            return
+        for user, updates in saved.items():
+            if isinstance(updates, list):
+                for update in reversed(updates):
+                    if isinstance(update, dict):
+                        self._append(user, update)
+
+    # Adds an update unless its key is already held, dropping the oldest one beyond the depth; returns True if added
+    def _append(self, user, update):
+        entries = self._entries.setdefault(user, deque())  # type: ignore[union-attr]
+        keys = self._keys.setdefault(user, set())
+        key = self.key(update)
+        if key in keys:
+            return False
+        entries.append((key, update))
+        keys.add(key)
+        while len(entries) > max(FETCHED_UPDATES_DEPTH, 1):
+            keys.discard(entries.popleft()[0])
+        return True
+
+    # Writes the whole history atomically (lock held)
+    def _save(self):
+        path = self.path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {user: [update for _, update in reversed(entries)] for user, entries in self._entries.items() if entries}  # type: ignore[union-attr]
+        fd, tmp_path = tempfile.mkstemp(prefix=".fetched_updates.", suffix=".tmp", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'w', encoding="utf-8") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # Records a new update for a target and returns True unless it was already held
+    def add(self, user, update):
+        with self._lock:
+            self._load()
+            added = self._append(user, update)
+            if added and FETCHED_UPDATES_PERSIST:
+                try:
+                    self._save()
+                except OSError as e:
+                    debug_print(f"Could not save the recent updates history: {e}")
+            return added
+
+    # Returns the target's updates, newest first
+    def updates(self, user):
+        with self._lock:
+            self._load()
+            return [update for _, update in reversed(self._entries.get(user, ()))]  # type: ignore[union-attr]
+
+
+FETCHED_UPDATES_HISTORY = FetchedUpdatesHistory()
+
+
 # Updates the terminal dashboard data store
 def update_terminal_dashboard_data(targets=None, config=None, is_monitoring=None):
     with DASHBOARD_DATA_LOCK:  # type: ignore
@@ -3126,25 +3727,17 @@ def update_terminal_dashboard_data(targets=None, config=None, is_monitoring=None
                         DASHBOARD_DATA['targets'][user]['next_check_ts'] = preserved_next_check_ts
                 else:
                     DASHBOARD_DATA['targets'][user] = data
-        # Handle history list for fetched updates (terminal dashboard)
+        # Mirror the shared history of fetched updates (terminal dashboard), seeded from disk for new targets
         if targets is not None:
             for user, data in targets.items():
                 target_obj = DASHBOARD_DATA['targets'][user]
-                new_update = data.get('new_update')
+                if not isinstance(target_obj, dict):
+                    continue
+                new_update = data.get('new_update') if isinstance(data, dict) else None
                 if new_update:
-                    if 'fetched_updates' not in target_obj:
-                        target_obj['fetched_updates'] = []
-
-                    # Robust deduplication: Check unique combination of type + timestamp + url
-                    def get_key(update):
-                        return f"{update.get('type')}_{update.get('timestamp')}_{update.get('url')}"
-
-                    new_key = get_key(new_update)
-                    exists = any(get_key(u) == new_key for u in target_obj['fetched_updates'])
-
-                    if not exists:
-                        target_obj['fetched_updates'].insert(0, new_update)
-                        target_obj['fetched_updates'] = target_obj['fetched_updates'][:10]  # Keep last 10
+                    FETCHED_UPDATES_HISTORY.add(user, new_update)
+                if new_update or 'fetched_updates' not in target_obj:
+                    target_obj['fetched_updates'] = FETCHED_UPDATES_HISTORY.updates(user)
         if config is not None:
             if 'config' not in DASHBOARD_DATA:
                 DASHBOARD_DATA['config'] = {}
@@ -3157,6 +3750,199 @@ def update_terminal_dashboard_data(targets=None, config=None, is_monitoring=None
         DASHBOARD_DATA['dashboard_mode'] = DASHBOARD_MODE
 
 
+# Version counter and bounded change log behind the Web Dashboard push channel (/api/events)
+# Producers record which target (or 'activity' / 'global' part) changed, stream clients wait for versions newer than theirs
+class DashboardChangeFeed(object):
+    MAX_BACKLOG = 1000
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.version = 0
+        self._changes = deque(maxlen=self.MAX_BACKLOG)  # (version, kind, user)
+        self._user_versions = {}  # user -> version of the latest change for that user
+
+    # Records a change and wakes waiting stream clients
+    def publish(self, kind, user=None):
+        with self._cond:
+            self.version += 1
+            self._changes.append((self.version, kind, user))
+            if user:
+                self._user_versions[user] = self.version
+            self._cond.notify_all()
+
+    # Returns the version of the latest change published for a user (0 if none)
+    def user_version(self, user):
+        return self._user_versions.get(user, 0)
+
+    # Waits up to timeout for changes after version and returns (current version, changed users, changed kinds)
+    # Users and kinds are None when the client is too far behind (or ahead after a restart) and must resync
+    def changes_since(self, version, timeout=None):
+        with self._cond:
+            if self.version == version and timeout:
+                self._cond.wait(timeout)
+            current = self.version
+            if current == version:
+                return current, set(), set()
+            oldest = self._changes[0][0] if self._changes else current + 1
+            if version > current or oldest > version + 1:
+                return current, None, None
+            users = set()
+            kinds = set()
+            for change_version, kind, user in reversed(self._changes):
+                if change_version <= version:
+                    break
+                kinds.add(kind)
+                if user:
+                    users.add(user)
+            return current, users, kinds
+
+
+WEB_DASHBOARD_CHANGES = DashboardChangeFeed()
+
+
+# Copy-on-write snapshots of WEB_DASHBOARD_DATA['targets'] entries for dashboard readers
+# Writers take a fresh snapshot of a target right after changing it, readers only pick up the current references, so
+# /api/status no longer deep-copies every target while holding WEB_DASHBOARD_DATA_LOCK. Snapshots must not be modified
+# A snapshot is tied to its target's change feed version and to the dict it was taken from, so a target which was
+# changed without a new snapshot (or replaced outright) is copied again on the next read
+class TargetSnapshots(object):
+    def __init__(self):
+        self._entries = {}  # user -> (change feed version, source dict, snapshot)
+
+    # Returns the current snapshot of a target, copying it only when it changed; call with WEB_DASHBOARD_DATA_LOCK held
+    def get(self, user, source):
+        version = WEB_DASHBOARD_CHANGES.user_version(user)
+        entry = self._entries.get(user)
+        if entry is not None and entry[0] == version and entry[1] is source:
+            return entry[2]
+        snapshot = copy.deepcopy(source)
+        self._entries[user] = (version, source, snapshot)
+        return snapshot
+
+    # Drops the snapshot of a removed target
+    def discard(self, user):
+        self._entries.pop(user, None)
+
+
+WEB_DASHBOARD_SNAPSHOTS = TargetSnapshots()
+
+
+# Fixed-capacity ring buffer of activity log entries, each tagged with a monotonically increasing sequence id
+# Appends overwrite the oldest slot instead of inserting at the front and re-slicing, and readers page through the
+# retained entries with a cursor (after=<seq>), optionally limited to one target through its per-user index
+class ActivityFeed(object):
+    def __init__(self, capacity):
+        self._lock = threading.Lock()
+        self.capacity = max(int(capacity), 1)
+        self._slots = [None] * self.capacity  # slot seq % capacity -> (seq, user, item)
+        self.last_seq = 0
+        self._first_seq = 1  # oldest retained seq
+        self._by_user = {}  # user -> deque of retained seqs
+
+    # Appends an entry and returns its sequence id
+    def append(self, item, user=None):
+        with self._lock:
+            self.last_seq += 1
+            seq = self.last_seq
+            if seq - self._first_seq >= self.capacity:
+                self._evict_oldest()
+            self._slots[seq % self.capacity] = (seq, user, item)
+            if user:
+                self._by_user.setdefault(user, deque()).append(seq)
+            return seq
+
+    # Appends several entries under one lock acquisition and returns the last sequence id
+    def extend(self, items, user=None):
+        with self._lock:
+            for item in items:
+                self.last_seq += 1
+                seq = self.last_seq
+                if seq - self._first_seq >= self.capacity:
+                    self._evict_oldest()
+                self._slots[seq % self.capacity] = (seq, user, item)
+                if user:
+                    self._by_user.setdefault(user, deque()).append(seq)
+            return self.last_seq
+
+    # Drops the oldest entry, which is also the oldest one in its user's index; call with the lock held
+    def _evict_oldest(self):
+        entry = self._slots[self._first_seq % self.capacity]
+        self._first_seq += 1
+        if entry is None or not entry[1]:
+            return
+        seqs = self._by_user.get(entry[1])
+        if seqs and seqs[0] == entry[0]:
+            seqs.popleft()
+            if not seqs:
+                del self._by_user[entry[1]]
+
+    # Returns the entry for a retained seq as a new dict carrying its seq and user; call with the lock held
+    def _entry(self, seq):
+        _, user, item = self._slots[seq % self.capacity]  # type: ignore[misc]
+        entry = dict(item)
+        entry['seq'] = seq
+        if user:
+            entry['user'] = user
+        return entry
+
+    # Returns up to limit of the newest entries, newest first
+    def latest(self, limit=None):
+        with self._lock:
+            count = self.last_seq - self._first_seq + 1
+            if limit is not None:
+                count = min(count, limit)
+            return [self._entry(seq) for seq in range(self.last_seq, self.last_seq - count, -1)]
+
+    # Returns (entries after the given seq oldest first, whether older unseen entries were already overwritten)
+    def after(self, seq=0, user=None, limit=None):
+        with self._lock:
+            missed = seq + 1 < self._first_seq and self.last_seq >= self._first_seq
+            if user:
+                seqs = self._by_user.get(user, ())
+                start = bisect.bisect_right(seqs, seq)  # type: ignore[arg-type]
+                selected = [seqs[i] for i in range(start, len(seqs) if limit is None else min(len(seqs), start + limit))]
+            else:
+                first = max(seq + 1, self._first_seq)
+                last = self.last_seq if limit is None else min(self.last_seq, first + limit - 1)
+                selected = range(first, last + 1)
+            return [self._entry(s) for s in selected], missed
+
+    # Drops all entries; sequence ids keep counting so existing cursors stay valid
+    def clear(self):
+        with self._lock:
+            self._slots = [None] * self.capacity
+            self._first_seq = self.last_seq + 1
+            self._by_user = {}
+
+    # Changes the capacity, keeping the newest entries that still fit
+    def resize(self, capacity):
+        capacity = max(int(capacity), 1)
+        with self._lock:
+            if capacity == self.capacity:
+                return
+            first = max(self._first_seq, self.last_seq - capacity + 1)
+            entries = [self._slots[seq % self.capacity] for seq in range(first, self.last_seq + 1)]
+            self.capacity = capacity
+            self._slots = [None] * capacity
+            self._first_seq = first
+            self._by_user = {}
+            for entry in entries:
+                self._slots[entry[0] % capacity] = entry  # type: ignore[index]
+                if entry[1]:  # type: ignore[index]
+                    self._by_user.setdefault(entry[1], deque()).append(entry[0])  # type: ignore[index]
+
+    def __len__(self):
+        with self._lock:
+            return self.last_seq - self._first_seq + 1
+
+
+# The terminal dashboard shows only the newest few entries; the web feed keeps WEB_DASHBOARD_ACTIVITY_RETENTION of them
+# for /api/activity, and /api/status carries the newest WEB_DASHBOARD_STATUS_ACTIVITIES
+DASHBOARD_ACTIVITY = ActivityFeed(50)
+WEB_DASHBOARD_ACTIVITY = ActivityFeed(WEB_DASHBOARD_ACTIVITY_RETENTION)
+WEB_DASHBOARD_STATUS_ACTIVITIES = 100
+
+
 # Updates both the terminal and web dashboard data stores and triggers a UI update
 def update_ui_data(targets=None, config=None, check_count=None, last_check=None, next_check=None, is_monitoring=None):
     global DEBUG_MODE, DASHBOARD_ENABLED, WEB_DASHBOARD_ENABLED
@@ -3241,71 +4027,61 @@ def update_web_dashboard_data(targets=None, config=None, check_count=None, last_
             WEB_DASHBOARD_DATA['is_monitoring'] = is_monitoring
         WEB_DASHBOARD_DATA['dashboard_mode'] = DASHBOARD_MODE
 
-        # Handle history list for fetched updates
+        if targets is not None:
+            for user in targets:
+                WEB_DASHBOARD_CHANGES.publish('target', user)
+        if config is not None or check_count is not None or last_check is not None or next_check is not None or is_monitoring is not None:
+            WEB_DASHBOARD_CHANGES.publish('global')
+
+        # Mirror the shared history of fetched updates, seeded from disk for new targets
+        # Dedup uses the type + timestamp + url key, so different events with the same URL (rare) are all kept
         if targets is not None:
             for user, data in targets.items():
                 target_obj = WEB_DASHBOARD_DATA['targets'][user]
-                new_update = data.get('new_update')
+                if not isinstance(target_obj, dict):
+                    continue
+                new_update = data.get('new_update') if isinstance(data, dict) else None
+                if new_update:
+                    FETCHED_UPDATES_HISTORY.add(user, new_update)
+                if new_update or 'fetched_updates' not in target_obj:
+                    target_obj['fetched_updates'] = FETCHED_UPDATES_HISTORY.updates(user)
                 if new_update:
-                    if 'fetched_updates' not in target_obj:
-                        target_obj['fetched_updates'] = []
-
-                    # Robust deduplication: Check unique combination of type + timestamp + url
-                    # Using timestamp ensures we don't miss different events with potentially same URL (rare)
-                    # or same event with different URL signature
-                    def get_key(update):
-                        return f"{update.get('type')}_{update.get('timestamp')}_{update.get('url')}"
-
-                    new_key = get_key(new_update)
-                    exists = any(get_key(u) == new_key for u in target_obj['fetched_updates'])
-
-                    if not exists:
-                        target_obj['fetched_updates'].insert(0, new_update)
-                        target_obj['fetched_updates'] = target_obj['fetched_updates'][:10]  # Keep last 10
                     # Set the latest for backward compatibility
                     target_obj['last_post'] = new_update if not str(new_update.get('type', '')).startswith('Story') else target_obj.get('last_post')
                     target_obj['last_story'] = new_update if str(new_update.get('type', '')).startswith('Story') else target_obj.get('last_story')
 
+        # Publish the new state of every changed target for dashboard readers
+        if targets is not None:
+            for user in targets:
+                WEB_DASHBOARD_SNAPSHOTS.get(user, WEB_DASHBOARD_DATA['targets'][user])
+
 
 # Logs an activity to both Dashboard and Web Dashboard activity feeds
 def log_activity(message, user=None, level='system', details=None, to_web=True):
-    global DASHBOARD_DATA, WEB_DASHBOARD_DATA
+    log_activities([message], user=user, level=level, details=[details], to_web=to_web)
+
+
+# Logs several activities of one user at once, taking each feed lock and refreshing the dashboards only once
+def log_activities(messages, user=None, level='system', details=None, to_web=True):
+    if not messages:
+        return
 
     timestamp_full = datetime.now()
     timestamp_str = get_hour_min_from_ts(timestamp_full, show_seconds=True)
+    if details is None:
+        details = [None] * len(messages)
 
-    # Format message with user if provided
-    display_message = f"[{user}] {message}" if user else message
-    display_message = apply_privacy_substitutions(display_message)
-
-    activity_item_rich = {
-        'time': timestamp_str,
-        'message': display_message,
-        'dt': timestamp_full,
-        'level': level,
-        'details': details
-    }
+    # Format messages with user if provided
+    display_messages = [apply_privacy_substitutions(f"[{user}] {message}" if user else message) for message in messages]
 
-    # Update Dashboard data
-    if 'activities' not in DASHBOARD_DATA:
-        DASHBOARD_DATA['activities'] = []
-    DASHBOARD_DATA['activities'].insert(0, activity_item_rich)
-    DASHBOARD_DATA['activities'] = DASHBOARD_DATA['activities'][:50]  # Last 50 for Rich
+    # Update Dashboard data (both feeds are thread-safe ring buffers)
+    DASHBOARD_ACTIVITY.extend([{'time': timestamp_str, 'message': display_message, 'dt': timestamp_full, 'level': level, 'details': item_details} for display_message, item_details in zip(display_messages, details)], user)
 
-    # Update Web Dashboard data (thread-safe)
+    # Update Web Dashboard data
     if to_web:
-        activity_item_web = {
-            'time': timestamp_str,
-            'message': display_message,
-            'level': level,
-            'details': details
-        }
-        if WEB_DASHBOARD_DATA_LOCK:
-            with WEB_DASHBOARD_DATA_LOCK:  # type: ignore[union-attr]
-                if 'activities' not in WEB_DASHBOARD_DATA:
-                    WEB_DASHBOARD_DATA['activities'] = []
-                WEB_DASHBOARD_DATA['activities'].insert(0, activity_item_web)
-                WEB_DASHBOARD_DATA['activities'] = WEB_DASHBOARD_DATA['activities'][:100]  # Last 100 for Web
+        WEB_DASHBOARD_ACTIVITY.extend([{'time': timestamp_str, 'message': display_message, 'level': level, 'details': item_details} for display_message, item_details in zip(display_messages, details)], user)
+        # Target add / remove routes log an activity right after changing the target list, so the user is sent too
+        WEB_DASHBOARD_CHANGES.publish('activity', user)
 
     # If Dashboard is live, trigger an update
     if DASHBOARD_ENABLED and RICH_AVAILABLE:
@@ -3429,7 +4205,7 @@ _OFFLINE_WORD_RE = re.compile(r"(\b(?:offline|No)\b)", re.IGNORECASE)
 _BOOLEAN_TRUE_RE = re.compile(r"\bTrue\b|\bEnabled\b")
 _BOOLEAN_FALSE_RE = re.compile(r"\bFalse\b|\bDisabled\b")
 _STORY_URL_RE = re.compile(r"(https?://\S+)")
-_QUOTED_CONTENT_RE = re.compile(r"(['\"])((?![^'\"]*[._/])[^'\"]+)\1")
+_QUOTED_CONTENT_RE = re.compile(r"(?P<quote>['\"])((?![^'\"]*[._/])[^'\"]+)(?P=quote)")
 _STATUS_CHANGE_RE = re.compile(r"^(.*? changed (?:status|mode|bio|followers|followings|profile picture) from\s+)(.+?)(\s+to\s+)(.+?)(.*)$")
 _ACTIVITY_HEADER_RE = re.compile(r"(?i).*(story for user|Newest post|Followers number changed|Followings number changed|Bio changed for|New post for user|number changed|number of|Followings changed|Followers changed|name changed to|has changed for user|has been updated for user|changed profile picture|removed profile picture|set profile picture|update date changed|has new story item|has\s+\d+\s+story\s+items?|story items:|disappeared)(er|ing)?s?.*", re.IGNORECASE)
 _CHECK_INTERVAL_RE = re.compile(r"^(\s*\*?\s*Check interval:\s+)(.*?)(\s+\(.*?\)\s*)$")
@@ -3542,8 +4318,120 @@ def _apply_style_nested(line, style_name):
     return line
 
 
-# Applies colour rules to a single output line
+# Inline highlight rules in priority order: (regex, replacement)
+# They are compiled into one alternation, so a line is scanned once instead of once per rule; where two rules match at
+# the same position the earlier one wins, just like it did when each rule ran as its own re.sub pass
+def _count_style(mo):
+    return 'count_up' if int(mo.group(4)) >= int(mo.group(2)) else 'count_down'
+
+
+_INLINE_HIGHLIGHT_RULES = [
+    (_FROM_TO_COUNT_RE, lambda mo: f"{mo.group(1)}{colorize(_count_style(mo), mo.group(2))}{mo.group(3)}{colorize(_count_style(mo), mo.group(4))}"),
+    (_DIFF_COUNT_UP_RE, lambda mo: colorize("count_up", mo.group(0))),
+    (_DIFF_COUNT_DOWN_RE, lambda mo: colorize("count_down", mo.group(0))),
+    (_DURATION_RE, lambda mo: colorize("duration", mo.group(0))),
+    (_SHORT_RANGE_DATE_RE, lambda mo: colorize("date_range", mo.group(0))),
+    (_DATE_RANGE_RE, lambda mo: colorize("date_range", mo.group(0))),
+    (_HOUR_RANGE_RE, lambda mo: colorize("date_range", mo.group(0))),
+    (_LONG_DATE_RE, lambda mo: colorize("date", mo.group(0))),
+    (_TIME_ONLY_RE, lambda mo: colorize("date", mo.group(0))),
+    (_URL_RE, lambda mo: colorize("link", mo.group(0))),
+    (_QUOTED_CONTENT_RE, lambda mo: f"{mo.group(1)}{colorize('username', mo.group(2))}{mo.group(1)}"),
+    (_BOOLEAN_TRUE_RE, lambda mo: colorize("boolean_true", mo.group(0))),
+    (_BOOLEAN_FALSE_RE, lambda mo: colorize("boolean_false", mo.group(0))),
+    (_ONLINE_WORD_RE, lambda mo: colorize("status_online", mo.group(0))),
+    (_OFFLINE_WORD_RE, lambda mo: colorize("status_offline", mo.group(0))),
+    (_PROXY_IP_RE, lambda mo: colorize('proxy_ip', mo.group(0))),
+    (_IP_ADDRESS_RE, lambda mo: colorize('ip_address', mo.group(0))),
+    (_ACCOUNT_LIMIT_RE, lambda mo: f"{colorize('count_up', mo.group(1))} {colorize('count_up', mo.group(2))}"),
+]
+
+_INLINE_HIGHLIGHT_RE = re.compile("|".join(f"(?P<rule{i}>{'(?i:' if rx.flags & re.IGNORECASE else '(?:'}{rx.pattern}))" for i, (rx, _) in enumerate(_INLINE_HIGHLIGHT_RULES)))
+
+
+# Replacement callback for _INLINE_HIGHLIGHT_RE, re-matches the winning rule so its replacement sees its own group numbers
+def _inline_highlight(mo):
+    rx, replace = _INLINE_HIGHLIGHT_RULES[int(mo.lastgroup[4:])]
+    rule_mo = rx.match(mo.string, mo.start())
+    if rule_mo is None or rule_mo.end() != mo.end():
+        return mo.group(0)
+    return replace(rule_mo)
+
+
+# Keyword -> category tables for the content type and block highlighting checks, each matched with a single regex
+_CONTENT_TYPE_KEYWORDS = {
+    "new post for": "post", "details for post": "post", "fetching posts for": "post",
+    "new reel for": "reel", "details for reel": "reel", "fetching reels for": "reel",
+    "new story items": "story", "new story for": "story", "details for story": "story", "fetching story for": "story",
+    "sending email": "email",
+    "sending webhook": "webhook",
+}
+_CONTENT_TYPE_PRIORITY = ["post", "reel", "story", "email", "webhook"]
+_CONTENT_TYPE_RE = re.compile("|".join(re.escape(k) for k in _CONTENT_TYPE_KEYWORDS))
+
+_BLOCK_KEYWORDS = {
+    "failure": "error", "forbidden": "error", "timeout": "error", "critical:": "error", "failed": "error",
+    "* error": "error_marker",
+    "* warning:": "warning", "caution:": "warning",
+    "* session login:": "info", "* mode:": "info", "session created": "info", "* info:": "info",
+}
+_BLOCK_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in _BLOCK_KEYWORDS))
+
+
+# Returns the set of categories whose keywords appear in the (lowercased) text
+def _keyword_categories(keyword_re, keywords, lowered):
+    return {keywords[mo.group(0)] for mo in keyword_re.finditer(lowered)}
+
+
+# Returns the highest priority content type whose keywords appear in the (lowercased) text
+def _first_keyword_category(keyword_re, keywords, lowered):
+    found = _keyword_categories(keyword_re, keywords, lowered)
+    for category in _CONTENT_TYPE_PRIORITY:
+        if category in found:
+            return category
+    return None
+
+
+# Recently colourised lines (separators, repeated status lines, list items) keyed by line, dropped when styles change
+_COLORIZE_CACHE_SIZE = 2048
+_COLORIZE_CACHE_MAX_LINE = 300
+_COLORIZE_CACHE = OrderedDict()
+_COLORIZE_CACHE_STATE = (None, False)  # (_COLOR_STYLES, COLOR_ENABLED) the cached lines were coloured with
+_COLORIZE_CACHE_LOCK = threading.Lock()
+
+
+# Returns True if the cache was filled with the current colour settings, init_color_output() always installs a new
+# styles dict so identity is enough to tell
+def _colorize_cache_current():
+    return _COLORIZE_CACHE_STATE[0] is _COLOR_STYLES and _COLORIZE_CACHE_STATE[1] == COLOR_ENABLED
+
+
+# Applies colour rules to a single output line, reusing the result for recently seen lines
 def _colorize_line(line):
+    global _COLORIZE_CACHE_STATE
+    if len(line) > _COLORIZE_CACHE_MAX_LINE:
+        return _colorize_line_uncached(line)
+
+    with _COLORIZE_CACHE_LOCK:
+        if not _colorize_cache_current():
+            _COLORIZE_CACHE.clear()
+            _COLORIZE_CACHE_STATE = (_COLOR_STYLES, COLOR_ENABLED)
+        cached = _COLORIZE_CACHE.get(line)
+        if cached is not None:
+            _COLORIZE_CACHE.move_to_end(line)
+            return cached
+
+    colored = _colorize_line_uncached(line)
+    with _COLORIZE_CACHE_LOCK:
+        if _colorize_cache_current():
+            _COLORIZE_CACHE[line] = colored
+            if len(_COLORIZE_CACHE) > _COLORIZE_CACHE_SIZE:
+                _COLORIZE_CACHE.popitem(last=False)
+    return colored
+
+
+# Applies colour rules to a single output line
+def _colorize_line_uncached(line):
     original = line
     lowered = line.lower()
 
@@ -3609,55 +4497,12 @@ def _colorize_line(line):
         return f"{pfx}{colorize_status(old_s)}{mid}{colorize_status(new_s)}{tail}"
 
     # Content types (using more specific keywords to avoid matching labels/counts)
-    if any(k in lowered for k in ("new post for", "details for post", "fetching posts for")):
-        line = colorize("post", line)
-    elif any(k in lowered for k in ("new reel for", "details for reel", "fetching reels for")):
-        line = colorize("reel", line)
-    elif any(k in lowered for k in ("new story items", "new story for", "details for story", "fetching story for")):
-        line = colorize("story", line)
-    elif "sending email" in lowered:
-        line = colorize("email", line)
-    elif "sending webhook" in lowered:
-        line = colorize("webhook", line)
-
-    # Highlight counters (from X to Y)
-    line = _FROM_TO_COUNT_RE.sub(lambda mo: f"{mo.group(1)}{colorize('count_up' if int(mo.group(4)) >= int(mo.group(2)) else 'count_down', mo.group(2))}{mo.group(3)}{colorize('count_up' if int(mo.group(4)) >= int(mo.group(2)) else 'count_down', mo.group(4))}", line)
-    line = _DIFF_COUNT_UP_RE.sub(lambda mo: colorize("count_up", mo.group(0)), line)
-    line = _DIFF_COUNT_DOWN_RE.sub(lambda mo: colorize("count_down", mo.group(0)), line)
-
-    # Highlight durations
-    line = _DURATION_RE.sub(lambda mo: colorize("duration", mo.group(0)), line)
-
-    # Highlight date ranges
-    line = _SHORT_RANGE_DATE_RE.sub(lambda mo: colorize("date_range", mo.group(0)), line)
-    line = _DATE_RANGE_RE.sub(lambda mo: colorize("date_range", mo.group(0)), line)
-    line = _HOUR_RANGE_RE.sub(lambda mo: colorize("date_range", mo.group(0)), line)
-
-    # Highlight long date strings
-    line = _LONG_DATE_RE.sub(lambda mo: colorize("date", mo.group(0)), line)
-    # Highlight time-only strings (e.g. ~21:07:39)
-    line = _TIME_ONLY_RE.sub(lambda mo: colorize("date", mo.group(0)), line)
-
-    # Highlight URLs / links
-    line = _URL_RE.sub(lambda mo: colorize("link", mo.group(0)), line)
-
-    # Highlight quoted content (captions etc.)
-    line = _QUOTED_CONTENT_RE.sub(lambda mo: f"{mo.group(1)}{colorize('username', mo.group(2))}{mo.group(1)}", line)
-
-    # Highlight boolean values
-    line = _BOOLEAN_TRUE_RE.sub(lambda mo: colorize("boolean_true", mo.group(0)), line)
-    line = _BOOLEAN_FALSE_RE.sub(lambda mo: colorize("boolean_false", mo.group(0)), line)
-
-    # Highlight online/offline keywords
-    line = _ONLINE_WORD_RE.sub(lambda mo: colorize("status_online", mo.group(0)), line)
-    line = _OFFLINE_WORD_RE.sub(lambda mo: colorize("status_offline", mo.group(0)), line)
-
-    # Highlight proxy information
-    line = _PROXY_IP_RE.sub(lambda mo: colorize('proxy_ip', mo.group(0)), line)
-    line = _IP_ADDRESS_RE.sub(lambda mo: colorize('ip_address', mo.group(0)), line)
-
-    # Highlight advanced fetch settings for follower/followee
-    line = _ACCOUNT_LIMIT_RE.sub(lambda mo: f"{colorize('count_up', mo.group(1))} {colorize('count_up', mo.group(2))}", line)
+    content_type = _first_keyword_category(_CONTENT_TYPE_RE, _CONTENT_TYPE_KEYWORDS, lowered)
+    if content_type:
+        line = colorize(content_type, line)
+
+    # Highlight counters, durations, dates, links, quoted content, booleans, online/offline keywords and IPs in one pass
+    line = _INLINE_HIGHLIGHT_RE.sub(_inline_highlight, line)
 
     # If it's a summary line, we return after internal highlights
     if is_summary_line:
@@ -3665,11 +4510,10 @@ def _colorize_line(line):
 
     # Block highlighting (activity headers, errors, warnings)
     # Applied last to ensure internal colors are preserved via nesting logic
-    is_error = any(w in lowered for w in ("failure", "forbidden", "timeout", "critical:", "failed")) or (
-        "* error" in lowered and "[errors =" not in lowered
-    )
-    is_warning = any(w in lowered for w in ("* warning:", "caution:")) and "[warnings =" not in lowered
-    is_info = any(k in lowered for k in ("* session login:", "* mode:", "session created", "* info:"))
+    block_keywords = _keyword_categories(_BLOCK_KEYWORD_RE, _BLOCK_KEYWORDS, lowered)
+    is_error = "error" in block_keywords or ("error_marker" in block_keywords and "[errors =" not in lowered)
+    is_warning = "warning" in block_keywords and "[warnings =" not in lowered
+    is_info = "info" in block_keywords
 
     if _ACTIVITY_HEADER_RE.match(line):
         line = _apply_style_nested(line, "status_change")
@@ -3704,20 +4548,28 @@ def apply_color_to_text(text):
 
 
 # Logger class to output messages to stdout and log files
+# Terminal output is written right away by the printing thread, log file output is queued and written in batches by a
+# background writer thread (see LOG_WRITE_INTERVAL), so monitoring threads do not serialize on file I/O
 class Logger(object):
     def __init__(self, main_filename=None):
         self.terminal = sys.stdout
         self.target_logs = {}  # target -> file_handle
         self.target_paths = {}  # target -> filename
         self.main_log = None
+        self._pending = deque()  # (target or None, message) waiting for the writer thread
+        self._pending_cond = threading.Condition(threading.Lock())
+        self._write_lock = threading.RLock()  # serializes writes to the log files
+        self._writer = None
         if main_filename:
             try:
-                self.main_log = open(main_filename, "a", buffering=1, encoding="utf-8")
+                self.main_log = open(main_filename, "a", encoding="utf-8")
             except Exception as e:
                 print(f"* Error: Could not open main log file '{main_filename}': {e}", file=sys.stderr)
+        # Whatever is still queued when the process exits must reach the log files
+        atexit.register(self.flush)
 
     def add_target_log(self, target, filename):
-        with STDOUT_LOCK:
+        with self._write_lock:
             self.target_paths[target] = filename
 
     def _ensure_log_open(self, target):
@@ -3730,7 +4582,7 @@ class Logger(object):
                 dirname = os.path.dirname(filename)
                 if dirname:
                     os.makedirs(dirname, exist_ok=True)
-                handle = open(filename, "a", buffering=1, encoding="utf-8")
+                handle = open(filename, "a", encoding="utf-8")
                 self.target_logs[target] = handle
                 return handle
             except Exception as e:
@@ -3744,13 +4596,79 @@ class Logger(object):
             return thread_name.split(':', 1)[1]
         return None
 
+    # Queues a privacy-substituted message for the log files of a target (None = common message for all target logs)
+    def _queue_log(self, target, message):
+        if LOG_WRITE_INTERVAL <= 0:
+            self._write_batch([(target, message)])
+            return
+        with self._pending_cond:
+            self._pending.append((target, message))
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="log_writer", daemon=True)
+                self._writer.start()
+            if len(self._pending) >= LOG_WRITE_BATCH_SIZE:
+                self._pending_cond.notify()
+
+    # Background writer: waits for queued messages, gives them LOG_WRITE_INTERVAL to accumulate, then writes the batch
+    def _writer_loop(self):
+        while True:
+            with self._pending_cond:
+                while not self._pending:
+                    self._pending_cond.wait()
+                if len(self._pending) < LOG_WRITE_BATCH_SIZE:
+                    self._pending_cond.wait(max(LOG_WRITE_INTERVAL, 0.01))
+            self._drain()
+
+    # Writes everything queued so far
+    def _drain(self):
+        with self._write_lock:
+            with self._pending_cond:
+                batch = list(self._pending)
+                self._pending.clear()
+            if batch:
+                self._write_batch(batch)
+
+    # Strips ANSI codes, writes the messages to the main and target logs and flushes each touched file once
+    def _write_batch(self, batch):
+        with self._write_lock:
+            touched = {}
+            try:
+                for target, message in batch:
+                    clean_message = ANSI_ESCAPE_RE.sub("", message).expandtabs(8)
+
+                    # Always log to main log if available
+                    if self.main_log:
+                        self.main_log.write(clean_message)
+                        touched[id(self.main_log)] = self.main_log
+
+                    if target:
+                        handles = [self._ensure_log_open(target)]
+                    else:
+                        # Common message (e.g. summary screen from MainThread): log to ALL target logs
+                        handles = [self._ensure_log_open(t) for t in list(self.target_paths.keys())]
+                    for handle in handles:
+                        if handle:
+                            handle.write(clean_message)
+                            touched[id(handle)] = handle
+            except Exception as e:
+                print(f"* Error: Could not write to log file: {e}", file=sys.__stderr__)
+            finally:
+                for handle in touched.values():
+                    try:
+                        handle.flush()
+                    except Exception:
+                        pass
+
     def write(self, message):
         global last_output
-        with STDOUT_LOCK:
-            # Apply color for terminal
-            message = apply_privacy_substitutions(message)
-            colorized_message = apply_color_to_text(message)
+        # Apply privacy substitutions and color for terminal outside the lock, they only read settings
+        # Colouring is skipped when the terminal will not get the line (dashboard or progress bar active) or when colours
+        # are off, e.g. because stdout is not a TTY; log files only ever get the plain message
+        message = apply_privacy_substitutions(message)
+        to_terminal = not (DASHBOARD_ENABLED and RICH_AVAILABLE) and getattr(_thread_local, 'pbar', None) is None and not pbar
+        colorized_message = apply_color_to_text(message) if to_terminal else message
 
+        with STDOUT_LOCK:
             if message != '\n':
                 last_output.append(message)
                 tid = _thread_key()
@@ -3762,66 +4680,31 @@ class Logger(object):
             if not (DASHBOARD_ENABLED and RICH_AVAILABLE):
                 # Suppress terminal writes only for the thread that currently owns a progress bar
                 if (getattr(_thread_local, 'pbar', None) is None) and not pbar:
+                    if not to_terminal:
+                        colorized_message = apply_color_to_text(message)
                     self.terminal.write(colorized_message)
                     self.terminal.flush()
 
-            # Expand tabs for file output and ensure ANSI codes are stripped
-            clean_message = ANSI_ESCAPE_RE.sub("", colorized_message).expandtabs(8)
-
-            # Always log to main log if available
-            if self.main_log:
-                self.main_log.write(clean_message)
-                self.main_log.flush()
-
-            target = self._get_current_target()
-            if target:
-                handle = self._ensure_log_open(target)
-                if handle:
-                    handle.write(clean_message)
-                    handle.flush()
-            else:
-                # Common message (e.g. summary screen from MainThread): log to ALL target logs
-                for t in list(self.target_paths.keys()):
-                    handle = self._ensure_log_open(t)
-                    if handle:
-                        handle.write(clean_message)
-                        handle.flush()
+        self._queue_log(self._get_current_target(), message)
 
     # Writes a message to the terminal only (honouring colour), bypassing all log files
     def terminal_only(self, message):
+        colorized_message = apply_color_to_text(apply_privacy_substitutions(message))
         with STDOUT_LOCK:
-            message = apply_privacy_substitutions(message)
-            colorized_message = apply_color_to_text(message)
             self.terminal.write(colorized_message)
             self.terminal.flush()
 
     # Writes a message to the log file(s) only (ANSI stripped), bypassing the terminal
     def log_only(self, message):
-        with STDOUT_LOCK:
-            message = apply_privacy_substitutions(message)
-            colorized_message = apply_color_to_text(message)
-            clean_message = ANSI_ESCAPE_RE.sub("", colorized_message).expandtabs(8)
-            if self.main_log:
-                self.main_log.write(clean_message)
-                self.main_log.flush()
-            target = self._get_current_target()
-            if target:
-                handle = self._ensure_log_open(target)
-                if handle:
-                    handle.write(clean_message)
-                    handle.flush()
-            else:
-                for t in list(self.target_paths.keys()):
-                    handle = self._ensure_log_open(t)
-                    if handle:
-                        handle.write(clean_message)
-                        handle.flush()
+        self._queue_log(self._get_current_target(), apply_privacy_substitutions(message))
 
+    # Writes queued log messages and flushes the terminal and all log files
     def flush(self):
         self.terminal.flush()
-        if self.main_log:
-            self.main_log.flush()
-        with STDOUT_LOCK:
+        self._drain()
+        with self._write_lock:
+            if self.main_log:
+                self.main_log.flush()
             for handle in self.target_logs.values():
                 handle.flush()
 
@@ -3868,6 +4751,15 @@ def signal_handler(sig, frame, message=None):
         for username in list(WEB_DASHBOARD_STOP_EVENTS.keys()):
             stop_monitoring_for_target(username)
 
+    # Give the notification outbox a moment to deliver what is ready, the rest stays saved for the next start
+    NOTIFICATION_OUTBOX_QUEUE.drain()
+
+    # Write out the queued log file lines now, os._exit() below skips the atexit flush
+    try:
+        sys.stdout.flush()
+    except Exception:
+        pass
+
     sys.stdout = stdout_bck
     if message is None:
         message = '* You pressed Ctrl+C, tool is terminated.'
@@ -4019,8 +4911,8 @@ def calculate_timespan(timestamp1, timestamp2, show_weeks=True, show_hours=True,
         return '0 seconds'
 
 
-# Sends email notification
-def send_email(subject, body, body_html, use_ssl, image_file="", image_name="image1", smtp_timeout=15):
+# Sends email notification, through the notification outbox unless NOTIFICATION_OUTBOX is off or immediate is set
+def send_email(subject, body, body_html, use_ssl, image_file="", image_name="image1", smtp_timeout=15, immediate=False):
     fqdn_re = re.compile(r'(?=^.{4,253}$)(^((?!-)[a-zA-Z0-9-]{1,63}(?<!-)\.)+[a-zA-Z]{2,63}\.?$)')
     email_re = re.compile(r'[^@]+@[^@]+\.[^@]+')
 
@@ -4059,45 +4951,63 @@ def send_email(subject, body, body_html, use_ssl, image_file="", image_name="ima
         print("Error sending email - SMTP settings are incorrect (body and body_html cannot be empty at the same time)")
         return 1
 
+    if NOTIFICATION_OUTBOX and not immediate:
+        NOTIFICATION_OUTBOX_QUEUE.put("email", {"subject": subject, "body": body, "body_html": body_html, "use_ssl": bool(use_ssl), "image_file": image_file or "", "image_name": image_name})
+        return 0
+
     try:
-        if use_ssl:
-            ssl_context = ssl.create_default_context()
-            smtpObj = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=smtp_timeout)
-            smtpObj.starttls(context=ssl_context)
-        else:
-            smtpObj = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=smtp_timeout)
-        smtpObj.login(SMTP_USER, SMTP_PASSWORD)
-        email_msg = MIMEMultipart('alternative')
-        email_msg["From"] = SENDER_EMAIL
-        email_msg["To"] = RECEIVER_EMAIL
-        email_msg["Subject"] = str(Header(subject, 'utf-8'))
-
-        if body:
-            part1 = MIMEText(body, 'plain')
-            part1 = MIMEText(body.encode('utf-8'), 'plain', _charset='utf-8')
-            email_msg.attach(part1)
-
-        if body_html:
-            part2 = MIMEText(body_html, 'html')
-            part2 = MIMEText(body_html.encode('utf-8'), 'html', _charset='utf-8')
-            email_msg.attach(part2)
-
-        if image_file:
-            with open(image_file, 'rb') as fp:
-                img_part = MIMEImage(fp.read())
-            img_part.add_header('Content-ID', f'<{image_name}>')
-            email_msg.attach(img_part)
-
-        smtpObj.sendmail(SENDER_EMAIL, RECEIVER_EMAIL, email_msg.as_string())
+        smtpObj = open_smtp_connection(use_ssl, smtp_timeout)
+        smtpObj.sendmail(SENDER_EMAIL, RECEIVER_EMAIL, build_email_message(subject, body, body_html, image_file, image_name).as_string())
         smtpObj.quit()
     except Exception as e:
-        print(f"Error sending email: {e}")
-        print(colorize("info", "To fix: verify SMTP_HOST, SMTP_PORT and SMTP_SSL plus SMTP_USER / SMTP_PASSWORD. For Gmail and similar providers use an app password, not your normal login password. Test with --send-test-email."))
-        print(f"Guide: {SMTP_GUIDE_URL}")
+        print_email_error(e)
         return 1
     return 0
 
 
+# Opens an SMTP connection (with STARTTLS if use_ssl) and logs in
+def open_smtp_connection(use_ssl, smtp_timeout=15):
+    if use_ssl:
+        ssl_context = ssl.create_default_context()
+        smtpObj = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=smtp_timeout)
+        smtpObj.starttls(context=ssl_context)
+    else:
+        smtpObj = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=smtp_timeout)
+    smtpObj.login(SMTP_USER, SMTP_PASSWORD)
+    return smtpObj
+
+
+# Builds the MIME message of an email notification, skipping an image file which no longer exists
+def build_email_message(subject, body, body_html, image_file="", image_name="image1"):
+    email_msg = MIMEMultipart('alternative')
+    email_msg["From"] = SENDER_EMAIL
+    email_msg["To"] = RECEIVER_EMAIL
+    email_msg["Subject"] = str(Header(subject, 'utf-8'))
+
+    if body:
+        part1 = MIMEText(body.encode('utf-8'), 'plain', _charset='utf-8')
+        email_msg.attach(part1)
+
+    if body_html:
+        part2 = MIMEText(body_html.encode('utf-8'), 'html', _charset='utf-8')
+        email_msg.attach(part2)
+
+    if image_file and os.path.isfile(image_file):
+        with open(image_file, 'rb') as fp:
+            img_part = MIMEImage(fp.read())
+        img_part.add_header('Content-ID', f'<{image_name}>')
+        email_msg.attach(img_part)
+
+    return email_msg
+
+
+# Prints an email delivery error with the usual hints
+def print_email_error(e):
+    print(f"Error sending email: {e}")
+    print(colorize("info", "To fix: verify SMTP_HOST, SMTP_PORT and SMTP_SSL plus SMTP_USER / SMTP_PASSWORD. For Gmail and similar providers use an app password, not your normal login password. Test with --send-test-email."))
+    print(f"Guide: {SMTP_GUIDE_URL}")
+
+
 # Validates webhook URL format
 def validate_webhook_url(url):
     if not url:
@@ -4158,6 +5068,193 @@ def show_follow_info(followers_reported: int, followers_actual: int, followings_
         debug_print(f"* Followers: reported ({followers_reported}) actual ({followers_actual}). Followings: reported ({followings_reported}) actual ({followings_actual})")
 
 
+# Keeps a follower / following list as a base JSON snapshot plus a delta history log
+# The base file keeps the [count, usernames] layout and is rewritten only on compaction, every other save appends
+# one small JSON line with the usernames added (prepended, newest first) and removed since the previous save
+# Each compaction starts a new history generation: the old base and its log are kept as archives of that generation
+# (<name>_base.<gen>.json and <name>_history.<gen>.jsonl), so the list can be rebuilt at any earlier point in time
+class FollowSnapshotStore(object):
+    def __init__(self, path):
+        self.path = path
+        self.history_path = os.path.splitext(path)[0] + "_history.jsonl"
+        self.count = None
+        self.usernames = []
+        self.ts = None
+        self.generation = 0
+        self.deltas_since_compaction = 0
+        self.has_history = False
+        self.loaded = False
+
+    # Returns the usernames list after applying one delta entry to the given list
+    @staticmethod
+    def _apply(usernames, entry):
+        if "full" in entry:
+            return list(entry["full"])
+        removed = set(entry.get("removed", []))
+        kept = [u for u in usernames if u not in removed] if removed else list(usernames)
+        return list(entry.get("added", [])) + kept
+
+    # Returns the (base snapshot, history log) archive paths of the given generation
+    def _archive_paths(self, generation):
+        stem = os.path.splitext(self.path)[0]
+        return f"{stem}_base.{generation}.json", f"{stem}_history.{generation}.jsonl"
+
+    # Yields (offset after the line, entry) for each complete history line of the given generation starting at the given offset
+    def _read_history(self, offset=0, generation=0, path=None):
+        path = path or self.history_path
+        if not os.path.isfile(path):
+            return
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                offset += len(line)
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                # Lines of another generation are already part of a base snapshot
+                if entry.get("gen", 0) == generation:
+                    yield offset, entry
+
+    # Appends entries to the history log, tagged with the current generation
+    def _append_history(self, entries):
+        os.makedirs(os.path.dirname(os.path.abspath(self.history_path)), exist_ok=True)
+        with open(self.history_path, 'a', encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(dict(entry, gen=self.generation), separators=(",", ":"), ensure_ascii=False) + "\n")
+
+    # Moves the history log to the archive of the given generation
+    def _archive_history(self, generation):
+        if os.path.isfile(self.history_path):
+            os.replace(self.history_path, self._archive_paths(generation)[1])
+
+    # Atomically rewrites the base snapshot with the current state under a new generation, then starts an empty log
+    # The previous base is archived before and its log after the rewrite, so a crash never loses either of them
+    def _write_base(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        previous_generation = self.generation
+        if os.path.isfile(self.path):
+            archive_path = self._archive_paths(previous_generation)[0]
+            shutil.copy2(self.path, f"{archive_path}.tmp")
+            os.replace(f"{archive_path}.tmp", archive_path)
+        self.generation += 1
+        meta = {"history_offset": 0, "generation": self.generation, "ts": self.ts}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding="utf-8") as f:
+            json.dump([self.count, self.usernames, meta], f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._archive_history(previous_generation)
+        with open(self.history_path, 'w', encoding="utf-8"):
+            pass
+
+    # Returns (count, usernames, meta) from the given base snapshot (the current one by default), None if there is none
+    def _read_base(self, path=None):
+        path = path or self.path
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'r', encoding="utf-8") as f:
+            data = json.load(f)
+        if not data:
+            return None
+        meta = data[2] if len(data) > 2 and isinstance(data[2], dict) else {}
+        meta["ts"] = meta.get("ts") or int(os.path.getmtime(path))
+        return data[0], list(data[1]), meta
+
+    # Loads the base snapshot and replays history written after it, returns [count, usernames] or None
+    def load(self):
+        self.loaded = True
+        base = self._read_base()
+        if base is None:
+            return None
+        self.count, self.usernames, meta = base
+        self.ts = meta["ts"]
+        self.generation = meta.get("generation", 0)
+        self.deltas_since_compaction = 0
+        self.has_history = "history_offset" in meta
+        if self.has_history:
+            # A log still holding an older generation was not archived because of a crash right after the base rewrite
+            if self.generation > 1 and next(self._read_history(0, self.generation), None) is None and next(self._read_history(0, self.generation - 1), None) is not None:
+                self._archive_history(self.generation - 1)
+            for _, entry in self._read_history(meta["history_offset"], self.generation):
+                self.usernames = self._apply(self.usernames, entry)
+                self.count = entry.get("count", self.count)
+                self.ts = entry.get("ts", self.ts)
+                self.deltas_since_compaction += 1
+        return [self.count, self.usernames]
+
+    # Saves a freshly fetched list, appending a delta or compacting into a new base snapshot
+    def save(self, count, usernames):
+        if not self.loaded:
+            try:
+                self.load()
+            except Exception:
+                self.count = None
+        usernames = list(usernames)
+        now_ts = int(time.time())
+        previous = self.usernames
+        has_base = self.count is not None and self.has_history and os.path.isfile(self.path)
+
+        entry = None
+        if has_base:
+            previous_set = set(previous)
+            current_set = set(usernames)
+            added = [u for u in usernames if u not in previous_set]
+            removed = [u for u in previous if u not in current_set]
+            entry = {"ts": now_ts, "count": count, "added": added, "removed": removed}
+            # A delta can only record prepends and removals, anything else (reordering) is stored in full
+            if self._apply(previous, entry) != usernames:
+                entry = None
+            elif not added and not removed and count == self.count:
+                return False
+
+        self.count = count
+        self.usernames = usernames
+        self.ts = now_ts
+
+        compact_every = FOLLOW_SNAPSHOT_COMPACT_EVERY
+        if entry is not None and (compact_every <= 0 or self.deltas_since_compaction + 1 < compact_every):
+            self._append_history([entry])
+            self.deltas_since_compaction += 1
+            return True
+
+        # First save, reordered list or compaction: archive the current generation and start a new one
+        self._write_base()
+        self.deltas_since_compaction = 0
+        self.has_history = True
+        return True
+
+    # Returns the local datetime of the last saved change
+    def last_modified(self):
+        return datetime.fromtimestamp(int(self.ts or os.path.getmtime(self.path)), pytz.timezone(LOCAL_TIMEZONE))
+
+    # Reconstructs [count, usernames] as it was at the given unix timestamp, None if it is older than the oldest snapshot
+    # Starts from the newest base taken at or before ts (walking back through the archived generations) and replays its log
+    def snapshot_at(self, ts):
+        base = self._read_base()
+        if base is None:
+            return None
+        generation = base[2].get("generation", 0)
+        history_path = self.history_path
+        while base[2]["ts"] > ts:
+            generation -= 1
+            if generation < 0:
+                return None
+            base_path, history_path = self._archive_paths(generation)
+            base = self._read_base(base_path)
+            if base is None:
+                return None
+        count, usernames, meta = base
+        state = [count, usernames]
+        if "history_offset" in meta:
+            for _, entry in self._read_history(meta["history_offset"], generation, history_path):
+                if entry.get("ts", 0) > ts:
+                    break
+                state = [entry.get("count", state[0]), self._apply(state[1], entry)]
+        return state
+
+
 # Compares follower or following lists, logs changes and returns formatted notification fragments
 def compare_and_log_follower_changes(user, change_type, old_list, new_list, csv_file_name):
     old_set, new_set = set(old_list), set(new_list)
@@ -4174,53 +5271,43 @@ def compare_and_log_follower_changes(user, change_type, old_list, new_list, csv_
             added.append(item)
             added_seen.add(item)
 
-    added_list = ""
-    removed_list = ""
-    added_list_html = ""
-    removed_list_html = ""
-    added_list_webhook = ""
-    removed_list_webhook = ""
-    added_mbody = ""
-    removed_mbody = ""
+    added_list = removed_list = added_list_html = removed_list_html = ""
+    added_list_webhook = removed_list_webhook = added_mbody = removed_mbody = ""
 
     if old_list != new_list:
         print()
+        kind = 'follower' if change_type == 'followers' else 'following'
 
+        # Each output format is rendered with a single join, and activity plus CSV rows go out as one batch per direction
         if removed:
-            print(f"Removed {change_type}:\n")
+            urls = [f"https://www.instagram.com/{item}/" for item in removed]
+            removed_list = "".join([f"- {item} [ {url} ]\n" for item, url in zip(removed, urls)])
+            removed_list_html = "".join([f"- {item} [ <a href=\"{url}\">{url}</a> ]\n" for item, url in zip(removed, urls)])
+            removed_list_webhook = "".join([f"- {escape_discord_markdown(item)} (<{url}>)\n" for item, url in zip(removed, urls)])
             removed_mbody = f"\nRemoved {change_type}:\n\n"
-            for item in removed:
-                url = f"https://www.instagram.com/{item}/"
-                print(f"- {item} [ {url} ]")
-                log_activity(f"Removed {'follower' if change_type == 'followers' else 'following'}: {item}",
-                             user=user, level='update', details={'url': url})
-                removed_list += f"- {item} [ {url} ]\n"
-                removed_list_html += f"- {item} [ <a href=\"{url}\">{url}</a> ]\n"
-                removed_list_webhook += f"- {escape_discord_markdown(item)} (<{url}>)\n"
-                try:
-                    if csv_file_name:
-                        write_csv_entry(csv_file_name, now_local_naive(), f"Removed {change_type.capitalize()}", item, "")
-                except Exception as e:
-                    print(f"* Error: {e}")
-            print()
+            print(f"Removed {change_type}:\n\n{removed_list}")
+            log_activities([f"Removed {kind}: {item}" for item in removed], user=user, level='update', details=[{'url': url} for url in urls])
+            try:
+                if csv_file_name:
+                    ts = now_local_naive()
+                    write_csv_entries(csv_file_name, [(ts, f"Removed {change_type.capitalize()}", item, "") for item in removed], target=user)
+            except Exception as e:
+                print(f"* Error: {e}")
 
         if added:
-            print(f"Added {change_type}:\n")
+            urls = [f"https://www.instagram.com/{item}/" for item in added]
+            added_list = "".join([f"- {item} [ {url} ]\n" for item, url in zip(added, urls)])
+            added_list_html = "".join([f"- {item} [ <a href=\"{url}\">{url}</a> ]\n" for item, url in zip(added, urls)])
+            added_list_webhook = "".join([f"- {escape_discord_markdown(item)} (<{url}>)\n" for item, url in zip(added, urls)])
             added_mbody = f"\nAdded {change_type}:\n\n"
-            for item in added:
-                url = f"https://www.instagram.com/{item}/"
-                print(f"- {item} [ {url} ]")
-                log_activity(f"Added {'follower' if change_type == 'followers' else 'following'}: {item}",
-                             user=user, level='update', details={'url': url})
-                added_list += f"- {item} [ {url} ]\n"
-                added_list_html += f"- {item} [ <a href=\"{url}\">{url}</a> ]\n"
-                added_list_webhook += f"- {escape_discord_markdown(item)} (<{url}>)\n"
-                try:
-                    if csv_file_name:
-                        write_csv_entry(csv_file_name, now_local_naive(), f"Added {change_type.capitalize()}", "", item)
-                except Exception as e:
-                    print(f"* Error: {e}")
-            print()
+            print(f"Added {change_type}:\n\n{added_list}")
+            log_activities([f"Added {kind}: {item}" for item in added], user=user, level='update', details=[{'url': url} for url in urls])
+            try:
+                if csv_file_name:
+                    ts = now_local_naive()
+                    write_csv_entries(csv_file_name, [(ts, f"Added {change_type.capitalize()}", "", item) for item in added], target=user)
+            except Exception as e:
+                print(f"* Error: {e}")
 
     return (added_list, removed_list, added_list_html, removed_list_html, added_list_webhook, removed_list_webhook, added_mbody, removed_mbody)
 
@@ -4368,7 +5455,7 @@ def build_webhook_headers(provider: str, payload: dict) -> dict[str, str]:
 
 
 # Sends one webhook notification through the selected provider
-def send_webhook(title, description, color=0x7289DA, fields=None, image_url=None, local_image_file=None, notification_type="status"):
+def send_webhook(title, description, color=0x7289DA, fields=None, image_url=None, local_image_file=None, notification_type="status", immediate=False):
     if not WEBHOOK_ENABLED or not WEBHOOK_URL:
         return 1
 
@@ -4440,11 +5527,35 @@ def send_webhook(title, description, color=0x7289DA, fields=None, image_url=None
                 print(f"* Transformation error on {field}.{method_name}: {e}")
 
     try:
-        final_headers = build_webhook_headers(provider, payload)
+        build_webhook_headers(provider, payload)
     except ValueError as e:
         print(f"* Webhook error: {e}")
         return 1
 
+    if NOTIFICATION_OUTBOX and not immediate:
+        NOTIFICATION_OUTBOX_QUEUE.put("webhook", {"provider": provider, "payload": payload, "image_url": webhook_image_url, "local_image_file": local_image_file or ""})
+        return 0
+
+    max_retries = 3
+    retry_delay = 2
+
+    for attempt in range(max_retries):
+        rc, retry = post_webhook(provider, payload, webhook_image_url, local_image_file)
+        if not retry or attempt == max_retries - 1:
+            return rc
+        time.sleep(retry_delay)
+
+    return 1
+
+
+# Posts a prepared webhook payload once; returns (0 or 1, whether a later retry may succeed)
+def post_webhook(provider, payload, webhook_image_url="", local_image_file=None):
+    try:
+        final_headers = build_webhook_headers(provider, payload)
+    except ValueError as e:
+        print(f"* Webhook error: {e}")
+        return 1, False
+
     if PROXY_ENABLED and PROXY_WEBHOOKS:
         final_post_proxy = get_proxies()
         final_post_proxy_ssl = get_proxies_ssl()
@@ -4452,56 +5563,276 @@ def send_webhook(title, description, color=0x7289DA, fields=None, image_url=None
         final_post_proxy = {}
         final_post_proxy_ssl = True
 
-    max_retries = 3
-    retry_delay = 2
+    try:
+        if provider == "ntfy":
+            ntfy_title, ntfy_message = build_ntfy_webhook_message(str(payload["title"]), str(payload["description"]), payload["fields"], webhook_image_url)
+            response = req.post(str(WEBHOOK_URL), headers=final_headers, data=ntfy_message.encode("utf-8"), params={"title": ntfy_title}, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
+        else:
+            final_payload = format_payload(WEBHOOK_TEMPLATE, payload)  # type: ignore
+            if local_image_file and os.path.isfile(local_image_file) and isinstance(final_payload, dict) and "embeds" in final_payload:
+                filename = os.path.basename(local_image_file)
+                try:
+                    final_payload["embeds"][0]["image"]["url"] = f"attachment://{filename}"  # type: ignore
+                except (KeyError, IndexError, TypeError):
+                    pass
+                with open(local_image_file, 'rb') as f:
+                    files = {
+                        "file": (filename, f, "image/jpeg"),
+                        "payload_json": (None, json.dumps(final_payload))
+                    }
+                    response = req.post(str(WEBHOOK_URL), headers=final_headers, files=files, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
+            elif isinstance(final_payload, str):
+                response = req.post(WEBHOOK_URL, headers=final_headers, data=final_payload, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
+            else:
+                response = req.post(WEBHOOK_URL, headers=final_headers, json=final_payload, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
+
+        if response.status_code in (200, 204):
+            print("* Webhook notification sent successfully")
+            return 0, False
+
+        print(f"* Webhook error: HTTP {response.status_code} - {response.text[:200]}")
+        if response.status_code != 429:
+            print(colorize("info", "To fix: check that WEBHOOK_PROVIDER matches the saved Discord or ntfy URL then test it with --send-test-webhook."))
+            print(f"Guide: {WEBHOOK_GUIDE_URL}")
+            return 1, False
+        return 1, True
+
+    except (req.exceptions.RequestException, req.exceptions.ConnectionError, req.exceptions.Timeout) as e:
+        print(f"* Error sending webhook: {e}")
+        return 1, True
+    except Exception as e:
+        print(f"* Unexpected error sending webhook: {e}")
+        return 1, False
+
+
+# Merges the messages of several queued emails into one digest email; returns (subject, body, body_html)
+def build_email_digest(messages):
+    subject = f"instagram_monitor: {len(messages)} notifications"
+    body = ("\n\n" + "-" * 40 + "\n\n").join(f"{m['subject']}\n\n{m['body']}" for m in messages)
+    body_html = "<hr>".join(f"<b>{escape(m['subject'])}</b><br><br>{m['body_html'] or escape(m['body']).replace(chr(10), '<br>')}" for m in messages)
+    return subject, body, body_html
+
+
+# Persistent queue of email and webhook notifications, delivered by one background sender thread
+# The queue is saved to the outbox file on every change; the sender keeps its SMTP connection logged in between
+# emails, merges emails waiting together into one digest and retries failed deliveries with exponential backoff
+class NotificationOutbox(object):
+    SMTP_IDLE_CLOSE = 120  # seconds an unused SMTP connection is kept open
+    RETRY_DELAY = 30
+    RETRY_DELAY_MAX = 3600
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._items = None  # queued notifications, oldest first
+        self._seq = 0
+        self._sending = 0  # notifications taken by the sender and not settled yet
+        self._draining = False
+        self._thread = None
+        self._smtp = None  # only used by the sender thread
+        self._smtp_key = None
+        self._smtp_used = 0.0
+
+    # Returns the outbox file path
+    @staticmethod
+    def path():
+        path = NOTIFICATION_OUTBOX_FILE or os.path.join(OUTPUT_DIR or ".", ".notification_outbox.json")
+        return os.path.abspath(os.path.expanduser(path))
+
+    # Loads the saved outbox on first use (lock held)
+    def _load(self):
+        if self._items is not None:
+            return
+        self._items = []
+        try:
+            with open(self.path(), 'r', encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(saved, list):
+            self._items = [item for item in saved if isinstance(item, dict) and item.get('kind') in ("email", "webhook") and isinstance(item.get('message'), dict)]
+        self._seq = max((int(item.get('id', 0)) for item in self._items), default=0)
 
-    for attempt in range(max_retries):
+    # Writes the whole outbox atomically (lock held)
+    def _save(self):
+        path = self.path()
         try:
-            if provider == "ntfy":
-                ntfy_title, ntfy_message = build_ntfy_webhook_message(str(payload["title"]), str(payload["description"]), payload["fields"], webhook_image_url)
-                response = req.post(str(WEBHOOK_URL), headers=final_headers, data=ntfy_message.encode("utf-8"), params={"title": ntfy_title}, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".notification_outbox.", suffix=".tmp", dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, 'w', encoding="utf-8") as f:
+                    json.dump(self._items, f, default=str)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except OSError as e:
+            debug_print(f"Could not save the notification outbox: {e}")
+
+    # Starts the sender thread unless it is running (lock held)
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            if self._thread is None:
+                atexit.register(self.drain)
+            self._thread = threading.Thread(target=self._run, daemon=True, name="notification_outbox")
+            self._thread.start()
+
+    # Queues a notification ("email" or "webhook" with the message fields its delivery needs)
+    def put(self, kind, message):
+        with self._cond:
+            self._load()
+            self._seq += 1
+            now = time.time()
+            self._items.append({'id': self._seq, 'kind': kind, 'message': message, 'queued': now, 'attempts': 0, 'next_try': now})  # type: ignore[union-attr]
+            self._save()
+            self._start()
+            self._cond.notify_all()
+
+    # Starts delivering notifications left in the outbox by a previous run
+    def resume(self):
+        with self._cond:
+            self._load()
+            if self._items:
+                self._start()
+
+    def __len__(self):
+        with self._cond:
+            self._load()
+            return len(self._items)  # type: ignore[arg-type]
+
+    # Returns the notifications ready to be sent and the time the next one gets ready (lock held)
+    # Emails on their first try are held for NOTIFICATION_DIGEST_INTERVAL, once one is ready all waiting emails go with it
+    def _due(self, now):
+        ready, waiting_emails, next_ts = [], [], None
+        release_emails = False
+        for item in self._items:  # type: ignore[union-attr]
+            if item['next_try'] > now:
+                next_ts = item['next_try'] if next_ts is None else min(next_ts, item['next_try'])
+            elif item['kind'] != "email":
+                ready.append(item)
             else:
-                final_payload = format_payload(WEBHOOK_TEMPLATE, payload)  # type: ignore
-                if local_image_file and os.path.isfile(local_image_file) and isinstance(final_payload, dict) and "embeds" in final_payload:
-                    filename = os.path.basename(local_image_file)
-                    try:
-                        final_payload["embeds"][0]["image"]["url"] = f"attachment://{filename}"  # type: ignore
-                    except (KeyError, IndexError, TypeError):
-                        pass
-                    with open(local_image_file, 'rb') as f:
-                        files = {
-                            "file": (filename, f, "image/jpeg"),
-                            "payload_json": (None, json.dumps(final_payload))
-                        }
-                        response = req.post(str(WEBHOOK_URL), headers=final_headers, files=files, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
-                elif isinstance(final_payload, str):
-                    response = req.post(WEBHOOK_URL, headers=final_headers, data=final_payload, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
+                waiting_emails.append(item)
+                hold_until = item['queued'] + NOTIFICATION_DIGEST_INTERVAL if item['attempts'] == 0 else 0
+                if hold_until <= now or self._draining:
+                    release_emails = True
                 else:
-                    response = req.post(WEBHOOK_URL, headers=final_headers, json=final_payload, timeout=10, verify=final_post_proxy_ssl, proxies=final_post_proxy)
-
-            if response.status_code in (200, 204):
-                print("* Webhook notification sent successfully")
-                return 0
-
-            print(f"* Webhook error: HTTP {response.status_code} - {response.text[:200]}")
-            if response.status_code != 429:
-                print(colorize("info", "To fix: check that WEBHOOK_PROVIDER matches the saved Discord or ntfy URL then test it with --send-test-webhook."))
-                print(f"Guide: {WEBHOOK_GUIDE_URL}")
-                return 1
-
-        except (req.exceptions.RequestException, req.exceptions.ConnectionError, req.exceptions.Timeout) as e:
-            if attempt < max_retries - 1:
-                debug_print(f"* Webhook attempt {attempt + 1} failed: {e}. Retrying in {retry_delay}s...")
-                time.sleep(retry_delay)
-                continue
+                    next_ts = hold_until if next_ts is None else min(next_ts, hold_until)
+        if release_emails:
+            ready.extend(waiting_emails)
+        return ready, next_ts
+
+    def _run(self):
+        while True:
+            self._close_idle_smtp()
+            with self._cond:
+                self._load()
+                now = time.time()
+                ready, next_ts = self._due(now)
+                if not ready:
+                    timeouts = [next_ts - now] if next_ts is not None else []
+                    if self._smtp is not None:
+                        timeouts.append(self.SMTP_IDLE_CLOSE)
+                    self._cond.wait(max(min(timeouts), 0.05) if timeouts else None)
+                    continue
+                self._sending = len(ready)
+            self._settle(ready, self._deliver(ready))
+
+    # Removes delivered notifications and schedules the retry of failed ones, dropping those out of attempts
+    def _settle(self, items, settled):
+        with self._cond:
+            done = set(settled)
+            for item in items:
+                if item['id'] in done:
+                    continue
+                item['attempts'] += 1
+                if item['attempts'] >= max(NOTIFICATION_RETRY_ATTEMPTS, 1):
+                    print(f"* Dropping {item['kind']} notification after {item['attempts']} failed attempts")
+                    done.add(item['id'])
+                else:
+                    item['next_try'] = time.time() + min(self.RETRY_DELAY * 2 ** (item['attempts'] - 1), self.RETRY_DELAY_MAX)
+            self._items = [item for item in self._items if item['id'] not in done]  # type: ignore[union-attr]
+            self._sending = 0
+            self._save()
+            self._cond.notify_all()
+
+    # Delivers the notifications and returns the ids of those which need no retry
+    def _deliver(self, items):
+        settled = set()
+        emails = []
+        for item in items:
+            message = item['message']
+            if item['kind'] == "webhook":
+                rc, retry = post_webhook(message.get('provider', ""), message.get('payload', {}), message.get('image_url', ""), message.get('local_image_file') or None)
+                if rc == 0 or not retry:
+                    settled.add(item['id'])
             else:
-                print(f"* Error sending webhook: {e}")
-                return 1
+                emails.append(item)
+        # Emails with an inline image go on their own, the others are merged into one digest
+        plain = [item for item in emails if not item['message'].get('image_file')]
+        groups = [[item] for item in emails if item['message'].get('image_file')]
+        groups += [plain] if len(plain) > 1 else [[item] for item in plain]
+        for group in groups:
+            message = group[0]['message']
+            if len(group) > 1:
+                subject, body, body_html = build_email_digest([item['message'] for item in group])
+                email_msg = build_email_message(subject, body, body_html)
+            else:
+                email_msg = build_email_message(message['subject'], message['body'], message['body_html'], message.get('image_file', ""), message.get('image_name', "image1"))
+            if self._send_email(message.get('use_ssl', True), email_msg):
+                settled.update(item['id'] for item in group)
+        return settled
+
+    # Sends a built email over the kept SMTP connection, reconnecting once if the server dropped it
+    def _send_email(self, use_ssl, email_msg):
+        key = (SMTP_HOST, SMTP_PORT, SMTP_USER, use_ssl)
+        reused = self._smtp is not None and self._smtp_key == key
+        try:
+            if not reused:
+                self._close_smtp()
+                self._smtp = open_smtp_connection(use_ssl)
+                self._smtp_key = key
+            self._smtp.sendmail(SENDER_EMAIL, RECEIVER_EMAIL, email_msg.as_string())  # type: ignore[union-attr]
         except Exception as e:
-            print(f"* Unexpected error sending webhook: {e}")
-            return 1
+            self._close_smtp()
+            if reused:
+                return self._send_email(use_ssl, email_msg)
+            print_email_error(e)
+            return False
+        self._smtp_used = time.monotonic()
+        return True
 
-    return 1
+    def _close_smtp(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+            self._smtp_key = None
+
+    def _close_idle_smtp(self):
+        if self._smtp is not None and time.monotonic() - self._smtp_used >= self.SMTP_IDLE_CLOSE:
+            self._close_smtp()
+
+    # Waits up to timeout seconds for the notifications ready now to be delivered (used at exit)
+    def drain(self, timeout=10):
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if self._items is None or self._thread is None or not self._thread.is_alive():
+                return
+            self._draining = True
+            self._cond.notify_all()
+            try:
+                while self._sending or self._due(time.time())[0]:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            finally:
+                self._draining = False
+
+
+NOTIFICATION_OUTBOX_QUEUE = NotificationOutbox()
 
 
 # Sleeps for the given seconds but returns True early if stop_event becomes set
@@ -4609,9 +5940,297 @@ def refresh_proxy_if_needed(bot, user):
                 log_activity(f"Proxy refresh failed: {error_msg}", user=user, level='error')
 
 
+# Sets the custom mobile user agent on Instaloader's iPhone API calls
+def apply_mobile_user_agent(bot) -> None:
+    ctx = bot.context
+    try:
+        for attr in ("iphone_headers", "_iphone_headers"):
+            if hasattr(ctx, attr):
+                getattr(ctx, attr)["User-Agent"] = USER_AGENT_MOBILE
+                return
+
+        if hasattr(ctx, 'get_iphone_json'):
+            orig_get_iphone_json = ctx.get_iphone_json
+
+            def _get_iphone_json(path, params, **kwargs):
+                if '_extra_headers' in kwargs:
+                    kwargs['_extra_headers']['User-Agent'] = USER_AGENT_MOBILE
+                else:
+                    kwargs['_extra_headers'] = {'User-Agent': USER_AGENT_MOBILE}
+                return orig_get_iphone_json(path, params, **kwargs)
+
+            ctx.get_iphone_json = _get_iphone_json
+        else:
+            print("* Warning: Could not apply custom mobile user-agent patch (missing header attributes or get_iphone_json method)!")
+            print("* Proceeding with the default Instaloader mobile user-agent")
+    except Exception as e:
+        print(f"* Warning: Could not apply custom mobile user-agent patch due to an unexpected error: {e}")
+        print("* Proceeding with the default Instaloader mobile user-agent")
+
+
+# Returns True if the bot's context is already logged in as the configured session user
+def bot_has_session(bot) -> bool:
+    ctx = bot.context
+    return bool(SESSION_USERNAME) and ctx.is_logged_in and ctx.username == SESSION_USERNAME
+
+
+# Pool of Instaloader instances keyed by (session user, proxy). Targets borrow one for the length of a check, so
+# all targets share a few cookie jars and keep-alive connection pools instead of building one Instaloader each
+class InstaloaderPool(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = {}  # key -> list of idle bots (last returned is reused first)
+        self._owners = {}  # owner -> borrowed bot
+        self._generation = 0  # bumped on every session refresh
+
+    @staticmethod
+    def current_key(skip_session=False):
+        session_user = SESSION_USERNAME if (SESSION_USERNAME and not skip_session) else ""
+        proxy = PROXY_URL if PROXY_ENABLED else ""
+        return (session_user, proxy)
+
+    def _new_bot(self, key, generation):
+        bot = instaloader.Instaloader(user_agent=USER_AGENT, iphone_support=True, quiet=True)
+        # Inject proxy and cert into Instaloader's session
+        if PROXY_ENABLED:
+            set_instaloader_proxies(bot)
+        apply_mobile_user_agent(bot)
+        # Best effort: a missing or broken session file is reported by the caller's own session handling
+        if key[0]:
+            try:
+                with SESSION_FILE_LOCK:
+                    bot.load_session_from_file(key[0])
+            except Exception as e:
+                debug_print(f"Pooled Instaloader instance created without session: {e}")
+        bot._im_pool_key = key
+        bot._im_pool_generation = generation
+        return bot
+
+    # Returns the bot borrowed by owner, reusing an idle pooled bot for the current key when possible
+    def acquire(self, owner, skip_session=False):
+        key = self.current_key(skip_session)
+        with self._lock:
+            bot = self._owners.get(owner)
+            if bot is not None:
+                return bot
+            # Settings changes leave bots for other keys unused, drop them so the pool stays small
+            for other_key in [k for k in self._idle if k != key]:
+                del self._idle[other_key]
+            idle = self._idle.get(key)
+            bot = idle.pop() if idle else None
+            generation = self._generation
+        if bot is None:
+            bot = self._new_bot(key, generation)
+        with self._lock:
+            self._owners[owner] = bot
+        return bot
+
+    # Returns owner's bot to the pool, reapplying a session refreshed while it was borrowed
+    def release(self, owner):
+        with self._lock:
+            bot = self._owners.pop(owner, None)
+            stale = bot is not None and bot._im_pool_generation != self._generation
+        if bot is None:
+            return
+        if stale and not self._refresh_bot(bot):
+            return
+        with self._lock:
+            self._idle.setdefault(bot._im_pool_key, []).append(bot)
+
+    # Loads the current session state into idle bots in place (keeping their connection pools), called on session changes
+    def refresh_sessions(self):
+        with self._lock:
+            self._generation += 1
+            bots = [b for idle in self._idle.values() for b in idle]
+            self._idle = {}
+        for bot in bots:
+            if self._refresh_bot(bot):
+                with self._lock:
+                    self._idle.setdefault(bot._im_pool_key, []).append(bot)
+
+    def _refresh_bot(self, bot) -> bool:
+        try:
+            with SESSION_FILE_LOCK:
+                if SKIP_SESSION or not SESSION_USERNAME:
+                    bot.context._session.cookies.clear()
+                    bot.context.username = None
+                else:
+                    bot.load_session_from_file(SESSION_USERNAME)
+                if PROXY_ENABLED:
+                    set_instaloader_proxies(bot)
+        except Exception as e:
+            debug_print(f"Dropping pooled Instaloader instance, session refresh failed: {e}")
+            return False
+        bot._im_pool_key = self.current_key(SKIP_SESSION)
+        bot._im_pool_generation = self._generation
+        return True
+
+
+INSTALOADER_POOL = InstaloaderPool()
+
+
+# Session user's own profile and a sample of its followees, shared by all targets using that session
+# Startup only needs the session username and BeHuman only needs one random followee, so the profile is loaded once
+# per session user and the followee sample is a bounded, lazily refreshed slice instead of the full followee list
+class OwnProfileCache(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._profiles = {}  # session username -> instaloader Profile
+        self._followees = {}  # session username -> (fetched at monotonic time, list of usernames)
+
+    # Returns the own profile for the bot's session, loading it on first use (or always with refresh=True)
+    def profile(self, ctx, refresh=False):
+        key = getattr(ctx, 'username', None)
+        with self._lock:
+            me = None if refresh else self._profiles.get(key)
+            if me is None:
+                me = instaloader.Profile.own_profile(ctx)
+                if key:
+                    self._profiles[key] = me
+            return me
+
+    # Returns up to OWN_FOLLOWEES_SAMPLE_SIZE followee usernames of the session user, refetched after the TTL
+    def followees_sample(self, ctx):
+        key = getattr(ctx, 'username', None)
+        with self._lock:
+            entry = self._followees.get(key)
+            if entry is not None and time.monotonic() - entry[0] < OWN_FOLLOWEES_SAMPLE_TTL:
+                return entry[1]
+        me = self.profile(ctx)
+        sample = [f.username for f in islice(me.get_followees(), max(OWN_FOLLOWEES_SAMPLE_SIZE, 1))]
+        with self._lock:
+            if key:
+                self._followees[key] = (time.monotonic(), sample)
+        return sample
+
+    # Forgets everything, e.g. after the session changed
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+            self._followees.clear()
+
+
+OWN_PROFILE_CACHE = OwnProfileCache()
+
+
+# Refreshes pooled Instaloader sessions and signals monitoring threads that the session or login mode has changed
+def signal_session_refreshed():
+    INSTALOADER_POOL.refresh_sessions()
+    OWN_PROFILE_CACHE.clear()
+    SESSION_REFRESHED_EVENT.set()
+    SESSION_REFRESHED_EVENT.clear()
+
+
 TPrivacyContent = TypeVar("TPrivacyContent")
 
 
+# Warns once about an invalid PRIVACY_SUBSTITUTIONS entry
+def _warn_invalid_privacy_substitution(message):
+    global PRIVACY_SUBSTITUTIONS_INVALID_WARNED
+    if not PRIVACY_SUBSTITUTIONS_INVALID_WARNED:
+        if sys.__stderr__ is not None:
+            sys.__stderr__.write(message)
+        PRIVACY_SUBSTITUTIONS_INVALID_WARNED = True
+
+
+# Returns True if two strings can share characters in some text: one contains the other or they overlap at an edge
+def _privacy_strings_overlap(a, b):
+    if a in b or b in a:
+        return True
+    for k in range(1, min(len(a), len(b))):
+        if a.endswith(b[:k]) or b.endswith(a[:k]):
+            return True
+    return False
+
+
+# Compiled form of PRIVACY_SUBSTITUTIONS which rewrites a string in a single regex pass per stage
+# Rules are applied in order and later rules see the output of earlier ones. Consecutive rules share a stage as long as
+# that cannot change the result: their search strings never overlap each other and no earlier replacement can create
+# a later search string. Typical rule sets (distinct usernames / ids) compile into a single stage
+class PrivacySubstituter(object):
+    MEMO_SIZE = 4096
+    MEMO_MAX_LEN = 256
+
+    def __init__(self, rules):
+        self.source = rules
+        self.source_len = len(rules)
+        self.memo = {}
+
+        valid = []
+        for item in rules:
+            if not isinstance(item, (list, tuple)) or len(item) != 2:
+                _warn_invalid_privacy_substitution("* Warning: Ignoring invalid PRIVACY_SUBSTITUTIONS entry, expected (search, replace) with both values as strings\n")
+                continue
+            search, replace = item
+            if not isinstance(search, str) or not isinstance(replace, str) or not search:
+                _warn_invalid_privacy_substitution("* Warning: Ignoring invalid PRIVACY_SUBSTITUTIONS entry, expected non-empty string search and string replace values\n")
+                continue
+            valid.append((search, replace))
+
+        stages = []
+        current = []
+        for search, replace in valid:
+            if any(self._interacts(earlier, (search, replace)) for earlier in current):
+                stages.append(current)
+                current = []
+            current.append((search, replace))
+        if current:
+            stages.append(current)
+
+        self.stages = [(re.compile("|".join(re.escape(search) for search, _ in stage)), dict(stage)) for stage in stages]
+        # Any match at all must start from a search string present in the original text, so one scan rules out most strings
+        self.prefilter = re.compile("|".join(re.escape(search) for search, _ in valid)) if len(self.stages) > 1 else None
+
+    # Returns True if rule `later` must not share a single pass with the earlier rule `earlier`
+    @staticmethod
+    def _interacts(earlier, later):
+        if _privacy_strings_overlap(earlier[0], later[0]):
+            return True
+        # An empty replacement joins the surrounding text, which can form any longer search string
+        if not earlier[1]:
+            return len(later[0]) > 1
+        return _privacy_strings_overlap(earlier[1], later[0])
+
+    # Returns True if this was compiled from the current PRIVACY_SUBSTITUTIONS list
+    def matches_source(self, rules):
+        return self.source is rules and self.source_len == len(rules)
+
+    # Applies the substitutions to one string, short strings like usernames are memoized
+    def apply(self, text):
+        memoize = len(text) <= self.MEMO_MAX_LEN
+        if memoize:
+            cached = self.memo.get(text)
+            if cached is not None:
+                return cached
+
+        result = text
+        if self.prefilter is None or self.prefilter.search(text):
+            for regex, replacements in self.stages:
+                result = regex.sub(lambda mo: replacements[mo.group(0)], result)
+
+        if memoize:
+            if len(self.memo) >= self.MEMO_SIZE:
+                self.memo.clear()
+            self.memo[text] = result
+        return result
+
+
+PRIVACY_SUBSTITUTER = None
+PRIVACY_SUBSTITUTER_LOCK = threading.Lock()
+
+
+# Returns the compiled PRIVACY_SUBSTITUTIONS, recompiling it when the list was replaced (config load) or resized
+def get_privacy_substituter():
+    global PRIVACY_SUBSTITUTER
+    substituter = PRIVACY_SUBSTITUTER
+    if substituter is not None and substituter.matches_source(PRIVACY_SUBSTITUTIONS):
+        return substituter
+    with PRIVACY_SUBSTITUTER_LOCK:
+        if PRIVACY_SUBSTITUTER is None or not PRIVACY_SUBSTITUTER.matches_source(PRIVACY_SUBSTITUTIONS):
+            PRIVACY_SUBSTITUTER = PrivacySubstituter(PRIVACY_SUBSTITUTIONS)
+        return PRIVACY_SUBSTITUTER
+
+
 # Apply PRIVACY_SUBSTITUTIONS to any content type
 def apply_privacy_substitutions(content: TPrivacyContent) -> TPrivacyContent:
     """
@@ -4623,31 +6242,19 @@ def apply_privacy_substitutions(content: TPrivacyContent) -> TPrivacyContent:
     - Ignores invalid substitution entries to avoid runtime crashes
     - Non-string primitives are returned unchanged
     """
-    global PRIVACY_SUBSTITUTIONS_INVALID_WARNED
     if not PRIVACY_SUBSTITUTIONS:
         return content
+    return _apply_privacy_substituter(get_privacy_substituter(), content)
+
+
+# Recursive worker of apply_privacy_substitutions using an already compiled substituter
+def _apply_privacy_substituter(substituter, content):
     if isinstance(content, str):
-        content_str = content
-        for item in PRIVACY_SUBSTITUTIONS:
-            if not isinstance(item, (list, tuple)) or len(item) != 2:
-                if not PRIVACY_SUBSTITUTIONS_INVALID_WARNED:
-                    if sys.__stderr__ is not None:
-                        sys.__stderr__.write("* Warning: Ignoring invalid PRIVACY_SUBSTITUTIONS entry, expected (search, replace) with both values as strings\n")
-                    PRIVACY_SUBSTITUTIONS_INVALID_WARNED = True
-                continue
-            search, replace = item
-            if not isinstance(search, str) or not isinstance(replace, str) or not search:
-                if not PRIVACY_SUBSTITUTIONS_INVALID_WARNED:
-                    if sys.__stderr__ is not None:
-                        sys.__stderr__.write("* Warning: Ignoring invalid PRIVACY_SUBSTITUTIONS entry, expected non-empty string search and string replace values\n")
-                    PRIVACY_SUBSTITUTIONS_INVALID_WARNED = True
-                continue
-            content_str = content_str.replace(search, replace)
-        return cast(TPrivacyContent, content_str)
+        return substituter.apply(content)
     if isinstance(content, dict):
-        return cast(TPrivacyContent, {k: apply_privacy_substitutions(v) for k, v in content.items()})
+        return {k: _apply_privacy_substituter(substituter, v) for k, v in content.items()}
     if isinstance(content, list):
-        return cast(TPrivacyContent, [apply_privacy_substitutions(item) for item in content])
+        return [_apply_privacy_substituter(substituter, item) for item in content]
     return content
 
 
@@ -4680,19 +6287,139 @@ def init_csv_file(csv_file_name):
 
 
 # Writes CSV entry
-def write_csv_entry(csv_file_name, timestamp, object_type, old, new):
+def write_csv_entry(csv_file_name, timestamp, object_type, old, new, target=""):
+    write_csv_entries(csv_file_name, [(timestamp, object_type, old, new)], target)
+
+
+# Writes a batch of (timestamp, type, old, new) CSV entries with one file open and one events database transaction
+def write_csv_entries(csv_file_name, entries, target=""):
+    if not entries:
+        return
     try:
         # Lazily initialize CSV file if it doesn't exist or is empty
         init_csv_file(csv_file_name)
 
-        debug_print(f"Writing CSV entry to {csv_file_name}: Type={object_type}, Old={old}, New={new}")
-        with open(csv_file_name, 'a', newline='', buffering=1, encoding="utf-8") as csv_file:
-            csvwriter = csv.DictWriter(csv_file, fieldnames=csvfieldnames, quoting=csv.QUOTE_NONNUMERIC)
-            csvwriter.writerow({'Date': timestamp, 'Type': object_type, 'Old': old, 'New': new})
+        debug_print(f"Writing {len(entries)} CSV entries to {csv_file_name}: Type={entries[0][1]}")
+        with open(csv_file_name, 'a', newline='', encoding="utf-8") as csv_file:
+            csvwriter = csv.writer(csv_file, quoting=csv.QUOTE_NONNUMERIC)
+            csvwriter.writerows(entries)
 
     except Exception as e:
         raise RuntimeError(f"Failed to write to CSV file '{csv_file_name}': {e}")
 
+    if EVENTS_DB_ENABLED:
+        try:
+            EVENT_STORE.add(target, entries)
+        except sqlite3.Error as e:
+            print(f"* Error: Failed to store events in '{EVENT_STORE.path()}': {e}")
+
+
+# SQLite store of the events also written to the CSV files, indexed by target and date
+# Dates are stored as 'YYYY-MM-DD HH:MM:SS' text, so date range queries use the index; counts keep their numeric type and
+# booleans are stored as integers flagged in the bools column (1 = old, 2 = new), so exports write them back as True / False
+class EventStore(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_path = None
+
+    # Returns the database path
+    @staticmethod
+    def path():
+        path = EVENTS_DB_FILE or os.path.join(OUTPUT_DIR or ".", "instagram_monitor_events.db")
+        return os.path.abspath(os.path.expanduser(path))
+
+    # Opens the database and creates its schema on first use (lock held)
+    def _connect(self):
+        path = self.path()
+        if self._conn is not None and self._conn_path == path:
+            return self._conn
+        if self._conn is not None:
+            self._conn.close()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY, target TEXT NOT NULL, ts TEXT NOT NULL, type TEXT NOT NULL, old, new)")
+        conn.execute("CREATE INDEX IF NOT EXISTS events_target_ts ON events (target, ts)")
+        if "bools" not in [column[1] for column in conn.execute("PRAGMA table_info(events)")]:
+            conn.execute("ALTER TABLE events ADD COLUMN bools INTEGER NOT NULL DEFAULT 0")
+        conn.commit()
+        self._conn, self._conn_path = conn, path
+        return conn
+
+    # Returns a CSV value in a form SQLite keeps as is: numbers (and booleans) stay numbers, everything else becomes text
+    @staticmethod
+    def _value(value):
+        if value is None:
+            return ""
+        if isinstance(value, (int, float)):
+            return int(value) if isinstance(value, bool) else value
+        return str(value)
+
+    # Stores (timestamp, type, old, new) events of a target in one transaction
+    def add(self, target, entries):
+        rows = [(target or "", str(ts), str(event_type), self._value(old), self._value(new), (isinstance(old, bool) and 1) | (isinstance(new, bool) and 2)) for ts, event_type, old, new in entries]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT INTO events (target, ts, type, old, new, bools) VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    # Returns a target's (ts, type, old, new) events in date order, optionally limited to since <= ts < until
+    def query(self, target, since=None, until=None, event_type=None):
+        sql = "SELECT ts, type, old, new, bools FROM events WHERE target = ?"
+        params = [target]
+        if since:
+            sql += " AND ts >= ?"
+            params.append(str(since))
+        if until:
+            sql += " AND ts < ?"
+            params.append(str(until))
+        if event_type:
+            sql += " AND type = ?"
+            params.append(event_type)
+        with self._lock:
+            rows = self._connect().execute(sql + " ORDER BY ts, id", params).fetchall()
+        return [(ts, event_type, bool(old) if bools & 1 else old, bool(new) if bools & 2 else new) for ts, event_type, old, new, bools in rows]
+
+    # Writes a target's events to a CSV file in the format of the monitoring CSV files; returns the number of rows
+    def export_csv(self, target, out_file, since=None, until=None):
+        rows = self.query(target, since, until)
+        csvwriter = csv.writer(out_file, quoting=csv.QUOTE_NONNUMERIC)
+        csvwriter.writerow(csvfieldnames)
+        csvwriter.writerows(rows)
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+EVENT_STORE = EventStore()
+
+
+# Exports a target's stored events as CSV to out_path (stdout if empty); returns the process exit code
+def export_events_csv(target, out_path="", since=None, until=None):
+    db_path = EVENT_STORE.path()
+    if not os.path.isfile(db_path):
+        print(f"* Error: Events database '{db_path}' does not exist", file=sys.stderr)
+        print(colorize("info", "To fix: events are stored while monitoring with -b / CSV_FILE and EVENTS_DB_ENABLED, set EVENTS_DB_FILE or -o if the database is elsewhere."), file=sys.stderr)
+        return 1
+    try:
+        if out_path:
+            os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+            with open(out_path, 'w', newline='', encoding="utf-8") as f:
+                count = EVENT_STORE.export_csv(target, f, since, until)
+            print(f"* Exported {count} events of {target} to '{out_path}'")
+        else:
+            EVENT_STORE.export_csv(target, sys.stdout, since, until)
+    except (OSError, sqlite3.Error) as e:
+        print(f"* Error: Could not export events: {e}", file=sys.stderr)
+        return 1
+    return 0
+
 
 # Randomizes how often to perform checks for user activity (INSTA_CHECK_INTERVAL)
 def randomize_number(number, diff_low, diff_high):
@@ -5021,6 +6748,7 @@ def toggle_status_changes_notifications_signal_handler(sig, frame):
     sig_name = signal.Signals(sig).name
     print(f"* Signal {sig_name} received")
     print(f"* Email notifications: [new posts/reels/stories/followings/bio/profile picture = {STATUS_NOTIFICATION}]")
+    invalidate_dashboard_config_cache()
     print_cur_ts()
 
 
@@ -5031,6 +6759,7 @@ def toggle_followers_notifications_signal_handler(sig, frame):
     sig_name = signal.Signals(sig).name
     print(f"* Signal {sig_name} received")
     print(f"* Email notifications: [followers = {FOLLOWERS_NOTIFICATION}]")
+    invalidate_dashboard_config_cache()
     print_cur_ts()
 
 
@@ -5046,6 +6775,7 @@ def increase_check_signal_handler(sig, frame):
     sig_name = signal.Signals(sig).name
     print(f"* Signal {sig_name} received")
     print(f"* Instagram timers: [check interval: {display_time(check_interval_low)} - {display_time(INSTA_CHECK_INTERVAL + RANDOM_SLEEP_DIFF_HIGH)}]")
+    invalidate_dashboard_config_cache()
     print_cur_ts()
 
 
@@ -5062,6 +6792,7 @@ def decrease_check_signal_handler(sig, frame):
     sig_name = signal.Signals(sig).name
     print(f"* Signal {sig_name} received")
     print(f"* Instagram timers: [check interval: {display_time(check_interval_low)} - {display_time(INSTA_CHECK_INTERVAL + RANDOM_SLEEP_DIFF_HIGH)}]")
+    invalidate_dashboard_config_cache()
     print_cur_ts()
 
 
@@ -5097,54 +6828,513 @@ def reload_secrets_signal_handler(sig, frame):
                 globals()[secret] = val
                 print(f"* Reloaded {secret} from {env_path}")
 
+    invalidate_dashboard_config_cache()
     print_cur_ts()
 
 
+# Returns the media store key of a media URL: its path, which stays the same across CDN hosts and signed query strings,
+# plus the stp parameter when present, since variants of one file that differ only in size or crop are selected by it
+def media_store_key(url) -> str:
+    from urllib.parse import urlparse, parse_qs
+    try:
+        parsed = urlparse(str(url or ""))
+        stp = parse_qs(parsed.query).get("stp")
+        return f"{parsed.path}?stp={stp[0]}" if stp else parsed.path
+    except Exception:
+        return ""
+
+
+# Content-addressed store for downloaded post, reel and story media shared by all targets
+# Blobs live under blobs/<sha256[:2]>/<sha256> and are hard-linked (or copied) into the per-target images / videos dirs,
+# copied when a target's file needs a different mtime than the other links
+# index.jsonl maps media keys to blob digests plus the ETag / Last-Modified seen when they were downloaded
+class MediaStore(object):
+    def __init__(self, root):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        self._lock = threading.Lock()
+        self._index = None
+        self._fetch_locks = {}  # media key -> [lock, number of fetches using it]
+
+    # Takes the download lock of one media key, so concurrent fetches of it wait for the first one instead of
+    # writing into the same partial file; returns the slot to pass to _release_key()
+    def _acquire_key(self, key):
+        with self._lock:
+            slot = self._fetch_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        slot[0].acquire()
+        return slot
+
+    # Releases a media key's download lock and forgets it once no fetch uses it
+    def _release_key(self, key, slot):
+        slot[0].release()
+        with self._lock:
+            slot[1] -= 1
+            if not slot[1]:
+                self._fetch_locks.pop(key, None)
+
+    # Loads the index on first use (lock held)
+    def _load_index(self):
+        if self._index is not None:
+            return
+        self._index = {}
+        if not os.path.isfile(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self._index[entry["key"]] = entry
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    # Returns the blob path for a digest
+    def blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    # Returns the index entry for a key if its blob is still present
+    def lookup(self, key):
+        with self._lock:
+            self._load_index()
+            entry = self._index.get(key)
+        if entry and os.path.isfile(self.blob_path(entry["sha256"])):
+            return entry
+        return None
+
+    # Records a key in the index
+    def _record(self, entry):
+        with self._lock:
+            self._load_index()
+            self._index[entry["key"]] = entry
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.index_path, 'a', encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    # Places the blob at dest as a hard link, falling back to a copy across filesystems
+    # All links share one mtime, so when dest must get an mtime the blob does not have it gets its own copy instead
+    def link(self, digest, dest, mtime=0):
+        blob = self.blob_path(digest)
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        tmp_dest = f"{dest}.tmp"
+        if os.path.lexists(tmp_dest):
+            os.remove(tmp_dest)
+        linked = False
+        if not mtime or int(os.path.getmtime(blob)) == int(mtime):
+            try:
+                os.link(blob, tmp_dest)
+                linked = True
+            except OSError:
+                pass
+        if not linked:
+            shutil.copyfile(blob, tmp_dest)
+            if mtime:
+                os.utime(tmp_dest, (mtime, mtime))
+        os.replace(tmp_dest, dest)
+
+    # Returns the mtime for a stored entry: the given timestamp, else the Last-Modified seen when it was downloaded
+    @staticmethod
+    def _entry_mtime(entry, mtime=0):
+        if mtime or not entry.get("last_modified"):
+            return mtime
+        url_time_in_tz = convert_utc_str_to_tz_datetime(entry["last_modified"])
+        return int(url_time_in_tz.timestamp()) if url_time_in_tz else 0
+
+    # Downloads url into the store unless the key is already held, links it to dest and returns the index entry
+    # mtime (or else the media's Last-Modified) is applied to dest
+    def fetch(self, url, dest, mtime=0):
+        key = media_store_key(url)
+        slot = self._acquire_key(key or url)
+        try:
+            return self._fetch(url, key, dest, mtime)
+        finally:
+            self._release_key(key or url, slot)
+
+    # Body of fetch(), called with the media key's download lock held
+    def _fetch(self, url, key, dest, mtime):
+        entry = self.lookup(key) if key else None
+        if entry:
+            self.link(entry["sha256"], dest, self._entry_mtime(entry, mtime))
+            return entry
+
+        # The partial file is named after the key, so a retried download of the same media resumes it
+        part_path = os.path.join(self.root, "partial", hashlib.sha256((key or url).encode("utf-8")).hexdigest() + ".part")
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+        headers = download_resumable(url, part_path)
+        digest = hashlib.sha256()
+        size = 0
+        with open(part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+                size += len(chunk)
+        entry = {"key": key or url, "sha256": digest.hexdigest(), "size": size, "etag": headers.get('etag', ""), "last_modified": headers.get('last-modified', "")}
+        entry_mtime = self._entry_mtime(entry, mtime)
+        blob = self.blob_path(digest.hexdigest())
+        if os.path.isfile(blob):
+            os.remove(part_path)
+        else:
+            # A new blob takes the first target's mtime, so targets seeing the same post can share it as a hard link
+            if entry_mtime:
+                os.utime(part_path, (entry_mtime, entry_mtime))
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.replace(part_path, blob)
+
+        self._record(entry)
+        self.link(entry["sha256"], dest, entry_mtime)
+        return entry
+
+
+MEDIA_STORES = {}
+MEDIA_STORES_LOCK = threading.Lock()
+
+
+# Returns the shared media store for the configured directory
+def get_media_store():
+    root = MEDIA_STORE_DIR or os.path.join(OUTPUT_DIR or ".", ".media_store")
+    root = os.path.abspath(os.path.expanduser(root))
+    with MEDIA_STORES_LOCK:
+        store = MEDIA_STORES.get(root)
+        if store is None:
+            store = MediaStore(root)
+            MEDIA_STORES[root] = store
+        return store
+
+
 # Saves user's image / video to selected file name
-def save_pic_video(image_video_url, image_video_file_name, custom_mdate_ts=0):
+# With use_media_store (posts, reels and stories) media already held in the shared media store is linked instead of downloaded
+def save_pic_video(image_video_url, image_video_file_name, custom_mdate_ts=0, use_media_store=False):
     try:
-        image_video_response = req.get(image_video_url, headers={'User-Agent': USER_AGENT}, timeout=FUNCTION_TIMEOUT, stream=True, verify=get_proxies_ssl(), proxies=get_proxies())
-        image_video_response.raise_for_status()
-        url_time = image_video_response.headers.get('last-modified')
-        url_time_in_tz_ts = 0
-        if url_time and not custom_mdate_ts:
-            url_time_in_tz = convert_utc_str_to_tz_datetime(url_time)
-            if url_time_in_tz:
-                url_time_in_tz_ts = int(url_time_in_tz.timestamp())
-            else:
-                url_time_in_tz_ts = 0
-
-        if image_video_response.status_code == 200:
-            os.makedirs(os.path.dirname(os.path.abspath(image_video_file_name)), exist_ok=True)
-            with open(image_video_file_name, 'wb') as f:
-                image_video_response.raw.decode_content = True
-                shutil.copyfileobj(image_video_response.raw, f)
-            if url_time_in_tz_ts and not custom_mdate_ts:
-                os.utime(image_video_file_name, (url_time_in_tz_ts, url_time_in_tz_ts))
-            elif custom_mdate_ts:
-                os.utime(image_video_file_name, (custom_mdate_ts, custom_mdate_ts))
+        download_media(image_video_url, image_video_file_name, custom_mdate_ts, use_media_store=use_media_store)
         return True
     except Exception:
         return False
 
 
+# Downloads an image / video to the selected file name like save_pic_video, but raises on failure
+def download_media(image_video_url, image_video_file_name, custom_mdate_ts=0, use_media_store=False):
+    if use_media_store and MEDIA_STORE_ENABLED:
+        get_media_store().fetch(image_video_url, image_video_file_name, custom_mdate_ts)
+        return
+
+    os.makedirs(os.path.dirname(os.path.abspath(image_video_file_name)), exist_ok=True)
+    part_path = f"{image_video_file_name}.part"
+    headers = download_resumable(image_video_url, part_path)
+    os.replace(part_path, image_video_file_name)
+    url_time = headers.get('last-modified')
+    url_time_in_tz_ts = 0
+    if url_time and not custom_mdate_ts:
+        url_time_in_tz = convert_utc_str_to_tz_datetime(url_time)
+        if url_time_in_tz:
+            url_time_in_tz_ts = int(url_time_in_tz.timestamp())
+
+    if url_time_in_tz_ts and not custom_mdate_ts:
+        os.utime(image_video_file_name, (url_time_in_tz_ts, url_time_in_tz_ts))
+    elif custom_mdate_ts:
+        os.utime(image_video_file_name, (custom_mdate_ts, custom_mdate_ts))
+
+
+# Returns the GET function for media downloads: the pooled session of a download worker, plain requests elsewhere
+def media_http_get():
+    session = getattr(_thread_local, 'media_session', None)
+    return session.get if session is not None else req.get
+
+
+# Raised when a media download is larger than MEDIA_DOWNLOAD_MAX_MB, which retrying would not change
+class MediaTooLargeError(Exception):
+    pass
+
+
+# Removes a partial download and the validator saved next to it
+def remove_partial_download(part_path):
+    for path in (part_path, f"{part_path}.validator"):
+        if os.path.lexists(path):
+            os.remove(path)
+
+
+# Downloads url into part_path and returns the response headers
+# A partial file left by an interrupted download is continued with a Range request guarded by If-Range with the ETag or
+# Last-Modified of its first response (saved in <part_path>.validator); unless the server answers with a 206 for exactly
+# the missing bytes, the part file is started over. Downloads larger than MEDIA_DOWNLOAD_MAX_MB raise MediaTooLargeError,
+# checked against Content-Length before anything is written when the server sends it
+def download_resumable(url, part_path):
+    validator_path = f"{part_path}.validator"
+    offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+    validator = ""
+    if offset:
+        try:
+            with open(validator_path, 'r', encoding="utf-8") as f:
+                validator = f.read().strip()
+        except OSError:
+            validator = ""
+        # Without a validator there is no telling whether the part belongs to the same file, so it is not resumed
+        if not validator:
+            offset = 0
+    headers = {'User-Agent': USER_AGENT}
+    if offset:
+        headers['Range'] = f"bytes={offset}-"
+        headers['If-Range'] = validator
+    response = media_http_get()(url, headers=headers, timeout=FUNCTION_TIMEOUT, stream=True, verify=get_proxies_ssl(), proxies=get_proxies())
+    try:
+        if offset and response.status_code == 416:
+            remove_partial_download(part_path)
+            return download_resumable(url, part_path)
+        response.raise_for_status()
+        content_range = response.headers.get('content-range') or ""
+        if response.status_code != 206 or (content_range and not content_range.startswith(f"bytes {offset}-")):
+            offset = 0
+
+        max_bytes = MEDIA_DOWNLOAD_MAX_MB * 1024 * 1024 if MEDIA_DOWNLOAD_MAX_MB else 0
+        too_large = f"download larger than MEDIA_DOWNLOAD_MAX_MB ({MEDIA_DOWNLOAD_MAX_MB} MB)"
+        length = str(response.headers.get('content-length') or "")
+        if max_bytes and length.isdigit() and offset + int(length) > max_bytes:
+            remove_partial_download(part_path)
+            raise MediaTooLargeError(too_large)
+
+        if not offset:
+            etag = response.headers.get('etag') or ""
+            # Weak ETags are not allowed in If-Range
+            new_validator = etag if etag and not etag.startswith("W/") else (response.headers.get('last-modified') or "")
+            if new_validator:
+                with open(validator_path, 'w', encoding="utf-8") as f:
+                    f.write(new_validator)
+            elif os.path.lexists(validator_path):
+                os.remove(validator_path)
+
+        with open(part_path, 'ab' if offset else 'wb') as f:
+            response.raw.decode_content = True
+            for chunk in iter(lambda: response.raw.read(65536), b""):
+                offset += len(chunk)
+                if max_bytes and offset > max_bytes:
+                    f.close()
+                    remove_partial_download(part_path)
+                    raise MediaTooLargeError(too_large)
+                f.write(chunk)
+        if os.path.lexists(validator_path):
+            os.remove(validator_path)
+        return response.headers
+    finally:
+        close = getattr(response, 'close', None)
+        if close is not None:
+            close()
+
+
+# One queued media download
+@dataclass
+class MediaDownloadJob:
+    url: str
+    dest: str
+    custom_mdate_ts: int = 0
+    use_media_store: bool = False
+    user: str = ""
+    label: str = ""
+    key: str = ""  # media store key, empty when the download does not go through the store
+    followers: list = dataclass_field(default_factory=list)  # jobs of other targets waiting for the same media
+
+
+# Bounded pool of background media download threads
+# Each worker keeps its own requests session, so connections to the CDN hosts are reused between downloads; a failed
+# download is retried a few times and continues from the partial file. Jobs of several targets for the same stored
+# media share one download. Completions are printed and logged to the dashboards' activity feed
+class MediaDownloader(object):
+    ATTEMPTS = 3
+    RETRY_DELAY = 5
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queue = deque()
+        self._pending = set()  # absolute paths of queued or running downloads
+        self._by_key = {}  # media store key -> queued or running job for it
+        self._workers = []
+
+    # Returns True if the file exists or its download is queued or running
+    def has(self, dest):
+        with self._cond:
+            if os.path.abspath(dest) in self._pending:
+                return True
+        return os.path.isfile(dest)
+
+    # Queues a download (or runs it right away without MEDIA_DOWNLOAD_WORKERS); a path already queued is not queued again
+    # and media already queued for another target is linked from the store once that download completes
+    def submit(self, url, dest, custom_mdate_ts=0, use_media_store=False, user="", label="Media"):
+        key = media_store_key(url) if use_media_store and MEDIA_STORE_ENABLED else ""
+        job = MediaDownloadJob(url, dest, custom_mdate_ts, use_media_store, user, label, key)
+        if MEDIA_DOWNLOAD_WORKERS <= 0:
+            self._report(job, *self._download(job))
+            return
+        with self._cond:
+            path = os.path.abspath(dest)
+            if path in self._pending:
+                return
+            self._pending.add(path)
+            leader = self._by_key.get(key) if key else None
+            if leader is not None:
+                leader.followers.append(job)
+                return
+            if key:
+                self._by_key[key] = job
+            self._queue.append(job)
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            if len(self._workers) < MEDIA_DOWNLOAD_WORKERS:
+                worker = threading.Thread(target=self._run, daemon=True, name=f"media_download_{len(self._workers) + 1}")
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify()
+
+    # Waits up to timeout seconds until no download is queued or running; returns True if none is left
+    def wait(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending, timeout)
+
+    # Runs one job with retries and returns (ok, reason); a download over MEDIA_DOWNLOAD_MAX_MB is not retried
+    def _download(self, job):
+        reason = ""
+        for attempt in range(self.ATTEMPTS):
+            if attempt:
+                time.sleep(self.RETRY_DELAY * attempt)
+            try:
+                download_media(job.url, job.dest, job.custom_mdate_ts, use_media_store=job.use_media_store)
+                return True, ""
+            except MediaTooLargeError as e:
+                return False, str(e)
+            except Exception as e:
+                reason = str(e)
+        return False, reason
+
+    def _run(self):
+        _thread_local.media_session = req.Session()
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                job = self._queue.popleft()
+            self._report(job, *self._download(job))
+            # No more followers can join once the job is out of the key index
+            with self._cond:
+                if job.key and self._by_key.get(job.key) is job:
+                    del self._by_key[job.key]
+            for follower in job.followers:
+                self._report(follower, *self._download(follower))
+            with self._cond:
+                for done in [job] + job.followers:
+                    self._pending.discard(os.path.abspath(done.dest))
+                self._cond.notify_all()
+
+    @staticmethod
+    def _report(job, ok, reason=""):
+        if ok:
+            print(f"{job.label} saved for {job.user} to '{job.dest}'")
+            log_activity(f"{job.label} saved", user=job.user or None, details=job.dest)
+        else:
+            print(f"Error saving {job.label.lower()} for {job.user}{': ' + reason if reason else ''} !")
+            log_activity(f"Error saving {job.label.lower()}", user=job.user or None, level='error')
+
+
+MEDIA_DOWNLOADER = MediaDownloader()
+
+
+FILE_DIGEST_CACHE = {}
+FILE_DIGEST_CACHE_LOCK = threading.Lock()
+
+
+# Returns the file's stat signature used to validate cached digests
+def _file_signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+# Returns the SHA-256 hex digest of a file, cached until the file is replaced or modified
+def file_digest(path):
+    key = os.path.abspath(path)
+    signature = _file_signature(path)
+    with FILE_DIGEST_CACHE_LOCK:
+        cached = FILE_DIGEST_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    with FILE_DIGEST_CACHE_LOCK:
+        FILE_DIGEST_CACHE[key] = (signature, digest.hexdigest())
+    return digest.hexdigest()
+
+
 # Compares two image files
 def compare_images(file1, file2):
     if not os.path.isfile(file1) or not os.path.isfile(file2):
         return False
     try:
-        with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-            for line1, line2 in zip_longest(f1, f2, fillvalue=None):
-                if line1 == line2:
-                    continue
-                else:
-                    return False
-            return True
+        return file_digest(file1) == file_digest(file2)
     except Exception as e:
         print(f"* Error while comparing profile pictures: {e}")
         return False
 
 
+# Returns the asset id of a profile picture URL: the CDN file name, which only changes when a new picture is uploaded
+def profile_pic_asset_id(url) -> str:
+    from urllib.parse import urlparse
+    try:
+        return os.path.basename(urlparse(str(url or "")).path)
+    except Exception:
+        return ""
+
+
+# Returns the path of the sidecar file holding the saved profile picture's digest, asset id and HTTP validators
+def profile_pic_meta_file(profile_pic_file):
+    return os.path.splitext(profile_pic_file)[0] + ".meta.json"
+
+
+# Returns the sidecar metadata of the saved profile picture, None if missing or the picture changed on disk since
+def read_profile_pic_meta(profile_pic_file):
+    try:
+        with open(profile_pic_meta_file(profile_pic_file), 'r', encoding="utf-8") as f:
+            meta = json.load(f)
+        signature = _file_signature(profile_pic_file)
+    except Exception:
+        return None
+    if not isinstance(meta, dict) or meta.get("signature") != signature or not meta.get("sha256"):
+        return None
+    # Seed the digest cache so comparing with the empty template does not read the picture again
+    with FILE_DIGEST_CACHE_LOCK:
+        FILE_DIGEST_CACHE[os.path.abspath(profile_pic_file)] = (signature, meta["sha256"])
+    return meta
+
+
+# Records the saved profile picture's digest, asset id and HTTP validators in its sidecar file
+def write_profile_pic_meta(profile_pic_file, asset_id, etag="", last_modified=""):
+    try:
+        meta = {"sha256": file_digest(profile_pic_file), "signature": _file_signature(profile_pic_file), "asset_id": asset_id, "etag": etag or "", "last_modified": last_modified or ""}
+        meta_file = profile_pic_meta_file(profile_pic_file)
+        with open(f"{meta_file}.tmp", 'w', encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(f"{meta_file}.tmp", meta_file)
+    except Exception as e:
+        debug_print(f"Cannot write profile picture metadata for '{profile_pic_file}': {e}")
+
+
+# Downloads the profile picture to file_name using If-None-Match / If-Modified-Since from the sidecar metadata
+# Returns None when the server answers 304 Not Modified, otherwise the new ETag / Last-Modified; raises on errors
+def fetch_profile_pic_conditional(url, file_name, meta):
+    headers = {'User-Agent': USER_AGENT}
+    if meta.get("etag"):
+        headers['If-None-Match'] = meta["etag"]
+    if meta.get("last_modified"):
+        headers['If-Modified-Since'] = meta["last_modified"]
+    response = req.get(url, headers=headers, timeout=FUNCTION_TIMEOUT, stream=True, verify=get_proxies_ssl(), proxies=get_proxies())
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    os.makedirs(os.path.dirname(os.path.abspath(file_name)), exist_ok=True)
+    with open(file_name, 'wb') as f:
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, f)
+    last_modified = response.headers.get('last-modified', "")
+    url_time_in_tz = convert_utc_str_to_tz_datetime(last_modified) if last_modified else None
+    if url_time_in_tz:
+        url_time_in_tz_ts = int(url_time_in_tz.timestamp())
+        os.utime(file_name, (url_time_in_tz_ts, url_time_in_tz_ts))
+    return {"etag": response.headers.get('etag', ""), "last_modified": last_modified}
+
+
 # Detects changed Instagram profile pictures
 def detect_changed_profile_picture(user, profile_image_url, profile_pic_file, profile_pic_file_tmp, profile_pic_file_old, profile_pic_file_empty, csv_file_name, r_sleep_time, send_email_notification, func_ver):
 
@@ -5156,9 +7346,12 @@ def detect_changed_profile_picture(user, profile_image_url, profile_pic_file, pr
     else:
         new_line = ""
 
+    asset_id = profile_pic_asset_id(profile_image_url)
+
     # Profile pic does not exist in the filesystem
     if not os.path.isfile(profile_pic_file):
         if save_pic_video(profile_image_url, profile_pic_file):
+            write_profile_pic_meta(profile_pic_file, asset_id)
             profile_pic_mdate_dt = datetime.fromtimestamp(int(os.path.getmtime(profile_pic_file)), pytz.timezone(LOCAL_TIMEZONE))
 
             if profile_pic_file_empty and os.path.isfile(profile_pic_file_empty):
@@ -5186,7 +7379,7 @@ def detect_changed_profile_picture(user, profile_image_url, profile_pic_file, pr
                 pass
             try:
                 if csv_file_name and not is_empty_profile_pic:
-                    write_csv_entry(csv_file_name, now_local_naive(), "Profile Picture Created", "", convert_to_local_naive(profile_pic_mdate_dt))
+                    write_csv_entry(csv_file_name, now_local_naive(), "Profile Picture Created", "", convert_to_local_naive(profile_pic_mdate_dt), target=user)
             except Exception as e:
                 print(f"* Error: {e}")
         else:
@@ -5207,14 +7400,43 @@ def detect_changed_profile_picture(user, profile_image_url, profile_pic_file, pr
         m_body_html_pic_saved_text = ""
         profile_pic_mdate_dt = datetime.fromtimestamp(int(os.path.getmtime(profile_pic_file)), pytz.timezone(LOCAL_TIMEZONE))
         profile_pic_mdate = get_short_date_from_ts(profile_pic_mdate_dt, True)
-        if save_pic_video(profile_image_url, profile_pic_file_tmp):
-            profile_pic_tmp_mdate_dt = datetime.fromtimestamp(int(os.path.getmtime(profile_pic_file_tmp)), pytz.timezone(LOCAL_TIMEZONE))
+
+        # With a valid sidecar, an unchanged CDN asset id needs no request and a changed one a conditional request
+        # Only a real download is hashed and compared; without a sidecar the picture is downloaded as before
+        pic_meta = read_profile_pic_meta(profile_pic_file)
+        pic_validators = {}
+        pic_status = ""
+        if pic_meta and asset_id and pic_meta.get("asset_id") == asset_id:
+            debug_print("Profile picture asset id unchanged, skipping download")
+            pic_status = "unchanged"
+        elif pic_meta:
+            try:
+                pic_validators = fetch_profile_pic_conditional(profile_image_url, profile_pic_file_tmp, pic_meta)
+                if pic_validators is None:
+                    debug_print("Profile picture not modified (304)")
+                    pic_status = "unchanged"
+                    write_profile_pic_meta(profile_pic_file, asset_id, pic_meta.get("etag", ""), pic_meta.get("last_modified", ""))
+                else:
+                    pic_status = "downloaded"
+            except Exception as e:
+                debug_print(f"Conditional profile picture request failed: {e}")
+        elif save_pic_video(profile_image_url, profile_pic_file_tmp):
+            pic_status = "downloaded"
+
+        if pic_status:
             if profile_pic_file_empty and os.path.isfile(profile_pic_file_empty):
                 debug_print("Comparing current profile picture with empty template...")
                 is_empty_profile_pic = compare_images(profile_pic_file, profile_pic_file_empty)
 
-            debug_print("Comparing current profile picture with downloaded temporary one...")
-            if not compare_images(profile_pic_file, profile_pic_file_tmp) and profile_pic_mdate_dt != profile_pic_tmp_mdate_dt:
+            pic_changed = False
+            if pic_status == "downloaded":
+                profile_pic_tmp_mdate_dt = datetime.fromtimestamp(int(os.path.getmtime(profile_pic_file_tmp)), pytz.timezone(LOCAL_TIMEZONE))
+                debug_print("Comparing current profile picture with downloaded temporary one...")
+                pic_changed = not compare_images(profile_pic_file, profile_pic_file_tmp) and profile_pic_mdate_dt != profile_pic_tmp_mdate_dt
+                if not pic_changed:
+                    write_profile_pic_meta(profile_pic_file, asset_id, (pic_validators or {}).get("etag", ""), (pic_validators or {}).get("last_modified", ""))
+
+            if pic_changed:
                 if profile_pic_file_empty and os.path.isfile(profile_pic_file_empty):
                     is_empty_profile_pic_tmp = compare_images(profile_pic_file_tmp, profile_pic_file_empty)
 
@@ -5262,11 +7484,11 @@ def detect_changed_profile_picture(user, profile_image_url, profile_pic_file, pr
                 try:
                     if csv_file_name:
                         if csv_text == "Profile Picture Removed":
-                            write_csv_entry(csv_file_name, now_local_naive(), csv_text, convert_to_local_naive(profile_pic_mdate_dt), "")
+                            write_csv_entry(csv_file_name, now_local_naive(), csv_text, convert_to_local_naive(profile_pic_mdate_dt), "", target=user)
                         elif csv_text == "Profile Picture Created":
-                            write_csv_entry(csv_file_name, now_local_naive(), csv_text, "", convert_to_local_naive(profile_pic_tmp_mdate_dt))
+                            write_csv_entry(csv_file_name, now_local_naive(), csv_text, "", convert_to_local_naive(profile_pic_tmp_mdate_dt), target=user)
                         else:
-                            write_csv_entry(csv_file_name, now_local_naive(), csv_text, convert_to_local_naive(profile_pic_mdate_dt), convert_to_local_naive(profile_pic_tmp_mdate_dt))
+                            write_csv_entry(csv_file_name, now_local_naive(), csv_text, convert_to_local_naive(profile_pic_mdate_dt), convert_to_local_naive(profile_pic_tmp_mdate_dt), target=user)
                 except Exception as e:
                     print(f"* Error: {e}")
 
@@ -5284,6 +7506,7 @@ def detect_changed_profile_picture(user, profile_image_url, profile_pic_file, pr
                     if csv_text != "Profile Picture Created":
                         os.replace(profile_pic_file, profile_pic_file_old)
                     os.replace(profile_pic_file_tmp, profile_pic_file)
+                    write_profile_pic_meta(profile_pic_file, asset_id, (pic_validators or {}).get("etag", ""), (pic_validators or {}).get("last_modified", ""))
                 except Exception as e:
                     print(f"* Error while replacing/copying files: {e}")
 
@@ -5353,9 +7576,45 @@ def detect_changed_profile_picture(user, profile_image_url, profile_pic_file, pr
             print_cur_ts(newline=True)
 
 
+# Returns the iPhone API JSON for the given path, reusing a response cached on the context during the current check cycle
+def get_iphone_json_cached(bot: instaloader.Instaloader, path: str) -> Any:
+    ctx: Any = bot.context
+    if not PROFILE_INFO_CACHE_TTL or PROFILE_INFO_CACHE_TTL <= 0:
+        return ctx.get_iphone_json(path, {})
+
+    cache = getattr(ctx, "_im_response_cache", None)
+    if cache is None:
+        cache = {}
+        setattr(ctx, "_im_response_cache", cache)
+
+    now_ts = time.monotonic()
+    cached = cache.get(path)
+    if cached is not None and (now_ts - cached[0]) < PROFILE_INFO_CACHE_TTL:
+        debug_print(f"Reusing cached response for {path}")
+        return cached[1]
+
+    data = ctx.get_iphone_json(path, {})
+    # Only keep usable answers, so an API failure is retried by the next caller instead of being replayed
+    if isinstance(data, dict) and data.get("status") != "fail":
+        cache[path] = (now_ts, data)
+    return data
+
+
+# Drops all responses cached on the context, called when a check cycle ends or fresh data is required
+def invalidate_response_cache(bot: instaloader.Instaloader) -> None:
+    cache = getattr(bot.context, "_im_response_cache", None)
+    if cache:
+        cache.clear()
+
+
+# Returns the web_profile_info response for the user, shared by every helper within one check cycle
+def get_web_profile_info(bot: instaloader.Instaloader, username: str) -> Any:
+    return get_iphone_json_cached(bot, f"api/v1/users/web_profile_info/?username={username}")
+
+
 # Builds a Profile object from the mobile web_profile_info response
 def _profile_from_web_profile_info(bot: instaloader.Instaloader, username: str) -> Optional[instaloader.Profile]:
-    data = bot.context.get_iphone_json(f"api/v1/users/web_profile_info/?username={username}", {})
+    data = get_web_profile_info(bot, username)
     if not isinstance(data, dict):
         return None
 
@@ -5425,7 +7684,7 @@ def latest_post_mobile(user: str, bot: instaloader.Instaloader):
         video_url: Optional[str]
         mediaid: str
 
-    data = bot.context.get_iphone_json(f"api/v1/users/web_profile_info/?username={user}", {})
+    data = get_web_profile_info(bot, user)
 
     if not isinstance(data, dict):
         raise RuntimeError(f"Instagram returned unexpected response type: {type(data).__name__}")
@@ -5509,7 +7768,7 @@ def _extract_collaborators(node: Dict[str, Any], owner_username: str = "") -> Li
 
 # Returns posts leaking from a private account's timeline media via web_profile_info (collab posts shared with public accounts)
 def fetch_leaked_collab_posts(user: str, bot: instaloader.Instaloader) -> List[Dict[str, Any]]:
-    data = bot.context.get_iphone_json(f"api/v1/users/web_profile_info/?username={user}", {})
+    data = get_web_profile_info(bot, user)
     if not isinstance(data, dict):
         return []
     raw = data.get("data")
@@ -5579,10 +7838,7 @@ def report_leaked_collab_post(user: str, insta_username: str, post: Dict[str, An
         if (user_root_path or OUTPUT_DIR) and videos_dir:
             video_filename = os.path.join(videos_dir, video_filename)
         if not os.path.isfile(video_filename):
-            if save_pic_video(post["video_url"], video_filename, ts):
-                print(f"Collab {source} video saved for {user} to '{video_filename}'")
-            else:
-                print(f"Error saving collab {source} video !")
+            MEDIA_DOWNLOADER.submit(post["video_url"], video_filename, ts, use_media_store=True, user=user, label=f"Collab {source} video")
 
     pic_saved_html = ""
     if DOWNLOAD_THUMBNAILS and post.get("display_url"):
@@ -5590,7 +7846,7 @@ def report_leaked_collab_post(user: str, insta_username: str, post: Dict[str, An
         if (user_root_path or OUTPUT_DIR) and images_dir:
             image_filename = os.path.join(images_dir, image_filename)
         if not os.path.isfile(image_filename):
-            if save_pic_video(post["display_url"], image_filename, ts):
+            if save_pic_video(post["display_url"], image_filename, ts, use_media_store=True):
                 pic_saved_html = '<br><br><img src="cid:collab_pic" width="50%">'
                 print(f"Collab {source} thumbnail image saved for {user} to '{image_filename}'")
                 try:
@@ -5611,7 +7867,7 @@ def report_leaked_collab_post(user: str, insta_username: str, post: Dict[str, An
 
     if is_new and csv_file_name:
         try:
-            write_csv_entry(csv_file_name, convert_to_local_naive(post_dt), f"New Leaked Collab {source.capitalize()}", "", caption if caption != "(empty)" else post_url)
+            write_csv_entry(csv_file_name, convert_to_local_naive(post_dt), f"New Leaked Collab {source.capitalize()}", "", caption if caption != "(empty)" else post_url, target=user)
         except Exception as e:
             print(f"* Error: {e}")
 
@@ -5640,7 +7896,7 @@ def report_leaked_collab_post(user: str, insta_username: str, post: Dict[str, An
         )
 
     saved_file_path = None
-    if video_filename and os.path.isfile(video_filename):
+    if video_filename and MEDIA_DOWNLOADER.has(video_filename):
         saved_file_path = video_filename
     elif image_filename and os.path.isfile(image_filename):
         saved_file_path = image_filename
@@ -5798,9 +8054,7 @@ def get_post_location_mobile(last_post: instaloader.Post, bot: instaloader.Insta
 # Returns the true shortcode for the user's latest Reel via the mobile-web_profile_info endpoint
 def get_real_reel_code(bot: instaloader.Instaloader, username: str) -> Optional[str]:
     try:
-        ctx: Any = bot.context  # type: ignore
-
-        data = ctx.get_iphone_json(f"api/v1/users/web_profile_info/?username={username}", {})
+        data = get_web_profile_info(bot, username)
 
         if isinstance(data, dict) and data.get("status") == "fail":
             debug_print(f"[{username}] get_real_reel_code failed: Instagram API error - {data.get('message', 'unknown')}")
@@ -6357,6 +8611,28 @@ def extract_usernames_safely(data_dict):
     return usernames
 
 
+# Returns follower / following usernames from a JSON response, parsing the body at most once
+# Bodies without follower edges are skipped by a byte scan; a parsed body is kept on the response so the
+# caller (Instaloader) gets the same decoded object from resp.json() instead of decoding it again
+def extract_usernames_from_response(resp):
+    try:
+        if b'"edge_follow' not in resp.content:
+            return []
+    except Exception:
+        return []
+
+    data = resp.json()
+    orig_json = resp.json
+
+    def _parsed_json(**kwargs):
+        if kwargs:
+            return orig_json(**kwargs)
+        return data
+
+    resp.json = _parsed_json
+    return extract_usernames_safely(data)
+
+
 # Dashboard input handler thread function - handles mode toggle and debug commands
 def dashboard_input_handler():
     # This toggles the dashboard mode for both the Terminal Dashboard and the Web-based dashboard
@@ -6516,6 +8792,76 @@ def print_status_summary():
     print("─" * HORIZONTAL_LINE)
 
 
+# Keeps the global last/next check times across all targets without rescanning them on every update
+# Next checks sit in a min-heap with lazy deletion: a target's newer entry supersedes the old one, which is only dropped
+# once it reaches the top. Last checks only ever move forward, so a running max is enough
+class CheckTimesIndex(object):
+    IN_PROGRESS = "In Progress"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._heap = []
+        self._live = {}
+        self._labels = {}
+        self._in_progress = set()
+        self._seq = 0
+        self.last_ts = None
+
+    # Records a finished check, keeping the latest timestamp seen
+    def set_last(self, ts):
+        with self._lock:
+            if self.last_ts is None or ts > self.last_ts:
+                self.last_ts = ts
+
+    # Records the next check of a target, either as a timestamp or as a label like "In Progress" / "Paused"
+    def set_next(self, user, ts=None, label=None):
+        with self._lock:
+            self._forget(user)
+            if ts:
+                self._seq += 1
+                self._live[user] = self._seq
+                heapq.heappush(self._heap, (ts, self._seq, user, label))
+            else:
+                self._set_label(user, label)
+
+    # Drops a target which is no longer monitored
+    def remove(self, user):
+        with self._lock:
+            self._forget(user)
+
+    def _forget(self, user):
+        self._live.pop(user, None)
+        self._labels.pop(user, None)
+        self._in_progress.discard(user)
+
+    def _set_label(self, user, label):
+        if label == self.IN_PROGRESS:
+            self._in_progress.add(user)
+        elif label and isinstance(label, str):
+            self._labels[user] = label
+
+    # Returns (earliest future next-check timestamp or None, whether any target is in progress, first other label or None)
+    # Entries which already passed turn into their display label, the same way a rescan of all targets would see them
+    def next_due(self, now_ts):
+        with self._lock:
+            while self._heap:
+                ts, seq, user, label = self._heap[0]
+                if self._live.get(user) != seq:
+                    heapq.heappop(self._heap)
+                    continue
+                if ts > now_ts:
+                    break
+                heapq.heappop(self._heap)
+                del self._live[user]
+                self._set_label(user, label)
+            earliest = self._heap[0][0] if self._heap else None
+            first_label = next(iter(self._labels.values()), None)
+            return earliest, bool(self._in_progress), first_label
+
+
+CHECK_TIMES_INDEX = CheckTimesIndex()
+
+
 # Update global tracking for last/next check times
 
 def update_check_times(last_time=None, next_time=None, user=None, increment_count=True):
@@ -6550,6 +8896,11 @@ def update_check_times(last_time=None, next_time=None, user=None, increment_coun
             if next_time:
                 WEB_DASHBOARD_DATA['targets'][user]['next_check'] = next_str
                 WEB_DASHBOARD_DATA['targets'][user]['next_check_ts'] = next_ts
+            WEB_DASHBOARD_CHANGES.publish('target', user)
+            WEB_DASHBOARD_SNAPSHOTS.get(user, WEB_DASHBOARD_DATA['targets'][user])
+
+        if next_time:
+            CHECK_TIMES_INDEX.set_next(user, next_ts, next_str)
 
         # Update Terminal Dashboard target data
         if 'targets' not in DASHBOARD_DATA:
@@ -6571,39 +8922,16 @@ def update_check_times(last_time=None, next_time=None, user=None, increment_coun
     if isinstance(NEXT_CHECK_TIME, (int, float)) and NEXT_CHECK_TIME <= now_ts:
         NEXT_CHECK_TIME = None
 
-    # Recalculate Global LAST_CHECK_TIME
-    all_lasts = []
-    # Use WEB_DASHBOARD_DATA as source for aggregation
-    with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
-        for t_data in WEB_DASHBOARD_DATA.get('targets', {}).values():
-            ts = t_data.get('last_checked_ts')
-            if ts:
-                all_lasts.append(ts)
-    if all_lasts:
-        LAST_CHECK_TIME = max(all_lasts)
-    elif last_time:
-        LAST_CHECK_TIME = last_time.timestamp()
-
-    # Recalculate Global NEXT_CHECK_TIME
-    all_nexts = []
-    all_next_labels = []
-    any_in_progress = False
-    with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
-        for t_data in WEB_DASHBOARD_DATA.get('targets', {}).values():
-            ts = t_data.get('next_check_ts')
-            # Only consider future check times for global "Next Check"
-            if ts and ts > now_ts:
-                all_nexts.append(ts)
-            else:
-                label = t_data.get('next_check')
-                if label and isinstance(label, str):
-                    if label == "In Progress":
-                        any_in_progress = True
-                    else:
-                        all_next_labels.append(label)
+    # Recalculate global times from the index instead of scanning every target
+    if last_time:
+        CHECK_TIMES_INDEX.set_last(last_time.timestamp())
+    if CHECK_TIMES_INDEX.last_ts:
+        LAST_CHECK_TIME = CHECK_TIMES_INDEX.last_ts
+
+    earliest_next, any_in_progress, first_label = CHECK_TIMES_INDEX.next_due(now_ts)
 
-    if all_nexts:
-        NEXT_CHECK_TIME = min(all_nexts)
+    if earliest_next:
+        NEXT_CHECK_TIME = earliest_next
         NEXT_CHECK_DISPLAY = get_squeezed_date_from_ts(NEXT_CHECK_TIME, show_seconds=DASHBOARD_SHOW_CHECK_SECONDS)
     elif next_time and not isinstance(next_time, str):
         if next_time.timestamp() > now_ts:
@@ -6622,9 +8950,9 @@ def update_check_times(last_time=None, next_time=None, user=None, increment_coun
             NEXT_CHECK_DISPLAY = next_time
         elif any_in_progress:
             NEXT_CHECK_DISPLAY = "In Progress"
-        elif all_next_labels:
+        elif first_label:
             # Use the first informative label (they should all be equivalent in practice)
-            NEXT_CHECK_DISPLAY = all_next_labels[0]
+            NEXT_CHECK_DISPLAY = first_label
         else:
             NEXT_CHECK_DISPLAY = None
 
@@ -6779,13 +9107,13 @@ def generate_user_dashboard(target_data):
     table = generate_dashboard_targets_table(display_target_data)
 
     # Activity Log Panel (Latest at bottom)
-    activities = DASHBOARD_DATA.get('activities', [])
+    activities = DASHBOARD_ACTIVITY.latest(10)
     log_text = Text()
     if not activities:
         log_text.append("Waiting for activity...", style="dim italic")
     else:
         # Show last 10 activities, latest at bottom
-        for act in reversed(activities[:10]):
+        for act in reversed(activities):
             log_text.append(f"{act['time']} ", style="dim")
             log_text.append(f"{act['message']}\n")
 
@@ -7018,12 +9346,12 @@ def generate_config_dashboard(target_data, config_data):
     ua_panel = Panel(ua_text, title="Environment Details", box=box.ROUNDED, border_style="magenta", expand=True)
 
     # Activity Log Panel (Latest at bottom)
-    activities = DASHBOARD_DATA.get('activities', [])
+    activities = DASHBOARD_ACTIVITY.latest(8)
     log_text = Text()
     if not activities:
         log_text.append("Waiting for activity...", style="dim italic")
     else:
-        for act in reversed(activities[:8]):
+        for act in reversed(activities):
             log_text.append(f"{act['time']} ", style="dim")
             log_text.append(f"{act['message']}\n")
     log_panel = Panel(log_text, title="Live Activity Log", box=box.ROUNDED, border_style="yellow")
@@ -7421,32 +9749,10 @@ def close_pbar():
                         clean_final = ANSI_ESCAPE_RE.sub("", final_str).expandtabs(8) + "\n"
                         # debug_print(f"[close_pbar] clean_final: {clean_final.strip()}")
 
-                        with STDOUT_LOCK:
-                            if logger_instance.main_log:
-                                debug_print(f"[close_pbar] Writing to main_log")
-                                logger_instance.main_log.write(clean_final)
-                                logger_instance.main_log.flush()
-                            else:
-                                debug_print(f"[close_pbar] main_log is None")
-
-                            target = logger_instance._get_current_target()
-                            debug_print(f"[close_pbar] target: {target}, target_paths: {list(logger_instance.target_paths.keys())}")
-                            if target:
-                                handle = logger_instance._ensure_log_open(target)
-                                if handle:
-                                    debug_print(f"[close_pbar] Writing to target log for {target}")
-                                    handle.write(clean_final)
-                                    handle.flush()
-                                else:
-                                    debug_print(f"[close_pbar] Failed to open handle for {target}")
-                            else:
-                                # Common message (e.g. from MainThread): log to ALL target logs, matching Logger.write behavior
-                                debug_print(f"[close_pbar] No target, writing to all logs")
-                                for t in list(logger_instance.target_paths.keys()):
-                                    handle = logger_instance._ensure_log_open(t)
-                                    if handle:
-                                        handle.write(clean_final)
-                                        handle.flush()
+                        # Goes through the Logger queue so it stays in order with the lines printed before it
+                        target = logger_instance._get_current_target()
+                        debug_print(f"[close_pbar] Queuing final state for {target or 'all logs'}")
+                        logger_instance._queue_log(target, clean_final)
                 except Exception as e:
                     debug_print(f"[close_pbar] error while writing final progress state to logs: {e}")
 
@@ -7557,8 +9863,8 @@ def instagram_wrap_request(orig_request):
             user_list = []
             if resp.status_code == 200 and resp.headers.get('content-type', '').startswith('application/json'):
                 try:
-                    # Extract usernames from JSON response
-                    user_list = extract_usernames_safely(resp.json())
+                    # Extract usernames from JSON response, sharing the decoded body with Instaloader
+                    user_list = extract_usernames_from_response(resp)
 
                     # Only count requests that actually returned follower/following data
                     if user_list:
@@ -7633,13 +9939,86 @@ def instagram_wrap_request(orig_request):
                 thread_pbar.unit = stats_string
                 thread_pbar.update(increment)
 
-        if MULTI_TARGET_SERIALIZE_HTTP:
+        # With the rate limiter the budget is enforced per actual send, so requests are not serialized here
+        if MULTI_TARGET_SERIALIZE_HTTP and not rate_limit_active():
             with HTTP_SERIAL_LOCK:
                 return _do_request()
         return _do_request()
     return wrapper
 
 
+# Returns the rate-limit endpoint class of a URL ('graphql', 'iphone', 'cdn' or 'web'), None for non-Instagram hosts
+def classify_instagram_url(url) -> Optional[str]:
+    from urllib.parse import urlparse
+    try:
+        parsed = urlparse(str(url or ""))
+    except Exception:
+        return None
+    host = (parsed.hostname or "").lower()
+    path = parsed.path or ""
+    if host.endswith("cdninstagram.com") or host.endswith("fbcdn.net"):
+        return "cdn"
+    if host != "instagram.com" and not host.endswith(".instagram.com"):
+        return None
+    if "graphql" in path:
+        return "graphql"
+    if host == "i.instagram.com" or path.startswith("/api/v1/"):
+        return "iphone"
+    return "web"
+
+
+# Token-bucket limiter for Instagram requests: one bucket per endpoint class plus a global budget shared by all targets
+# Callers reserve a token up front and sleep outside the lock, so concurrency is bounded by the budget, not a mutex
+class RequestRateLimiter(object):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}  # name -> [rate per second, burst, tokens, last refill ts]
+
+    # Takes one token from the named bucket and returns how long the caller must wait for it (lock held)
+    def _take(self, name, per_min, now) -> float:
+        if not per_min or per_min <= 0:
+            return 0.0
+        rate = per_min / 60.0
+        burst = max(1, int(RATE_LIMIT_BURST or 1))
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            bucket = [rate, burst, float(burst), now]
+            self._buckets[name] = bucket
+        elif bucket[0] != rate or bucket[1] != burst:
+            # Settings changed via config reload or dashboard, keep outstanding reservations
+            bucket[0], bucket[1], bucket[2] = rate, burst, min(bucket[2], float(burst))
+        bucket[2] = min(float(burst), bucket[2] + (now - bucket[3]) * rate)
+        bucket[3] = now
+        bucket[2] -= 1
+        return 0.0 if bucket[2] >= 0 else -bucket[2] / rate
+
+    # Blocks until the request to url fits into the budget, returns the time waited in seconds
+    def acquire(self, url) -> float:
+        endpoint = classify_instagram_url(url)
+        if endpoint is None:
+            return 0.0
+        limits = {"graphql": RATE_LIMIT_GRAPHQL_PER_MIN, "iphone": RATE_LIMIT_IPHONE_PER_MIN, "cdn": RATE_LIMIT_CDN_PER_MIN}
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._take("global", RATE_LIMIT_GLOBAL_PER_MIN, now), self._take(endpoint, limits.get(endpoint, 0), now))
+        if wait > 0:
+            if DEBUG_MODE:
+                debug_print(f"Rate limit: waiting {wait:.1f}s for {endpoint} request")
+            elif JITTER_VERBOSE:
+                print(f"* Rate limit: waiting {wait:.1f}s for {endpoint} request")
+            time.sleep(wait)
+        return wait
+
+
+REQUEST_RATE_LIMITER = RequestRateLimiter()
+
+
+# Returns True if requests go through the rate limiter: it is enabled and more than one target is monitored
+# A single target keeps the unthrottled behavior of older versions
+def rate_limit_active() -> bool:
+    return bool(RATE_LIMIT_ENABLED) and len(DASHBOARD_DATA.get('targets_list', [])) > 1
+
+
 # Monkey-patches Instagram prepared-request send to add human-like jitter
 def instagram_wrap_send(orig_send):
     @wraps(orig_send)
@@ -7660,6 +10039,9 @@ def instagram_wrap_send(orig_send):
                 time.sleep(random.uniform(0.8, 3.0))
             return orig_send(*args, **kwargs)
 
+        if rate_limit_active():
+            REQUEST_RATE_LIMITER.acquire(url)
+            return _do_send()
         if MULTI_TARGET_SERIALIZE_HTTP:
             with HTTP_SERIAL_LOCK:
                 return _do_send()
@@ -7680,8 +10062,44 @@ def ensure_requests_monkey_patched():
         REQUESTS_PATCHED = True
 
 
+# Cached result of argument-less get_dashboard_config_data() calls, rebuilt after invalidate_dashboard_config_cache()
+# max_age bounds how long a change made outside the known settings paths can stay unnoticed
+DASHBOARD_CONFIG_CACHE = {"version": 0, "built_version": -1, "built_at": 0.0, "data": None, "max_age": 30}
+DASHBOARD_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+# Marks the cached dashboard config snapshot as stale, call it whenever a setting shown on the dashboards changes
+def invalidate_dashboard_config_cache():
+    with DASHBOARD_CONFIG_CACHE_LOCK:
+        DASHBOARD_CONFIG_CACHE["version"] += 1
+
+
 # Returns a dictionary containing all current configuration settings
+# Calls without arguments (the per-check hot path) share a cached snapshot, calls with arguments always rebuild it
 def get_dashboard_config_data(final_log_path=None, imgcat_exe=None, profile_pic_file_exists=None, cfg_path=None, env_path=None, check_interval_low=None, targets=None):
+    args = (final_log_path, imgcat_exe, profile_pic_file_exists, cfg_path, env_path, check_interval_low, targets)
+    if any(arg is not None for arg in args):
+        return build_dashboard_config_data(*args)
+
+    cache = DASHBOARD_CONFIG_CACHE
+    now = time.monotonic()
+    with DASHBOARD_CONFIG_CACHE_LOCK:
+        if cache["data"] is not None and cache["built_version"] == cache["version"] and now - cache["built_at"] < cache["max_age"]:
+            return dict(cache["data"])
+        version = cache["version"]
+
+    data = build_dashboard_config_data()
+    with DASHBOARD_CONFIG_CACHE_LOCK:
+        # Only keep the snapshot if no setting changed while it was being built
+        if cache["version"] == version:
+            cache["data"] = data
+            cache["built_version"] = version
+            cache["built_at"] = now
+    return dict(data)
+
+
+# Builds the dictionary of current configuration settings shown on the dashboards
+def build_dashboard_config_data(final_log_path=None, imgcat_exe=None, profile_pic_file_exists=None, cfg_path=None, env_path=None, check_interval_low=None, targets=None):
     # Prepare hours/ranges string
     hours_ranges_str = ""
     if CHECK_POSTS_IN_HOURS_RANGE:
@@ -8085,7 +10503,8 @@ def simulate_human_actions(bot: instaloader.Instaloader, sleep_seconds: int) ->
     # View your own profile
     if ctx.is_logged_in and random.random() < prob:
         try:
-            _ = instaloader.Profile.own_profile(ctx)
+            # A real view, which also refreshes the cached own profile
+            _ = OWN_PROFILE_CACHE.profile(ctx, refresh=True)
             if DEBUG_MODE:
                 debug_print("BeHuman #2: viewed own profile OK")
             elif BE_HUMAN_VERBOSE:
@@ -8126,8 +10545,7 @@ def simulate_human_actions(bot: instaloader.Instaloader, sleep_seconds: int) ->
     # Visit a random followee profile
     if ctx.is_logged_in and random.random() < prob / 2:
         try:
-            me = instaloader.Profile.own_profile(ctx)
-            followees = list(me.get_followees())
+            followees = OWN_PROFILE_CACHE.followees_sample(ctx)
             if not followees:
                 if DEBUG_MODE:
                     debug_print("BeHuman #4 warning: you follow 0 accounts, skipping visit")
@@ -8135,11 +10553,11 @@ def simulate_human_actions(bot: instaloader.Instaloader, sleep_seconds: int) ->
                     print("* BeHuman #4 warning: you follow 0 accounts, skipping visit")
             else:
                 someone = random.choice(followees)
-                _ = profile_from_username_resilient(bot, someone.username)
+                _ = profile_from_username_resilient(bot, someone)
                 if DEBUG_MODE:
-                    debug_print(f"BeHuman #4: visited followee {someone.username} OK")
+                    debug_print(f"BeHuman #4: visited followee {someone} OK")
                 elif BE_HUMAN_VERBOSE:
-                    print(f"* BeHuman #4: visited followee {someone.username} OK")
+                    print(f"* BeHuman #4: visited followee {someone} OK")
                 time.sleep(random.uniform(2, 5))
         except Exception as e:
             if "429" in str(e) or "checkpoint" in str(e) or "challenge" in str(e):
@@ -8269,6 +10687,124 @@ def fetch_usernames_paginated(bot, get_generator_fn, max_per_batch, total_limit,
     return results
 
 
+# Returns True when the periodic full follower / following scan is due
+def follow_full_scan_due(last_full_scan_ts):
+    if not last_full_scan_ts:
+        return True
+    return FOLLOW_INCREMENTAL_FULL_SCAN_INTERVAL > 0 and time.time() - last_full_scan_ts >= FOLLOW_INCREMENTAL_FULL_SCAN_INTERVAL
+
+
+# Fetches a follower / following list, stopping early once the newest-first listing runs into the saved baseline
+# Paging stops after FOLLOW_INCREMENTAL_MATCH_RUN consecutive usernames match a contiguous run of the baseline; the
+# unread tail is then taken from the baseline and verified against the reported count, a mismatch triggers a full scan
+# Returns (usernames, incremental) where incremental is False whenever a full scan was performed
+def fetch_usernames_incremental(bot, get_generator_fn, max_per_batch, total_limit, fetch_delay, advanced_fetch, estimated_limit, user, stop_event=None, baseline=None, expected_count=None, baseline_count=None, full_scan_due=True):
+    match_run = FOLLOW_INCREMENTAL_MATCH_RUN
+    use_incremental = FOLLOW_INCREMENTAL_FETCH and not full_scan_due and baseline and match_run > 0 and len(baseline) >= match_run and expected_count is not None and not (advanced_fetch and total_limit)
+
+    def full_scan():
+        return fetch_usernames_paginated(bot, get_generator_fn, max_per_batch, total_limit, fetch_delay, advanced_fetch, estimated_limit, user, stop_event=stop_event)
+
+    if not use_incremental:
+        return full_scan(), False
+
+    baseline_index = {}
+    for i, username in enumerate(baseline):
+        baseline_index.setdefault(username, i)
+    state = {"run": 0, "next": -1, "tail_start": None}
+
+    # Wraps the instaloader generator so it ends once the run of matching usernames is long enough
+    def generator_until_known_run():
+        for f in get_generator_fn():
+            i = baseline_index.get(f.username)
+            if i is None:
+                state["run"] = 0
+            elif state["run"] and i == state["next"]:
+                state["run"] += 1
+            else:
+                state["run"] = 1
+            state["next"] = i + 1 if i is not None else -1
+            yield f
+            if state["run"] >= match_run:
+                state["tail_start"] = state["next"]
+                return
+
+    fetched = fetch_usernames_paginated(bot, generator_until_known_run, max_per_batch, total_limit, fetch_delay, advanced_fetch, estimated_limit, user, stop_event=stop_event)
+
+    if state["tail_start"] is None:
+        # Generator ran out (or was stopped) before reaching a known run, so the listing is already complete
+        return fetched, False
+
+    fetched_set = set(fetched)
+    usernames = fetched + [u for u in baseline[state["tail_start"]:] if u not in fetched_set]
+
+    # Reported counts often differ from the real list length, so the check is that this offset did not change since the baseline was saved
+    offset = baseline_count - len(baseline) if baseline_count is not None else 0
+    if expected_count - len(usernames) != offset:
+        msg = f"Incremental fetch found {len(usernames)} accounts but {expected_count} are reported (offset at last scan: {offset}), running full scan"
+        print(f"* {msg}")
+        log_activity(msg, user=user)
+        return full_scan(), False
+
+    debug_print(f"* Incremental fetch: {len(fetched)} fetched, {len(usernames) - len(fetched)} reused from baseline")
+    return usernames, True
+
+
+STATE_CHECKPOINT_VERSION = 1
+
+
+# Returns the key a state checkpoint is tied to: the configured session user, or '' for anonymous monitoring
+def state_checkpoint_session_key(skip_session):
+    return "" if skip_session else (SESSION_USERNAME or "")
+
+
+# Writes a target's state checkpoint atomically, so a crash mid-write leaves the previous checkpoint intact
+def save_state_checkpoint(path, state):
+    try:
+        state = dict(state, version=STATE_CHECKPOINT_VERSION, saved_at=int(time.time()))
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".state.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding="utf-8") as f:
+                json.dump(state, f, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    except Exception as e:
+        debug_print(f"Cannot save state checkpoint to '{path}': {e}")
+
+
+# Returns a target's state checkpoint if a warm restart may resume from it, otherwise None
+# It must match the target and session key, be younger than STATE_CHECKPOINT_MAX_AGE and (when profile picture
+# detection is on) agree with the digest of the profile picture currently saved on disk
+def load_state_checkpoint(path, user, session_key, profile_pic_file=None):
+    if not STATE_CHECKPOINT_ENABLED or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'r', encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        debug_print(f"Cannot load state checkpoint from '{path}': {e}")
+        return None
+    if not isinstance(state, dict) or state.get("version") != STATE_CHECKPOINT_VERSION or state.get("user") != user:
+        return None
+    if state.get("session_key") != session_key:
+        return None
+    age = time.time() - (state.get("saved_at") or 0)
+    if STATE_CHECKPOINT_MAX_AGE and not 0 <= age <= STATE_CHECKPOINT_MAX_AGE:
+        return None
+    if DETECT_CHANGED_PROFILE_PIC and profile_pic_file:
+        meta = read_profile_pic_meta(profile_pic_file)
+        if (meta or {}).get("sha256") != state.get("profile_pic_sha256"):
+            return None
+    return state
+
+
 # Monitors activity of the specified Instagram user
 def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, skip_followings, skip_getting_story_details, skip_getting_posts_details, get_more_post_details, wait_for_prev_user=None, signal_loading_complete=None, stop_event=None, user_root_path=None, manual_recheck=False, skip_follow_changes=False):  # type: ignore[reportComplexity]
     global pbar, DASHBOARD_DATA, VERBOSE_MODE, CHECK_COUNT, NEXT_CHECK_TIME, NEXT_CHECK_DISPLAY
@@ -8306,35 +10842,46 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         images_dir = os.path.join(user_root_dir, "images")
         videos_dir = os.path.join(user_root_dir, "videos")
 
+    if user_root_path or OUTPUT_DIR:
+        insta_followers_file = os.path.join(json_dir, f"instagram_{user}_followers.json")
+        insta_followings_file = os.path.join(json_dir, f"instagram_{user}_followings.json")
+        profile_pic_file = os.path.join(images_dir, f"instagram_{user}_profile_pic.jpg")
+        profile_pic_file_old = os.path.join(images_dir, f"instagram_{user}_profile_pic_old.jpg")
+        profile_pic_file_tmp = os.path.join(images_dir, f"instagram_{user}_profile_pic_tmp.jpg")
+        state_checkpoint_file = os.path.join(json_dir, f"instagram_{user}_state.json")
+    else:
+        insta_followers_file = f"instagram_{user}_followers.json"
+        insta_followings_file = f"instagram_{user}_followings.json"
+        profile_pic_file = f"instagram_{user}_profile_pic.jpg"
+        profile_pic_file_old = f"instagram_{user}_profile_pic_old.jpg"
+        profile_pic_file_tmp = f"instagram_{user}_profile_pic_tmp.jpg"
+        state_checkpoint_file = f"instagram_{user}_state.json"
+
     followers_count = 0
     followings_count = 0
     r_sleep_time = 0
     followers_followings_fetched = False
     followers_baseline_available = False
     followings_baseline_available = False
+    followers_last_full_scan = 0
+    followings_last_full_scan = 0
     stories_count = 0
     stories_old_count = 0
     reels_count = 0
     bot = None
+    checkpoint = None
+    resumed = False
 
     try:
-        # Apply request monkey-patch for jitter or serialized HTTP mode even when no progress bar is created
-        if ENABLE_JITTER or MULTI_TARGET_SERIALIZE_HTTP:
+        # Apply request monkey-patch for jitter, rate limiting or serialized HTTP mode even when no progress bar is created
+        if ENABLE_JITTER or RATE_LIMIT_ENABLED or MULTI_TARGET_SERIALIZE_HTTP:
             ensure_requests_monkey_patched()
 
-        bot = instaloader.Instaloader(user_agent=USER_AGENT, iphone_support=True, quiet=True)
-
-        # Inject proxy and cert into Instaloader's session
-        if PROXY_ENABLED:
-            set_instaloader_proxies(bot)
-
-        ctx = bot.context
-
-        orig_request = ctx._session.request
+        # Borrow a pooled Instaloader (proxy and mobile user agent already applied) for the baseline
+        bot = INSTALOADER_POOL.acquire(user, skip_session)
 
-        session = ctx._session
-
-        if not skip_session and SESSION_USERNAME:
+        # Pooled instances already logged in as the session user skip the session file reload
+        if not skip_session and SESSION_USERNAME and not bot_has_session(bot):
             try:
                 # Session file is shared - avoid concurrent load/login/save in multi-target mode
                 with SESSION_FILE_LOCK:
@@ -8385,6 +10932,8 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                             log_activity("Session refresh detected, resuming setup...", user=user)
                             print(f"* Session refresh detected for {user}, resuming setup...")
                             print_cur_ts(newline=True)
+                            # Give the instance back so the retry borrows one matching the refreshed session
+                            INSTALOADER_POOL.release(user)
                             return instagram_monitor_user(user, csv_file_name, SKIP_SESSION, SKIP_FOLLOWERS, SKIP_FOLLOWINGS, SKIP_GETTING_STORY_DETAILS, SKIP_GETTING_POSTS_DETAILS, GET_MORE_POST_DETAILS, wait_for_prev_user, signal_loading_complete, stop_event, user_root_path, manual_recheck, skip_follow_changes=SKIP_FOLLOW_CHANGES)
 
                     if stop_event and stop_event.is_set():
@@ -8397,36 +10946,6 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     else:
                         return
 
-        patched = False
-
-        # Mobile user agent patch for instaloader
-        try:
-
-            for attr in ("iphone_headers", "_iphone_headers"):
-                if hasattr(ctx, attr):
-                    getattr(ctx, attr)["User-Agent"] = USER_AGENT_MOBILE
-                    patched = True
-                    break
-
-            if not patched:
-                if hasattr(ctx, 'get_iphone_json'):
-                    orig_get_iphone_json = ctx.get_iphone_json
-
-                    def _get_iphone_json(path, params, **kwargs):
-                        if '_extra_headers' in kwargs:
-                            kwargs['_extra_headers']['User-Agent'] = USER_AGENT_MOBILE
-                        else:
-                            kwargs['_extra_headers'] = {'User-Agent': USER_AGENT_MOBILE}
-                        return orig_get_iphone_json(path, params, **kwargs)
-
-                    ctx.get_iphone_json = _get_iphone_json
-                else:
-                    print("* Warning: Could not apply custom mobile user-agent patch (missing header attributes or get_iphone_json method)!")
-                    print("* Proceeding with the default Instaloader mobile user-agent")
-        except Exception as e:
-            print(f"* Warning: Could not apply custom mobile user-agent patch due to an unexpected error: {e}")
-            print("* Proceeding with the default Instaloader mobile user-agent")
-
         # If hour-range gating is enabled and we're currently outside allowed hours, wait until the next allowed window
         # before fetching any target data, manual rechecks (manual_override_active) bypass this gating
         if CHECK_POSTS_IN_HOURS_RANGE and not manual_override_active:
@@ -8448,102 +10967,117 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                         if HOURS_VERBOSE or DEBUG_MODE or (VERBOSE_MODE and CHECK_POSTS_IN_HOURS_RANGE):
                             sleep_message(sleep_s, user)
                         # Interruptible wait (stop/recheck aware) similar to the main sleep loop
-                        sleep_remaining = sleep_s
-                        while sleep_remaining > 0:
-                            if stop_event and stop_event.is_set():
+                        if stop_event:
+                            wait_result = wait_for_next_check(user, sleep_s, stop_event, bot)
+                            if wait_result == 'stop':
                                 return
                             # Allow Web Dashboard "recheck" to break the wait early (still hour-gated later)
-                            if WEB_DASHBOARD_ENABLED:
-                                with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
-                                    if user in WEB_DASHBOARD_RECHECK_EVENTS and WEB_DASHBOARD_RECHECK_EVENTS[user].is_set():
-                                        WEB_DASHBOARD_RECHECK_EVENTS[user].clear()
-                                        manual_recheck_active = True
-                                        manual_override_active = True
-                                        log_activity("Manual recheck requested (overriding hours range)", user=user, level='system')
-                                        update_ui_data(targets={user: {'status': 'Recheck requested'}})
-                                        break
-
-                            # Check for proxy changes from web dashboard
-                            refresh_proxy_if_needed(bot, user)
-
-                            wait_chunk = min(1, sleep_remaining)
-                            if stop_event:
-                                stop_event.wait(wait_chunk)
-                            else:
-                                time.sleep(wait_chunk)
-                            sleep_remaining -= wait_chunk
-
-        # Always print and log activity; Logger handles terminal suppression
-        _thread_local.in_partial_line = True
-        print("- loading profile from username...", end=" ", flush=True)
-        log_activity(f"Loading profile: {user}", user=user)
-        update_ui_data(targets={user: {'status': 'Loading Profile'}})
-
-        profile = profile_from_username_resilient(bot, user)
+                            if wait_result == 'recheck':
+                                manual_recheck_active = True
+                                manual_override_active = True
+                                log_activity("Manual recheck requested (overriding hours range)", user=user, level='system')
+                                update_ui_data(targets={user: {'status': 'Recheck requested'}})
+                        else:
+                            time.sleep(sleep_s)
+
+        # Warm restart: resume from the state checkpoint saved after the previous run's last check and skip the
+        # baseline requests (profile, reels, stories, own profile, profile picture, latest post / reel)
+        checkpoint = load_state_checkpoint(state_checkpoint_file, user, state_checkpoint_session_key(skip_session), profile_pic_file) if not manual_recheck else None
+        resumed = checkpoint is not None
+        if resumed:
+            assert checkpoint is not None
+            profile = None
+            insta_username = checkpoint.get("insta_username") or user
+            insta_userid = checkpoint.get("insta_userid")
+            followers_count = checkpoint.get("followers_count") or 0
+            followings_count = checkpoint.get("followings_count") or 0
+            bio = checkpoint.get("bio") or ""
+            is_private = bool(checkpoint.get("is_private"))
+            followed_by_viewer = bool(checkpoint.get("followed_by_viewer"))
+            can_view = (not is_private) or followed_by_viewer
+            posts_count = checkpoint.get("posts_count") or 0
+            reels_count = checkpoint.get("reels_count") or 0
+            has_story = bool(checkpoint.get("has_story"))
+            profile_image_url = None
+            session_username = checkpoint.get("session_username") if bot.context.is_logged_in else None
+            saved_at = datetime.fromtimestamp(checkpoint.get("saved_at") or 0)
+            print(f"- resuming from state checkpoint...  OK: {get_short_date_from_ts(saved_at, show_weekday=False)}")
+            log_activity(f"Resumed from state checkpoint ({calculate_timespan(datetime.now(), saved_at, show_seconds=False)} old)", user=user)
+            if session_username:
+                update_ui_data(targets={user: {'session': {'username': session_username, 'active': True}}})
+            print("─" * HORIZONTAL_LINE)
+        else:
+            # Always print and log activity; Logger handles terminal suppression
+            _thread_local.in_partial_line = True
+            print("- loading profile from username...", end=" ", flush=True)
+            log_activity(f"Loading profile: {user}", user=user)
+            update_ui_data(targets={user: {'status': 'Loading Profile'}})
 
-        time.sleep(NEXT_OPERATION_DELAY)
-        insta_username = profile.username
-        insta_userid = profile.userid
+            profile = profile_from_username_resilient(bot, user)
 
-        debug_print(f"Profile loaded: ID {insta_userid}")
-        debug_print(f"Metadata: followers={profile.followers}, followees={profile.followees}, posts={profile.mediacount}, private={profile.is_private}")
+            time.sleep(NEXT_OPERATION_DELAY)
+            insta_username = profile.username
+            insta_userid = profile.userid
 
-        print(f"     OK: {insta_username}")
-        _thread_local.in_partial_line = False
-        log_activity(f"Profile loaded: {insta_username}", user=user)
-
-        followers_count = profile.followers
-        followings_count = profile.followees
-        bio = profile.biography
-        is_private = profile.is_private
-        followed_by_viewer = profile.followed_by_viewer
-        can_view = (not is_private) or followed_by_viewer
-        posts_count = profile.mediacount
-        if not skip_session and can_view:
-            update_ui_data(targets={user: {'status': 'Fetching Reels'}})
-            _thread_local.in_partial_line = True
-            print("- fetching reels count...", end=" ", flush=True)
-            reels_count = get_total_reels_count(user, bot, skip_session)
+            debug_print(f"Profile loaded: ID {insta_userid}")
+            debug_print(f"Metadata: followers={profile.followers}, followees={profile.followees}, posts={profile.mediacount}, private={profile.is_private}")
 
-            print("              OK")
+            print(f"     OK: {insta_username}")
             _thread_local.in_partial_line = False
-            log_activity(f"Reels count fetched: {reels_count}", user=user)
+            log_activity(f"Profile loaded: {insta_username}", user=user)
 
-        if not is_private:
-            if bot.context.is_logged_in:
-                has_story = profile.has_public_story
+            followers_count = profile.followers
+            followings_count = profile.followees
+            bio = profile.biography
+            is_private = profile.is_private
+            followed_by_viewer = profile.followed_by_viewer
+            can_view = (not is_private) or followed_by_viewer
+            posts_count = profile.mediacount
+            if not skip_session and can_view:
+                update_ui_data(targets={user: {'status': 'Fetching Reels'}})
+                _thread_local.in_partial_line = True
+                print("- fetching reels count...", end=" ", flush=True)
+                reels_count = get_total_reels_count(user, bot, skip_session)
+
+                print("              OK")
+                _thread_local.in_partial_line = False
+                log_activity(f"Reels count fetched: {reels_count}", user=user)
+
+            if not is_private:
+                if bot.context.is_logged_in:
+                    has_story = profile.has_public_story
+                else:
+                    has_story = False
+            elif bot.context.is_logged_in and followed_by_viewer:
+                _thread_local.in_partial_line = True
+                print("- checking for stories...", end=" ", flush=True)
+                update_ui_data(targets={user: {'status': 'Checking Stories'}})
+                story = STORY_POLLER.story(bot, user, insta_userid)
+                has_story = bool(story and story.itemcount)
+
+                print("              OK")
+                _thread_local.in_partial_line = False
+                log_activity("Checked for stories", user=user)
             else:
                 has_story = False
-        elif bot.context.is_logged_in and followed_by_viewer:
-            _thread_local.in_partial_line = True
-            print("- checking for stories...", end=" ", flush=True)
-            update_ui_data(targets={user: {'status': 'Checking Stories'}})
-            story = next(bot.get_stories(userids=[insta_userid]), None)
-            has_story = bool(story and story.itemcount)
-
-            print("              OK")
-            _thread_local.in_partial_line = False
-            log_activity("Checked for stories", user=user)
-        else:
-            has_story = False
 
-        profile_image_url = profile.profile_pic_url_no_iphone
+            profile_image_url = profile.profile_pic_url_no_iphone
 
-        if bot.context.is_logged_in:
-            # Always print and log activity; Logger handles terminal suppression
-            _thread_local.in_partial_line = True
-            print("- loading own profile...", end=" ", flush=True)
-            me = instaloader.Profile.own_profile(bot.context)
-            session_username = me.username
-            print(f"               OK: {session_username}")
-            _thread_local.in_partial_line = False
-            log_activity(f"Session user loaded: {session_username}")
-            update_ui_data(targets={user: {'session': {'username': session_username, 'active': True}}})
+            if bot.context.is_logged_in:
+                # Always print and log activity; Logger handles terminal suppression
+                _thread_local.in_partial_line = True
+                print("- loading own profile...", end=" ", flush=True)
+                me = OWN_PROFILE_CACHE.profile(bot.context)
+                session_username = me.username
+                print(f"               OK: {session_username}")
+                _thread_local.in_partial_line = False
+                log_activity(f"Session user loaded: {session_username}")
+                update_ui_data(targets={user: {'session': {'username': session_username, 'active': True}}})
 
-        print("─" * HORIZONTAL_LINE)
+            print("─" * HORIZONTAL_LINE)
 
-        if not bot.context.is_logged_in:
-            session_username = None
+            if not bot.context.is_logged_in:
+                session_username = None
 
     except Exception as e:
         _thread_local.in_partial_line = False
@@ -8601,6 +11135,9 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                         skip_getting_posts_details = SKIP_GETTING_POSTS_DETAILS
                         get_more_post_details = GET_MORE_POST_DETAILS
 
+                        # Give the instance back so the retry borrows one matching the refreshed session
+                        INSTALOADER_POOL.release(user)
+
                         # Re-run the function from the beginning to reset state with new settings
                         return instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, skip_followings, skip_getting_story_details, skip_getting_posts_details, get_more_post_details, wait_for_prev_user, signal_loading_complete, stop_event, user_root_path, manual_recheck)
 
@@ -8684,38 +11221,28 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
     update_ui_data(targets={user: target_data_unified}, config=config_data)
 
-    if user_root_path or OUTPUT_DIR:
-        insta_followers_file = os.path.join(json_dir, f"instagram_{user}_followers.json")
-        insta_followings_file = os.path.join(json_dir, f"instagram_{user}_followings.json")
-        profile_pic_file = os.path.join(images_dir, f"instagram_{user}_profile_pic.jpg")
-        profile_pic_file_old = os.path.join(images_dir, f"instagram_{user}_profile_pic_old.jpg")
-        profile_pic_file_tmp = os.path.join(images_dir, f"instagram_{user}_profile_pic_tmp.jpg")
-    else:
-        insta_followers_file = f"instagram_{user}_followers.json"
-        insta_followings_file = f"instagram_{user}_followings.json"
-        profile_pic_file = f"instagram_{user}_profile_pic.jpg"
-        profile_pic_file_old = f"instagram_{user}_profile_pic_old.jpg"
-        profile_pic_file_tmp = f"instagram_{user}_profile_pic_tmp.jpg"
     followers = []
     followings = []
     followers_old = followers
     followings_old = followings
     followers_read = []
     followings_read = []
+    followers_store = FollowSnapshotStore(insta_followers_file)
+    followings_store = FollowSnapshotStore(insta_followings_file)
+    FOLLOW_SNAPSHOT_STORES[user] = {'followers': followers_store, 'followings': followings_store}
 
     if os.path.isfile(insta_followers_file):
         try:
-            with open(insta_followers_file, 'r', encoding="utf-8") as f:
-                followers_read = json.load(f)
+            followers_read = followers_store.load()
         except Exception as e:
             print(f"* Cannot load followers list from '{insta_followers_file}' file: {e}")
         if followers_read:
             followers_old_count = followers_read[0]
             followers_old = followers_read[1]
             followers_baseline_available = True
-            if followers_count == followers_old_count:
+            if followers_count == followers_old_count or resumed:
                 followers = followers_old
-            followers_mdate = datetime.fromtimestamp(int(os.path.getmtime(insta_followers_file)), pytz.timezone(LOCAL_TIMEZONE))
+            followers_mdate = followers_store.last_modified()
             update_ui_data(targets={user: {'status': 'Loading Followers'}})
 
             if FOLLOWERS_CHURN_DETECTION:
@@ -8742,11 +11269,12 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         if not skip_follow_changes:
             try:
                 if csv_file_name:
-                    write_csv_entry(csv_file_name, now_local_naive(), "Followers Count", followers_old_count, followers_count)
+                    write_csv_entry(csv_file_name, now_local_naive(), "Followers Count", followers_old_count, followers_count, target=user)
             except Exception as e:
                 print(f"* Error: {e}")
 
-    if ((followers_count != followers_old_count) or (followers_count > 0 and not followers) or FOLLOWERS_CHURN_DETECTION) and not skip_session and not skip_followers and can_view:
+    # A warm restart keeps the saved list as its baseline, the first check fetches again if the count changed
+    if ((followers_count != followers_old_count) or (followers_count > 0 and not followers) or FOLLOWERS_CHURN_DETECTION) and not skip_session and not skip_followers and can_view and not resumed:
         # Fetch followers if count changed, list is empty or detailed logging is enabled
         if FOLLOWERS_CHURN_DETECTION and followers_count > 5000:
             warning = f"High follower count ({followers_count})! This may increase rate limit risk with detailed logging."
@@ -8761,7 +11289,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
             setup_pbar(total_expected=follower_limit, title="* Downloading Followers")
             start_time_dl = time.time()
             _thread_local.FETCH_TYPE = 'follower'
-            followers = fetch_usernames_paginated(
+            followers, followers_incremental = fetch_usernames_incremental(
                 bot,
                 get_generator_fn=lambda: profile.get_followers(),
                 max_per_batch=FOLLOWERS_PER_BATCH,
@@ -8771,7 +11299,13 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 estimated_limit=follower_limit,
                 user=user,
                 stop_event=stop_event,
+                baseline=followers_old,
+                expected_count=followers_count,
+                baseline_count=followers_old_count,
+                full_scan_due=follow_full_scan_due(followers_last_full_scan),
             )
+            if not followers_incremental:
+                followers_last_full_scan = time.time()
             _thread_local.FETCH_TYPE = None
             end_time_dl = time.time()
             close_pbar()
@@ -8792,17 +11326,12 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         if not followers and followers_count > 0:
             print("* Empty followers list returned, not saved to file")
         else:
-            followers_to_save = []
-            followers_to_save.append(followers_count)
-            followers_to_save.append(followers)
             try:
-                os.makedirs(os.path.dirname(os.path.abspath(insta_followers_file)), exist_ok=True)
-                with open(insta_followers_file, 'w', encoding="utf-8") as f:
-                    json.dump(followers_to_save, f, indent=2)
-                    if FOLLOWERS_CHURN_DETECTION:
-                        print(f"* Followers ({len(followers)}) saved to file '{insta_followers_file}'")
-                    else:
-                        print(f"* Followers ({followers_count}) actual ({len(followers)}) saved to file '{insta_followers_file}'")
+                followers_store.save(followers_count, followers)
+                if FOLLOWERS_CHURN_DETECTION:
+                    print(f"* Followers ({len(followers)}) saved to file '{insta_followers_file}'")
+                else:
+                    print(f"* Followers ({followers_count}) actual ({len(followers)}) saved to file '{insta_followers_file}'")
             except Exception as e:
                 print(f"* Cannot save list of followers to '{insta_followers_file}' file: {e}")
 
@@ -8855,17 +11384,16 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
     if os.path.isfile(insta_followings_file):
         try:
-            with open(insta_followings_file, 'r', encoding="utf-8") as f:
-                followings_read = json.load(f)
+            followings_read = followings_store.load()
         except Exception as e:
             print(f"* Cannot load followings list from '{insta_followings_file}' file: {e}")
         if followings_read:
             followings_old_count = followings_read[0]
             followings_old = followings_read[1]
             followings_baseline_available = True
-            if followings_count == followings_old_count:
+            if followings_count == followings_old_count or resumed:
                 followings = followings_old
-            following_mdate = datetime.fromtimestamp(int(os.path.getmtime(insta_followings_file)), pytz.timezone(LOCAL_TIMEZONE))
+            following_mdate = followings_store.last_modified()
             update_ui_data(targets={user: {'status': 'Loading Followings'}})
 
             if FOLLOWERS_CHURN_DETECTION:
@@ -8891,11 +11419,11 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         if not skip_follow_changes:
             try:
                 if csv_file_name:
-                    write_csv_entry(csv_file_name, now_local_naive(), "Followings Count", followings_old_count, followings_count)
+                    write_csv_entry(csv_file_name, now_local_naive(), "Followings Count", followings_old_count, followings_count, target=user)
             except Exception as e:
                 print(f"* Error: {e}")
 
-    if ((followings_count != followings_old_count) or (followings_count > 0 and not followings) or FOLLOWERS_CHURN_DETECTION) and not skip_session and not skip_followings and can_view:
+    if ((followings_count != followings_old_count) or (followings_count > 0 and not followings) or FOLLOWERS_CHURN_DETECTION) and not skip_session and not skip_followings and can_view and not resumed:
         # Fetch followings if count changed, list is empty or detailed logging is enabled
         if FOLLOWERS_CHURN_DETECTION and followings_count > 5000:
             warning = f"High following count ({followings_count})! This may increase rate limit risk with detailed logging."
@@ -8910,7 +11438,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
             setup_pbar(total_expected=followee_limit, title="* Downloading Followings")
             start_time_dl = time.time()
             _thread_local.FETCH_TYPE = 'followee'
-            followings = fetch_usernames_paginated(
+            followings, followings_incremental = fetch_usernames_incremental(
                 bot,
                 get_generator_fn=lambda: profile.get_followees(),
                 max_per_batch=FOLLOWEES_PER_BATCH,
@@ -8920,7 +11448,13 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 estimated_limit=followee_limit,
                 user=user,
                 stop_event=stop_event,
+                baseline=followings_old,
+                expected_count=followings_count,
+                baseline_count=followings_old_count,
+                full_scan_due=follow_full_scan_due(followings_last_full_scan),
             )
+            if not followings_incremental:
+                followings_last_full_scan = time.time()
             _thread_local.FETCH_TYPE = None
             end_time_dl = time.time()
             close_pbar()
@@ -8941,17 +11475,12 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         if not followings and followings_count > 0:
             print("* Empty followings list returned, not saved to file")
         else:
-            followings_to_save = []
-            followings_to_save.append(followings_count)
-            followings_to_save.append(followings)
             try:
-                os.makedirs(os.path.dirname(os.path.abspath(insta_followings_file)), exist_ok=True)
-                with open(insta_followings_file, 'w', encoding="utf-8") as f:
-                    json.dump(followings_to_save, f, indent=2)
-                    if FOLLOWERS_CHURN_DETECTION:
-                        print(f"* Followings ({len(followings)}) saved to file '{insta_followings_file}'")
-                    else:
-                        print(f"* Followings ({followings_count}) actual ({len(followings)}) saved to file '{insta_followings_file}'")
+                followings_store.save(followings_count, followings)
+                if FOLLOWERS_CHURN_DETECTION:
+                    print(f"* Followings ({len(followings)}) saved to file '{insta_followings_file}'")
+                else:
+                    print(f"* Followings ({followings_count}) actual ({len(followings)}) saved to file '{insta_followings_file}'")
             except Exception as e:
                 print(f"* Cannot save list of followings to '{insta_followings_file}' file: {e}")
 
@@ -9020,9 +11549,9 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         if FOLLOWERS_CHURN_DETECTION:
             update_ui_data(targets={user: {'followers': len(followers) if followers else followers_count, 'following': len(followings) if followings else followings_count}})
 
-    # Profile pic
+    # Profile pic (a warm restart already matched the saved picture's digest with the checkpoint)
 
-    if DETECT_CHANGED_PROFILE_PIC:
+    if DETECT_CHANGED_PROFILE_PIC and not resumed:
 
         try:
             detect_changed_profile_picture(user, profile_image_url, profile_pic_file, profile_pic_file_tmp, profile_pic_file_old, PROFILE_PIC_FILE_EMPTY, csv_file_name, r_sleep_time, False, 1)
@@ -9032,14 +11561,27 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
     # Stories
 
     processed_stories_list = []
-    if has_story:
+    if resumed:
+        assert checkpoint is not None
+        story_flag = bool(checkpoint.get("story_flag"))
+        stories_count = checkpoint.get("stories_count") or 0
+        stories_old_count = checkpoint.get("stories_old_count") or 0
+        processed_stories_list = list(checkpoint.get("processed_stories") or [])
+        # The dashboards' latest post / story come from the saved recent updates history
+        for saved_update in FETCHED_UPDATES_HISTORY.updates(user):
+            if str(saved_update.get('type', '')).startswith('Story'):
+                last_story = last_story or saved_update
+            else:
+                last_post = last_post or saved_update
+    elif has_story:
         story_flag = True
         stories_count = 1
 
         if not skip_session and can_view and not skip_getting_story_details:
             try:
                 update_ui_data(targets={user: {'status': 'Loading Stories'}})
-                stories = bot.get_stories(userids=[insta_userid])
+                story = STORY_POLLER.story(bot, user, insta_userid, expected=True)
+                stories = [story] if story is not None else []
 
                 for story in stories:
                     stories_count = story.itemcount
@@ -9109,8 +11651,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                             if user_root_path or OUTPUT_DIR:
                                 story_video_filename = os.path.join(videos_dir, story_video_filename)
                             if not os.path.isfile(story_video_filename):
-                                if save_pic_video(story_video_url, story_video_filename, local_ts):
-                                    print(f"Story video saved for {user} to '{story_video_filename}'")
+                                MEDIA_DOWNLOADER.submit(story_video_url, story_video_filename, local_ts, use_media_store=True, user=user, label="Story video")
 
                         if DOWNLOAD_THUMBNAILS and story_thumbnail_url:
                             if local_dt:
@@ -9121,7 +11662,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                             if user_root_path or OUTPUT_DIR:
                                 story_image_filename = os.path.join(images_dir, story_image_filename)
                             if not os.path.isfile(story_image_filename):
-                                if save_pic_video(story_thumbnail_url, story_image_filename, local_ts):
+                                if save_pic_video(story_thumbnail_url, story_image_filename, local_ts, use_media_store=True):
                                     print(f"Story thumbnail image saved for {user} to '{story_image_filename}'")
                             if os.path.isfile(story_image_filename):
                                 try:
@@ -9134,14 +11675,14 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
                         try:
                             if csv_file_name:
-                                write_csv_entry(csv_file_name, convert_to_local_naive(local_dt), "New Story Item", "", story_type)
+                                write_csv_entry(csv_file_name, convert_to_local_naive(local_dt), "New Story Item", "", story_type, target=user)
                         except Exception as e:
                             print(f"* Error: {e}")
 
                         # Update last_story for dashboard (this loop runs from oldest to newest usually, so we update on each)
                         # Determine which file was saved (video or image)
                         saved_file_path = None
-                        if story_video_url and 'story_video_filename' in locals() and os.path.isfile(story_video_filename):
+                        if story_video_url and 'story_video_filename' in locals() and MEDIA_DOWNLOADER.has(story_video_filename):
                             saved_file_path = story_video_filename
                         elif DOWNLOAD_THUMBNAILS and story_thumbnail_url and 'story_image_filename' in locals() and os.path.isfile(story_image_filename):
                             saved_file_path = story_image_filename
@@ -9197,13 +11738,26 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
     location = None
     likes_users_list = ""
     post_comments_list = ""
-    last_post = None
+    last_post = last_post if resumed else None
     last_source = "post"
     thumbnail_url = ""
     video_url = ""
     highest_collab_ts_old = 0
 
-    if int(posts_count + reels_count) >= 1 and can_view and not skip_getting_posts_details:
+    if resumed:
+        assert checkpoint is not None
+        shortcode = checkpoint.get("last_shortcode") or ""
+        highest_collab_ts_old = checkpoint.get("highest_collab_ts") or 0
+        highestinsta_ts = checkpoint.get("highestinsta_ts") or 0
+        if highestinsta_ts:
+            highestinsta_dt = datetime.fromtimestamp(highestinsta_ts, pytz.timezone(LOCAL_TIMEZONE))
+            highestinsta_ts_old = highestinsta_ts
+            highestinsta_dt_old = highestinsta_dt
+        else:
+            highestinsta_ts_old = int(time.time())
+            highestinsta_dt_old = now_local()
+
+    elif int(posts_count + reels_count) >= 1 and can_view and not skip_getting_posts_details:
         if bot.context.is_logged_in:
             print("Fetching user's latest post/reel ...\n")
         else:
@@ -9260,14 +11814,13 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         try:
             # Below won't work until Instaloader updates query hashes in new release
             if not skip_session and get_more_post_details and last_post:
-                likes_list = last_post.get_likes()
-                for like in likes_list:
-                    likes_users_list += "- " + like.username + " [ " + "https://www.instagram.com/" + like.username + "/ ]\n"
-                comments_list = last_post.get_comments()
-                for comment in comments_list:
+                likes_users_list = "".join([f"- {like.username} [ https://www.instagram.com/{like.username}/ ]\n" for like in last_post.get_likes()])
+                comment_lines = []
+                for comment in last_post.get_comments():
                     comment_created_at = convert_utc_datetime_to_tz_datetime(comment.created_at_utc)
                     if comment_created_at:
-                        post_comments_list += "\n[ " + get_short_date_from_ts(comment_created_at) + " - " + "https://www.instagram.com/" + comment.owner.username + "/ ]\n" + comment.text + "\n"
+                        comment_lines.append(f"\n[ {get_short_date_from_ts(comment_created_at)} - https://www.instagram.com/{comment.owner.username}/ ]\n{comment.text}\n")
+                post_comments_list = "".join(comment_lines)
         except Exception as e:
             error_msg = format_error_message(e)
             print(f"* Error while getting post's likes list / comments list: {error_msg}")
@@ -9303,10 +11856,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     video_filename = os.path.join(videos_dir, video_filename)
 
             if not os.path.isfile(video_filename):
-                if save_pic_video(video_url, video_filename, highestinsta_ts):
-                    print(f"{last_source.capitalize()} video saved for {user} to '{video_filename}'")
-                else:
-                    print(f"Error saving {last_source.lower()} video !")
+                MEDIA_DOWNLOADER.submit(video_url, video_filename, highestinsta_ts, use_media_store=True, user=user, label=f"{last_source.capitalize()} video")
 
         if DOWNLOAD_THUMBNAILS and thumbnail_url:
             if highestinsta_dt:
@@ -9317,7 +11867,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 if not os.path.dirname(image_filename) == images_dir:
                     image_filename = os.path.join(images_dir, image_filename)
             if not os.path.isfile(image_filename):
-                if save_pic_video(thumbnail_url, image_filename, highestinsta_ts):
+                if save_pic_video(thumbnail_url, image_filename, highestinsta_ts, use_media_store=True):
                     print(f"{last_source.capitalize()} thumbnail image saved for {user} to '{image_filename}'")
             if os.path.isfile(image_filename):
                 try:
@@ -9329,7 +11879,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         # Update last_post for dashboard
         # Determine which file was saved (video or image)
         saved_file_path = None
-        if video_url and 'video_filename' in locals() and os.path.isfile(video_filename):
+        if video_url and 'video_filename' in locals() and MEDIA_DOWNLOADER.has(video_filename):
             saved_file_path = video_filename
         elif DOWNLOAD_THUMBNAILS and thumbnail_url and 'image_filename' in locals() and os.path.isfile(image_filename):
             saved_file_path = image_filename
@@ -9361,7 +11911,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         highestinsta_dt_old = now_local()
 
     # Baseline of leaked collab posts for private (otherwise not viewable) accounts; new ones are reported in the loop
-    if DETECT_COLLAB_POSTS and not can_view and int(posts_count + reels_count) >= 1:
+    if DETECT_COLLAB_POSTS and not can_view and int(posts_count + reels_count) >= 1 and not resumed:
         update_ui_data(targets={user: {'status': 'Probing Collab Posts'}})
         try:
             time.sleep(NEXT_OPERATION_DELAY)
@@ -9380,6 +11930,35 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 last_post = latest_collab_update
             print_cur_ts("\nTimestamp:\t\t\t\t")
 
+    # Saves the state a warm restart resumes from (called after the baseline and after every completed check)
+    def checkpoint_state():
+        if not STATE_CHECKPOINT_ENABLED:
+            return
+        pic_meta = read_profile_pic_meta(profile_pic_file) if DETECT_CHANGED_PROFILE_PIC else None
+        save_state_checkpoint(state_checkpoint_file, {
+            "user": user,
+            "session_key": state_checkpoint_session_key(skip_session),
+            "session_username": session_username,
+            "insta_username": insta_username,
+            "insta_userid": insta_userid,
+            "followers_count": followers_old_count,
+            "followings_count": followings_old_count,
+            "bio": bio_old,
+            "is_private": is_private_old,
+            "followed_by_viewer": followed_by_viewer_old,
+            "posts_count": posts_count_old,
+            "reels_count": reels_count_old,
+            "has_story": has_story,
+            "story_flag": story_flag,
+            "stories_count": stories_count,
+            "stories_old_count": stories_old_count,
+            "processed_stories": processed_stories_list,
+            "last_shortcode": shortcode,
+            "highestinsta_ts": highestinsta_ts_old if int(posts_count_old + reels_count_old) >= 1 else 0,
+            "highest_collab_ts": highest_collab_ts_old,
+            "profile_pic_sha256": (pic_meta or {}).get("sha256"),
+        })
+
     # Initialize check timing and update last check time for dashboard
     # Don't increment CHECK_COUNT here - it will be incremented in the main loop
     now = now_local_naive()
@@ -9437,6 +12016,13 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
     if signal_loading_complete is not None:
         signal_loading_complete.set()
 
+    # Baseline is done, drop its cached responses so the first check fetches fresh data
+    invalidate_response_cache(bot)
+    checkpoint_state()
+
+    # Return the Instaloader instance to the pool while this target waits for its first check
+    INSTALOADER_POOL.release(user)
+
     # Show proxy IP at per-user startup only in verbose/debug (the run_main banner already shows it once)
     if PROXY_ENABLED and (VERBOSE_MODE or DEBUG_MODE):
         ipaddr = get_ip_address(stop_event=stop_event)
@@ -9461,41 +12047,21 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
     # Use interruptible sleep if stop_event is provided (allows immediate stop)
     if stop_event or DEBUG_MODE or WEB_DASHBOARD_ENABLED:
-        # Sleep in smaller increments to allow stop event or manual check trigger
-        sleep_remaining = r_sleep_time
         update_ui_data(targets={user: {'status': 'Waiting'}})
-        while sleep_remaining > 0:
-            # Check for stop event
-            if stop_event and stop_event.is_set():
-                print(f"* Monitoring stopped for {user}\n")
-                print_cur_ts()
-                log_activity("Monitoring stopped", user=user)
-                return
-
-            # Check for recheck trigger (Web Dashboard mode)
-            recheck_triggered = False
-            with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
-                if user in WEB_DASHBOARD_RECHECK_EVENTS and WEB_DASHBOARD_RECHECK_EVENTS[user].is_set():
-                    WEB_DASHBOARD_RECHECK_EVENTS[user].clear()
-                    recheck_triggered = True
-
-            if recheck_triggered:
-                print(f"* Recheck requested for {user}! Breaking sleep early...\n")
-                print_cur_ts()
-                manual_recheck_active = True
-                manual_override_active = True
-                break
-
-            # Check for proxy changes from web dashboard
-            refresh_proxy_if_needed(bot, user)
+        # The scheduler wakes this target when the check is due, on a stop request or on a recheck trigger
+        wait_result = wait_for_next_check(user, r_sleep_time, stop_event)
+        if wait_result == 'stop':
+            print(f"* Monitoring stopped for {user}\n")
+            print_cur_ts()
+            log_activity("Monitoring stopped", user=user)
+            return
 
-            # Sleep in 1-second increments for responsiveness
-            sleep_chunk = min(1, sleep_remaining)
-            if stop_event:
-                stop_event.wait(sleep_chunk)
-            else:
-                time.sleep(sleep_chunk)
-            sleep_remaining -= sleep_chunk
+        # Recheck trigger (Web Dashboard mode)
+        if wait_result == 'recheck':
+            print(f"* Recheck requested for {user}! Breaking sleep early...\n")
+            print_cur_ts()
+            manual_recheck_active = True
+            manual_override_active = True
     else:
         time.sleep(r_sleep_time)
 
@@ -9514,9 +12080,15 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
             print_cur_ts()
             return
 
+        # Borrow a pooled Instaloader for this check (the same instance when nobody else needed it meanwhile)
+        bot = INSTALOADER_POOL.acquire(user, skip_session)
+
         # Check for proxy changes via web dashboard at start of each loop iteration
         refresh_proxy_if_needed(bot, user)
 
+        # Retry paths skip the end of the cycle, so never carry responses over into a new one
+        invalidate_response_cache(bot)
+
         reset_thread_output()
         if WEB_DASHBOARD_ENABLED:
             update_ui_data(targets={user: {'status': 'Checking'}})
@@ -9580,7 +12152,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     else:
                         has_story = False
                 elif bot.context.is_logged_in and followed_by_viewer:
-                    story = next(bot.get_stories(userids=[insta_userid]), None)
+                    story = STORY_POLLER.story(bot, user, insta_userid)
                     has_story = bool(story and story.itemcount)
                 else:
                     has_story = False
@@ -9758,7 +12330,11 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 r_sleep_time, next_check_val = compute_next_check_with_hours_range(now, r_sleep_time)
                 update_check_times(next_time=next_check_val, user=user, increment_count=False)
                 print_cur_ts(newline=True)
-                time.sleep(r_sleep_time)
+                # Retry waits go through the scheduler too, so a failing target does not hold a check slot
+                if wait_for_next_check(user, r_sleep_time, stop_event, bot) == 'stop':
+                    print(f"* Monitoring stopped for {user}\n")
+                    print_cur_ts()
+                    return
                 continue
 
             if (next((s for s in get_thread_output() if "HTTP redirect from" in s), None)):
@@ -9786,7 +12362,11 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 r_sleep_time, next_check_val = compute_next_check_with_hours_range(now, r_sleep_time)
                 update_check_times(next_time=next_check_val, user=user, increment_count=False)
                 print_cur_ts(newline=True)
-                time.sleep(r_sleep_time)
+                # Retry waits go through the scheduler too, so a failing target does not hold a check slot
+                if wait_for_next_check(user, r_sleep_time, stop_event, bot) == 'stop':
+                    print(f"* Monitoring stopped for {user}\n")
+                    print_cur_ts()
+                    return
                 continue
 
             if int(followings_count) != int(followings_old_count) or FOLLOWERS_CHURN_DETECTION:
@@ -9809,7 +12389,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     if not skip_follow_changes:
                         try:
                             if csv_file_name:
-                                write_csv_entry(csv_file_name, now_local_naive(), "Followings Count", followings_old_count, followings_count)
+                                write_csv_entry(csv_file_name, now_local_naive(), "Followings Count", followings_old_count, followings_count, target=user)
                         except Exception as e:
                             print(f"* Error: {e}")
 
@@ -9830,7 +12410,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                         start_time_dl = time.time()
                         followings = []
                         _thread_local.FETCH_TYPE = 'followee'
-                        followings = fetch_usernames_paginated(
+                        followings, followings_incremental = fetch_usernames_incremental(
                             bot,
                             get_generator_fn=lambda: profile.get_followees(),
                             max_per_batch=FOLLOWEES_PER_BATCH,
@@ -9840,14 +12420,20 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                             estimated_limit=followee_limit,
                             user=user,
                             stop_event=stop_event,
+                            baseline=followings_old,
+                            expected_count=followings_count,
+                            baseline_count=followings_old_count,
+                            full_scan_due=follow_full_scan_due(followings_last_full_scan),
                         )
+                        if not followings_incremental:
+                            followings_last_full_scan = time.time()
                         _thread_local.FETCH_TYPE = None
-                        followings_to_save = []
                         end_time_dl = time.time()
                         close_pbar()
                         duration_dl = end_time_dl - start_time_dl
                         log_activity(f"Finished downloading followings: {len(followings)}, fetched in {display_time(duration_dl)}", user=user)
                         # Refresh profile to get current reported counts for comparison
+                        invalidate_response_cache(bot)
                         profile = profile_from_username_resilient(bot, user)
                         followings_count = profile.followees
                         followers_count_reported = profile.followers
@@ -9856,14 +12442,11 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                         if not followings and followings_count > 0:
                             print("* Empty followings list returned, not saved to file")
                         else:
-                            followings_to_save.append(followings_count)
-                            followings_to_save.append(followings)
-                            with open(insta_followings_file, 'w', encoding="utf-8") as f:
-                                json.dump(followings_to_save, f, indent=2)
-                                if FOLLOWERS_CHURN_DETECTION:
-                                    print(f"* Followings ({len(followings)}) saved to file '{insta_followings_file}'")
-                                else:
-                                    print(f"* Followings ({followings_count}) actual ({len(followings)}) saved to file '{insta_followings_file}'")
+                            followings_store.save(followings_count, followings)
+                            if FOLLOWERS_CHURN_DETECTION:
+                                print(f"* Followings ({len(followings)}) saved to file '{insta_followings_file}'")
+                            else:
+                                print(f"* Followings ({followings_count}) actual ({len(followings)}) saved to file '{insta_followings_file}'")
                     except Exception as e:
                         close_pbar()
                         followings = followings_old
@@ -9955,7 +12538,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     if not skip_follow_changes:
                         try:
                             if csv_file_name:
-                                write_csv_entry(csv_file_name, now_local_naive(), "Followers Count", followers_old_count, followers_count)
+                                write_csv_entry(csv_file_name, now_local_naive(), "Followers Count", followers_old_count, followers_count, target=user)
                         except Exception as e:
                             print(f"* Error: {e}")
 
@@ -9976,7 +12559,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                         start_time_dl = time.time()
                         followers = []
                         _thread_local.FETCH_TYPE = 'follower'
-                        followers = fetch_usernames_paginated(
+                        followers, followers_incremental = fetch_usernames_incremental(
                             bot,
                             get_generator_fn=lambda: profile.get_followers(),
                             max_per_batch=FOLLOWERS_PER_BATCH,
@@ -9986,14 +12569,20 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                             estimated_limit=follower_limit,
                             user=user,
                             stop_event=stop_event,
+                            baseline=followers_old,
+                            expected_count=followers_count,
+                            baseline_count=followers_old_count,
+                            full_scan_due=follow_full_scan_due(followers_last_full_scan),
                         )
+                        if not followers_incremental:
+                            followers_last_full_scan = time.time()
                         _thread_local.FETCH_TYPE = None
-                        followers_to_save = []
                         end_time_dl = time.time()
                         close_pbar()
                         duration_dl = end_time_dl - start_time_dl
                         log_activity(f"Finished downloading followers: {len(followers)}, fetched in {display_time(duration_dl)}", user=user)
                         # Refresh profile to get current reported counts for comparison
+                        invalidate_response_cache(bot)
                         profile = profile_from_username_resilient(bot, user)
                         followers_count = profile.followers
                         followings_count_reported = profile.followees
@@ -10002,14 +12591,11 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                         if not followers and followers_count > 0:
                             print("* Empty followers list returned, not saved to file")
                         else:
-                            followers_to_save.append(followers_count)
-                            followers_to_save.append(followers)
-                            with open(insta_followers_file, 'w', encoding="utf-8") as f:
-                                json.dump(followers_to_save, f, indent=2)
-                                if FOLLOWERS_CHURN_DETECTION:
-                                    print(f"* Followers ({len(followers)}) saved to file '{insta_followers_file}'")
-                                else:
-                                    print(f"* Followers ({followers_count}) actual ({len(followers)}) saved to file '{insta_followers_file}'")
+                            followers_store.save(followers_count, followers)
+                            if FOLLOWERS_CHURN_DETECTION:
+                                print(f"* Followers ({len(followers)}) saved to file '{insta_followers_file}'")
+                            else:
+                                print(f"* Followers ({followers_count}) actual ({len(followers)}) saved to file '{insta_followers_file}'")
                     except Exception as e:
                         close_pbar()
                         followers = followers_old
@@ -10100,7 +12686,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
                 try:
                     if csv_file_name:
-                        write_csv_entry(csv_file_name, now_local_naive(), "Bio Changed", bio_old, bio)
+                        write_csv_entry(csv_file_name, now_local_naive(), "Bio Changed", bio_old, bio, target=user)
                 except Exception as e:
                     print(f"* Error: {e}")
 
@@ -10144,7 +12730,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
                 try:
                     if csv_file_name:
-                        write_csv_entry(csv_file_name, now_local_naive(), "Profile Visibility", profile_visibility_old, profile_visibility)
+                        write_csv_entry(csv_file_name, now_local_naive(), "Profile Visibility", profile_visibility_old, profile_visibility, target=user)
                 except Exception as e:
                     print(f"* Error: {e}")
 
@@ -10181,7 +12767,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
                 try:
                     if csv_file_name:
-                        write_csv_entry(csv_file_name, now_local_naive(), "Followed By Viewer", followed_by_viewer_old, followed_by_viewer)
+                        write_csv_entry(csv_file_name, now_local_naive(), "Followed By Viewer", followed_by_viewer_old, followed_by_viewer, target=user)
                 except Exception as e:
                     print(f"* Error: {e}")
 
@@ -10214,7 +12800,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
                 try:
                     if csv_file_name:
-                        write_csv_entry(csv_file_name, now_local_naive(), "New Story", "", "")
+                        write_csv_entry(csv_file_name, now_local_naive(), "New Story", "", "", target=user)
                 except Exception as e:
                     print(f"* Error: {e}")
 
@@ -10255,7 +12841,8 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 try:
                     if WEB_DASHBOARD_ENABLED:
                         update_ui_data(targets={user: {'status': 'Fetching...'}})
-                    stories = bot.get_stories(userids=[insta_userid])
+                    story = STORY_POLLER.story(bot, user, insta_userid, expected=True)
+                    stories = [story] if story is not None else []
 
                     for story in stories:
                         stories_count = story.itemcount
@@ -10334,8 +12921,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                                 if user_root_path or OUTPUT_DIR:
                                     story_video_filename = os.path.join(videos_dir, story_video_filename)
                                 if not os.path.isfile(story_video_filename):
-                                    if save_pic_video(story_video_url, story_video_filename, local_ts):
-                                        print(f"Story video saved for {user} to '{story_video_filename}'")
+                                    MEDIA_DOWNLOADER.submit(story_video_url, story_video_filename, local_ts, use_media_store=True, user=user, label="Story video")
 
                             m_body_html_pic_saved_text = ""
                             if DOWNLOAD_THUMBNAILS:
@@ -10348,7 +12934,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                                     story_image_filename = os.path.join(images_dir, story_image_filename)
                                 if story_thumbnail_url:
                                     if not os.path.isfile(story_image_filename):
-                                        if save_pic_video(story_thumbnail_url, story_image_filename, local_ts):
+                                        if save_pic_video(story_thumbnail_url, story_image_filename, local_ts, use_media_store=True):
                                             m_body_html_pic_saved_text = f'<br><br><img src="cid:story_pic" width="50%">'
                                             print(f"Story thumbnail image saved for {user} to '{story_image_filename}'")
                                             try:
@@ -10361,7 +12947,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
                             try:
                                 if csv_file_name:
-                                    write_csv_entry(csv_file_name, convert_to_local_naive(local_dt), "New Story Item", "", story_type)
+                                    write_csv_entry(csv_file_name, convert_to_local_naive(local_dt), "New Story Item", "", story_type, target=user)
                             except Exception as e:
                                 print(f"* Error: {e}")
 
@@ -10407,7 +12993,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                             if WEB_DASHBOARD_ENABLED:
                                 # Determine which file was saved (video or image)
                                 saved_file_path = None
-                                if 'story_video_filename' in locals() and os.path.isfile(story_video_filename):
+                                if 'story_video_filename' in locals() and MEDIA_DOWNLOADER.has(story_video_filename):
                                     saved_file_path = story_video_filename
                                 elif 'story_image_filename' in locals() and os.path.isfile(story_image_filename):
                                     saved_file_path = story_image_filename
@@ -10495,7 +13081,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                             if new != old:
                                 # Use csv_dt when it is an increase, now_local_naive() when it is a decrease
                                 dt = csv_dt if new > old else now_local_naive()
-                                write_csv_entry(csv_file_name, dt, label, old, new)
+                                write_csv_entry(csv_file_name, dt, label, old, new, target=user)
 
                     if new_post:
 
@@ -10550,19 +13136,22 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     print_cur_ts()
 
                     update_check_times(next_time=next_check_val, user=user, increment_count=False)
-                    time.sleep(r_sleep_time)
+                    # Retry waits go through the scheduler too, so a failing target does not hold a check slot
+                    if wait_for_next_check(user, r_sleep_time, stop_event, bot) == 'stop':
+                        print(f"* Monitoring stopped for {user}\n")
+                        print_cur_ts()
+                        return
                     continue
 
                 try:
                     if new_post and not skip_session and get_more_post_details and last_post:
-                        likes_list = last_post.get_likes()
-                        for like in likes_list:
-                            likes_users_list += "- " + like.username + " [ " + "https://www.instagram.com/" + like.username + "/ ]\n"
-                        comments_list = last_post.get_comments()
-                        for comment in comments_list:
+                        likes_users_list = "".join([f"- {like.username} [ https://www.instagram.com/{like.username}/ ]\n" for like in last_post.get_likes()])
+                        comment_lines = []
+                        for comment in last_post.get_comments():
                             comment_created_at = convert_utc_datetime_to_tz_datetime(comment.created_at_utc)
                             if comment_created_at:
-                                post_comments_list += "\n[ " + get_short_date_from_ts(comment_created_at) + " - " + "https://www.instagram.com/" + comment.owner.username + "/ ]\n" + comment.text + "\n"
+                                comment_lines.append(f"\n[ {get_short_date_from_ts(comment_created_at)} - https://www.instagram.com/{comment.owner.username}/ ]\n{comment.text}\n")
+                        post_comments_list = "".join(comment_lines)
                 except Exception as e:
                     error_msg = format_error_message(e)
                     print(f"* Error while getting post's likes list / comments list: {error_msg}")
@@ -10613,10 +13202,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                                 video_filename = os.path.join(videos_dir, video_filename)
 
                         if not os.path.isfile(video_filename):
-                            if save_pic_video(video_url, video_filename, highestinsta_ts):
-                                print(f"{last_source.capitalize()} video saved for {user} to '{video_filename}'")
-                            else:
-                                print(f"Error saving {last_source.lower()} video !")
+                            MEDIA_DOWNLOADER.submit(video_url, video_filename, highestinsta_ts, use_media_store=True, user=user, label=f"{last_source.capitalize()} video")
 
                     m_body_html_pic_saved_text = ""
                     if DOWNLOAD_THUMBNAILS:
@@ -10629,7 +13215,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                                 if not os.path.dirname(image_filename) == images_dir:
                                     image_filename = os.path.join(images_dir, image_filename)
                             if not os.path.isfile(image_filename):
-                                if save_pic_video(thumbnail_url, image_filename, highestinsta_ts):
+                                if save_pic_video(thumbnail_url, image_filename, highestinsta_ts, use_media_store=True):
                                     m_body_html_pic_saved_text = f'<br><br><img src="cid:{last_source.lower()}_pic" width="50%">'
                                     print(f"{last_source.capitalize()} thumbnail image saved for {user} to '{image_filename}'")
                                     try:
@@ -10640,7 +13226,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
 
                     try:
                         if csv_file_name:
-                            write_csv_entry(csv_file_name, convert_to_local_naive(highestinsta_dt), f"New {last_source.capitalize()}", "", pcaption)
+                            write_csv_entry(csv_file_name, convert_to_local_naive(highestinsta_dt), f"New {last_source.capitalize()}", "", pcaption, target=user)
                     except Exception as e:
                         print(f"* Error: {e}")
 
@@ -10687,7 +13273,7 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     if WEB_DASHBOARD_ENABLED:
                         # Determine which file was saved (video or image)
                         saved_file_path = None
-                        if 'video_filename' in locals() and os.path.isfile(video_filename):
+                        if 'video_filename' in locals() and MEDIA_DOWNLOADER.has(video_filename):
                             saved_file_path = video_filename
                         elif 'image_filename' in locals() and os.path.isfile(image_filename):
                             saved_file_path = image_filename
@@ -10761,6 +13347,10 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                 print(f"* Skipping updates for {user}, current hour: {int(cur_h)}, allowed: [{format_hours_as_ranges(hours_to_check())}]")
                 # print("─" * HORIZONTAL_LINE)
 
+        # Check cycle is over, cached responses must not outlive it
+        invalidate_response_cache(bot)
+        checkpoint_state()
+
         alive_counter += 1
 
         if LIVENESS_CHECK_COUNTER and alive_counter >= LIVENESS_CHECK_COUNTER:
@@ -10820,6 +13410,9 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
                     )
             print_cur_ts(newline=True)
 
+        # Check is over, other targets may use this Instaloader instance while we sleep
+        INSTALOADER_POOL.release(user)
+
         if HOURS_VERBOSE or DEBUG_MODE or (VERBOSE_MODE and CHECK_POSTS_IN_HOURS_RANGE):
             sleep_message(r_sleep_time, user)
             debug_print(f"Next check scheduled for: {get_date_from_ts(NEXT_CHECK_TIME)}")
@@ -10827,36 +13420,21 @@ def instagram_monitor_user(user, csv_file_name, skip_session, skip_followers, sk
         # Sleep with manual check support in debug mode (or stop event support in Web Dashboard mode)
         if DEBUG_MODE or stop_event or WEB_DASHBOARD_ENABLED:
             update_ui_data(targets={user: {'status': 'Waiting'}})
-            # Sleep in smaller increments to allow manual check trigger or stop event
-            sleep_remaining = r_sleep_time
-            while sleep_remaining > 0:
-                # Check for stop event (Web Dashboard mode)
-                if stop_event and stop_event.is_set():
-                    print(f"* Monitoring stopped for {user}\n")
-                    print_cur_ts()
-                    return
-
-                # Check for recheck trigger (Web Dashboard mode)
-                recheck_triggered = False
-                with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
-                    if user in WEB_DASHBOARD_RECHECK_EVENTS and WEB_DASHBOARD_RECHECK_EVENTS[user].is_set():
-                        WEB_DASHBOARD_RECHECK_EVENTS[user].clear()
-                        recheck_triggered = True
+            # The scheduler wakes this target when the check is due, on a stop request or on a recheck trigger
+            wait_result = wait_for_next_check(user, r_sleep_time, stop_event)
 
-                if recheck_triggered:
-                    print(f"* Recheck requested for {user}! Breaking sleep early...\n")
-                    print_cur_ts()
-                    manual_recheck_active = True
-                    manual_override_active = True
-                    break
-
-                # Check for proxy changes from web dashboard
-                refresh_proxy_if_needed(bot, user)
+            # Check for stop event (Web Dashboard mode)
+            if wait_result == 'stop':
+                print(f"* Monitoring stopped for {user}\n")
+                print_cur_ts()
+                return
 
-                # Sleep in 1-second increments for responsiveness
-                sleep_chunk = min(1, sleep_remaining)
-                time.sleep(sleep_chunk)
-                sleep_remaining -= sleep_chunk
+            # Check for recheck trigger (Web Dashboard mode)
+            if wait_result == 'recheck':
+                print(f"* Recheck requested for {user}! Breaking sleep early...\n")
+                print_cur_ts()
+                manual_recheck_active = True
+                manual_override_active = True
         else:
             time.sleep(r_sleep_time)
 
@@ -11796,7 +14374,7 @@ def _doctor_send_test_webhook() -> int:
     previous_enabled = WEBHOOK_ENABLED
     try:
         WEBHOOK_ENABLED = True
-        return send_webhook("Instagram Monitor doctor test", "This test notification was sent after approval in --doctor. Your webhook delivery settings work.", color=0x7289DA, notification_type="doctor")
+        return send_webhook("Instagram Monitor doctor test", "This test notification was sent after approval in --doctor. Your webhook delivery settings work.", color=0x7289DA, notification_type="doctor", immediate=True)
     finally:
         WEBHOOK_ENABLED = previous_enabled
 
@@ -11810,7 +14388,7 @@ def _doctor_offer_notification_tests(smtp_ready: bool, webhook_ready: bool) -> i
     failures = 0
     if smtp_ready:
         if _doctor_ask_yes_no("Send one test email now? This will deliver a real message"):
-            result = send_email("instagram_monitor: doctor test email", "This test email was sent after approval in --doctor. Your SMTP delivery settings work.", "This test email was sent after approval in <b>--doctor</b>. Your SMTP delivery settings work.", SMTP_SSL, smtp_timeout=5)
+            result = send_email("instagram_monitor: doctor test email", "This test email was sent after approval in --doctor. Your SMTP delivery settings work.", "This test email was sent after approval in <b>--doctor</b>. Your SMTP delivery settings work.", SMTP_SSL, smtp_timeout=5, immediate=True)
             if result == 0:
                 _doctor_line("ok", "Doctor test email delivered", "One real test email was sent after confirmation")
             else:
@@ -12365,6 +14943,24 @@ def run_main():
         type=str,
         help="Write all activities and profile changes to CSV file"
     )
+    opts.add_argument(
+        "--export-events",
+        dest="export_events",
+        metavar="TARGET",
+        help="Export the target's events stored in the events database as CSV (to the -b file or stdout) and exit"
+    )
+    opts.add_argument(
+        "--events-since",
+        dest="events_since",
+        metavar="DATE",
+        help="With --export-events, only export events from this date on (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)"
+    )
+    opts.add_argument(
+        "--events-until",
+        dest="events_until",
+        metavar="DATE",
+        help="With --export-events, only export events before this date (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS)"
+    )
     opts.add_argument(
         "-o", "--output-dir",
         dest="output_dir",
@@ -12549,7 +15145,7 @@ def run_main():
     args = parser.parse_args()
 
     import_requested = bool(args.import_firefox_session or args.import_browser_session)
-    requested_actions = [label for label, enabled in (("--setup", args.setup), ("--doctor", args.doctor), ("--import-browser-session", import_requested), ("--send-test-email", args.send_test_email), ("--send-test-webhook", args.send_test_webhook), ("--generate-config", args.generate_config is not None)) if enabled]
+    requested_actions = [label for label, enabled in (("--setup", args.setup), ("--doctor", args.doctor), ("--import-browser-session", import_requested), ("--send-test-email", args.send_test_email), ("--send-test-webhook", args.send_test_webhook), ("--generate-config", args.generate_config is not None), ("--export-events", bool(args.export_events))) if enabled]
     if len(requested_actions) > 1:
         parser.error("standalone actions cannot be combined: " + ", ".join(requested_actions))
     if args.setup:
@@ -12829,7 +15425,7 @@ def run_main():
         m_subject = "instagram_monitor: test email"
         m_body = "This is test email - your SMTP settings seems to be correct !"
         m_body_html = "This is <b>test email</b> - your SMTP settings seems to be <b>correct</b> !"
-        if send_email(m_subject, m_body, m_body_html, SMTP_SSL, smtp_timeout=5) == 0:
+        if send_email(m_subject, m_body, m_body_html, SMTP_SSL, smtp_timeout=5, immediate=True) == 0:
             print("* Email sent successfully !")
         else:
             sys.exit(1)
@@ -12846,7 +15442,7 @@ def run_main():
         old_webhook_enabled = WEBHOOK_ENABLED
         WEBHOOK_ENABLED = True
 
-        if send_webhook("instagram_monitor: test webhook", "This is **test webhook** - your settings seems to be **correct** !", color=0x7289DA) == 0:
+        if send_webhook("instagram_monitor: test webhook", "This is **test webhook** - your settings seems to be **correct** !", color=0x7289DA, immediate=True) == 0:
             print("* Webhook sent successfully !")
         else:
             print("* Error: Test webhook notification failed. Check the error message above.")
@@ -12855,6 +15451,9 @@ def run_main():
         WEBHOOK_ENABLED = old_webhook_enabled
         sys.exit(0)
 
+    if args.export_events:
+        sys.exit(export_events_csv(args.export_events, os.path.expanduser(args.csv_file) if args.csv_file else "", args.events_since, args.events_until))
+
     # Resolve targets: CLI (positional + --targets) > config TARGET_USERNAMES
     targets: List[str] = []
     if getattr(args, "targets", None):
@@ -13331,10 +15930,16 @@ def run_main():
             targets=targets
         )
         DASHBOARD_DATA['targets_list'] = targets
+        invalidate_dashboard_config_cache()
+        WEB_DASHBOARD_ACTIVITY.resize(WEB_DASHBOARD_ACTIVITY_RETENTION)
 
         if WEB_DASHBOARD_ENABLED:
             update_web_dashboard_data(config=DASHBOARD_DATA['config'])
 
+    # Deliver notifications a previous run left in the outbox
+    if NOTIFICATION_OUTBOX:
+        NOTIFICATION_OUTBOX_QUEUE.resume()
+
     if RICH_AVAILABLE and DASHBOARD_ENABLED:  # type: ignore[name-defined]
         assert Console is not None
         DASHBOARD_CONSOLE = Console(file=stdout_bck)
@@ -13436,6 +16041,8 @@ def run_main():
         try:
             instagram_monitor_user(user, csv_files_by_user.get(user, CSV_FILE), SKIP_SESSION, SKIP_FOLLOWERS, SKIP_FOLLOWINGS, SKIP_GETTING_STORY_DETAILS, SKIP_GETTING_POSTS_DETAILS, GET_MORE_POST_DETAILS, user_root_path=OUTPUT_DIR, stop_event=stop_event, skip_follow_changes=SKIP_FOLLOW_CHANGES)
         finally:
+            CHECK_SCHEDULER.release(user)
+            INSTALOADER_POOL.release(user)
             if DASHBOARD_ENABLED or WEB_DASHBOARD_ENABLED:
                 with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
                     WEB_DASHBOARD_STOP_EVENTS.pop(user, None)
@@ -13503,27 +16110,16 @@ def run_main():
                         WEB_DASHBOARD_MONITOR_THREADS[u] = threading.current_thread()
 
                 manual_startup_recheck = False
-                if delay_s > 0:
-                    # Interruptible wait for staggering
-                    sleep_remaining = delay_s
-                    while sleep_remaining > 0:
-                        if stop_event and stop_event.is_set():
-                            return
-                        if recheck_event.is_set():
-                            recheck_event.clear()
-                            print(f"* Staggered start interrupted for {u} by recheck request!")
-                            print_cur_ts(newline=True)
-                            manual_startup_recheck = True
-                            break
-
-                        wait_chunk = min(1, sleep_remaining)
-                        if stop_event:
-                            stop_event.wait(wait_chunk)
-                        else:
-                            time.sleep(wait_chunk)
-                        sleep_remaining -= wait_chunk
-                    if not manual_startup_recheck:
-                        debug_print("Staggered start delay expired")
+                # Interruptible wait for staggering, the scheduler also bounds how many targets load at once
+                wait_result = wait_for_next_check(u, delay_s, stop_event)
+                if wait_result == 'stop':
+                    return
+                if wait_result == 'recheck':
+                    print(f"* Staggered start interrupted for {u} by recheck request!")
+                    print_cur_ts(newline=True)
+                    manual_startup_recheck = True
+                elif delay_s > 0:
+                    debug_print("Staggered start delay expired")
 
                 # Wait for previous user's loading to complete
                 wait_event = loading_events[idx]
@@ -13567,6 +16163,8 @@ def run_main():
                 # next code line added per Claude to fix 'deadlock' in multi-threaded mode when an account gets flagged and goes idle
                 # reason: loading_events never signaled on early return (note: event.set() is idempotent so calling it twice is harmless)
                 loading_events[idx + 1].set()
+                CHECK_SCHEDULER.release(u)
+                INSTALOADER_POOL.release(u)
                 with WEB_DASHBOARD_DATA_LOCK:  # type: ignore
                     if u in WEB_DASHBOARD_RECHECK_EVENTS:
                         del WEB_DASHBOARD_RECHECK_EVENTS[u]
@@ -13603,6 +16201,7 @@ def run_main():
                 stop_monitoring_for_target(u)
             sys.exit(0)
 
+    sys.stdout.flush()
     sys.stdout = stdout_bck
     sys.exit(0)
 
@@ -13623,6 +16222,12 @@ def main():
         if DASHBOARD_LIVE:
             DASHBOARD_LIVE.stop()
 
+        # Write out any queued log lines before the Logger is bypassed
+        try:
+            sys.stdout.flush()
+        except Exception:
+            pass
+
         # Force restore stdout/stderr to ensure visibility (bypassing Logger suppression)
         sys.stdout = sys.__stdout__
         sys.stderr = sys.__stderr__
@@ -66,4 +66,64 @@ def deterministic_globals(monkeypatch):
     # Drop the flag-alert de-dup timestamp so each test starts able to alert
     with im.FLAGGED_NOTIFY_LOCK:
         im.FLAGGED_NOTIFY_STATE["ts"] = 0.0
+    # Give every test an empty Instaloader pool so pooled fakes never leak between tests
+    monkeypatch.setattr(im, "INSTALOADER_POOL", im.InstaloaderPool(), raising=False)
+    monkeypatch.setattr(im, "OWN_PROFILE_CACHE", im.OwnProfileCache(), raising=False)
+    # Start from an empty check-times index and a cold dashboard config snapshot
+    monkeypatch.setattr(im, "CHECK_TIMES_INDEX", im.CheckTimesIndex(), raising=False)
+    im.invalidate_dashboard_config_cache()
+    # No web dashboard target snapshots carry over between tests
+    monkeypatch.setattr(im, "WEB_DASHBOARD_SNAPSHOTS", im.TargetSnapshots(), raising=False)
+    # Activity feeds start empty with their default retention
+    monkeypatch.setattr(im, "DASHBOARD_ACTIVITY", im.ActivityFeed(50), raising=False)
+    monkeypatch.setattr(im, "WEB_DASHBOARD_ACTIVITY", im.ActivityFeed(500), raising=False)
+    # Recent updates history starts empty and is never written to disk unless a test asks for it
+    monkeypatch.setattr(im, "FETCHED_UPDATES_PERSIST", False, raising=False)
+    monkeypatch.setattr(im, "FETCHED_UPDATES_DEPTH", 10, raising=False)
+    monkeypatch.setattr(im, "FETCHED_UPDATES_HISTORY", im.FetchedUpdatesHistory(), raising=False)
+    # Targets never resume from (or write) a state checkpoint unless a test enables it
+    monkeypatch.setattr(im, "STATE_CHECKPOINT_ENABLED", False, raising=False)
+    # Story batching starts cold, without a coalescing window and with a fresh scheduler to prefetch from
+    monkeypatch.setattr(im, "STORY_POLLER", im.StoryPoller(), raising=False)
+    monkeypatch.setattr(im, "STORY_BATCH_WINDOW", 0, raising=False)
+    monkeypatch.setattr(im, "STORY_BATCH_TTL", 60, raising=False)
+    monkeypatch.setattr(im, "CHECK_SCHEDULER", im.CheckScheduler(), raising=False)
+    # Media is downloaded inline unless a test starts download workers
+    monkeypatch.setattr(im, "MEDIA_DOWNLOAD_WORKERS", 0, raising=False)
+    monkeypatch.setattr(im, "MEDIA_DOWNLOAD_MAX_MB", 0, raising=False)
+    monkeypatch.setattr(im, "MEDIA_DOWNLOADER", im.MediaDownloader(), raising=False)
+    # CSV events are not mirrored to the events database unless a test enables it
+    monkeypatch.setattr(im, "EVENTS_DB_ENABLED", False, raising=False)
+    monkeypatch.setattr(im, "EVENT_STORE", im.EventStore(), raising=False)
+    # Notifications are sent inline unless a test turns the outbox on
+    monkeypatch.setattr(im, "NOTIFICATION_OUTBOX", False, raising=False)
+    monkeypatch.setattr(im, "NOTIFICATION_OUTBOX_QUEUE", im.NotificationOutbox(), raising=False)
     yield
+
+
+# Applies deterministic monitor settings for a startup-only instagram_monitor_user run: no delays, no dashboards
+# and no optional detections, with the helpers that would sleep, reach the network or touch the UI stubbed out
+@pytest.fixture
+def startup_monitor_defaults(monkeypatch):
+    monkeypatch.setattr(im, "SESSION_USERNAME", "", raising=False)
+    monkeypatch.setattr(im, "NEXT_OPERATION_DELAY", 0, raising=False)
+    monkeypatch.setattr(im, "INSTA_CHECK_INTERVAL", 1, raising=False)
+    monkeypatch.setattr(im, "RANDOM_SLEEP_DIFF_LOW", 0, raising=False)
+    monkeypatch.setattr(im, "RANDOM_SLEEP_DIFF_HIGH", 0, raising=False)
+    monkeypatch.setattr(im, "DETECT_CHANGED_PROFILE_PIC", False, raising=False)
+    monkeypatch.setattr(im, "DOWNLOAD_THUMBNAILS", False, raising=False)
+    monkeypatch.setattr(im, "DETECT_COLLAB_POSTS", False, raising=False)
+    monkeypatch.setattr(im, "FOLLOWERS_CHURN_DETECTION", False, raising=False)
+    monkeypatch.setattr(im, "DASHBOARD_ENABLED", False, raising=False)
+    monkeypatch.setattr(im, "WEB_DASHBOARD_ENABLED", False, raising=False)
+    monkeypatch.setattr(im, "RICH_AVAILABLE", False, raising=False)
+    monkeypatch.setattr(im, "PROXY_ENABLED", False, raising=False)
+    monkeypatch.setattr(im, "HOURS_VERBOSE", False, raising=False)
+    monkeypatch.setattr(im, "print_cur_ts", lambda *args, **kwargs: None)
+    monkeypatch.setattr(im, "log_activity", lambda *args, **kwargs: None)
+    monkeypatch.setattr(im, "update_check_times", lambda *args, **kwargs: None)
+    monkeypatch.setattr(im, "get_dashboard_config_data", lambda: {})
+    monkeypatch.setattr(im, "randomize_number", lambda value, low, high: value)
+    monkeypatch.setattr(im, "compute_next_check_with_hours_range", lambda now, sleep_time: (sleep_time, now))
+    monkeypatch.setattr(im, "refresh_proxy_if_needed", lambda *args, **kwargs: None)
+    monkeypatch.setattr(im.time, "sleep", lambda seconds: None)
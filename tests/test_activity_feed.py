@@ -0,0 +1,129 @@
+"""Tests for the activity log ring buffers and the cursor-based /api/activity endpoint."""
+
+import os
+
+
+# Returns a minimal activity entry with the given message
+def _item(message):
+    return {"time": "10:00", "message": message, "level": "system", "details": None}
+
+
+# Creates a Flask test client with the repository template directory configured
+def _dashboard_client(im_module, monkeypatch):
+    template_dir = os.path.join(os.path.dirname(os.path.abspath(im_module.__file__)), "templates")
+    monkeypatch.setattr(im_module, "WEB_DASHBOARD_TEMPLATE_DIR", template_dir)
+    app = im_module.create_web_dashboard_app()
+    assert app is not None
+    return app.test_client()
+
+
+class TestActivityFeed:
+    def test_latest_is_newest_first_within_capacity(self, im_module):
+        feed = im_module.ActivityFeed(3)
+        seqs = [feed.append(_item(f"m{i}")) for i in range(5)]
+        assert seqs == [1, 2, 3, 4, 5]
+        assert [e["message"] for e in feed.latest()] == ["m4", "m3", "m2"]
+        assert [e["seq"] for e in feed.latest(2)] == [5, 4]
+        assert len(feed) == 3
+
+    def test_after_pages_oldest_first_and_reports_missed(self, im_module):
+        feed = im_module.ActivityFeed(3)
+        for i in range(5):
+            feed.append(_item(f"m{i}"))
+        items, missed = feed.after(0)
+        assert [e["seq"] for e in items] == [3, 4, 5] and missed is True
+        items, missed = feed.after(3, limit=1)
+        assert [e["seq"] for e in items] == [4] and missed is False
+        assert feed.after(5) == ([], False)
+
+    def test_per_user_index_follows_evictions(self, im_module):
+        feed = im_module.ActivityFeed(4)
+        for i, user in enumerate(["a", "b", "a", "b", "a", "b"]):
+            feed.append(_item(f"m{i}"), user)
+        items, _ = feed.after(0, user="a")
+        assert [(e["seq"], e["user"]) for e in items] == [(3, "a"), (5, "a")]
+        assert [e["seq"] for e in feed.after(3, user="b")[0]] == [4, 6]
+        assert feed.after(0, user="missing")[0] == []
+
+    def test_clear_keeps_sequence_ids_counting(self, im_module):
+        feed = im_module.ActivityFeed(3)
+        feed.append(_item("old"), "a")
+        feed.clear()
+        assert feed.latest() == [] and feed.after(0, user="a")[0] == []
+        assert feed.append(_item("new")) == 2
+
+    def test_resize_keeps_newest_entries(self, im_module):
+        feed = im_module.ActivityFeed(5)
+        for i, user in enumerate(["a", "b", "a", "b", "a"]):
+            feed.append(_item(f"m{i}"), user)
+        feed.resize(2)
+        assert [e["seq"] for e in feed.latest()] == [5, 4]
+        assert [e["seq"] for e in feed.after(0, user="a")[0]] == [5]
+        feed.resize(4)
+        feed.append(_item("m5"), "a")
+        assert [e["seq"] for e in feed.latest()] == [6, 5, 4]
+
+    def test_extend_matches_repeated_append(self, im_module):
+        feed = im_module.ActivityFeed(3)
+        feed.append(_item("m0"), "b")
+        assert feed.extend([_item(f"m{i}") for i in range(1, 5)], "a") == 5
+        assert [e["message"] for e in feed.latest()] == ["m4", "m3", "m2"]
+        assert [e["seq"] for e in feed.after(0, user="a")[0]] == [3, 4, 5]
+        assert feed.after(0, user="b")[0] == []
+
+    def test_entries_are_returned_as_copies(self, im_module):
+        feed = im_module.ActivityFeed(2)
+        feed.append(_item("m"))
+        feed.latest()[0]["message"] = "changed"
+        assert feed.latest()[0]["message"] == "m"
+
+
+class TestLogActivityFeeds:
+    def test_log_activity_fills_both_feeds(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "DASHBOARD_ENABLED", False, raising=False)
+        im_module.log_activity("checked", user="target")
+        im_module.log_activity("terminal only", to_web=False)
+        assert [e["message"] for e in im_module.DASHBOARD_ACTIVITY.latest()] == ["terminal only", "[target] checked"]
+        assert [(e["message"], e["user"]) for e in im_module.WEB_DASHBOARD_ACTIVITY.latest()] == [("[target] checked", "target")]
+
+    def test_log_activities_publishes_once(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "DASHBOARD_ENABLED", False, raising=False)
+        published = []
+        monkeypatch.setattr(im_module.WEB_DASHBOARD_CHANGES, "publish", lambda *args: published.append(args))
+        im_module.log_activities(["one", "two"], user="target", level="update", details=[{"url": "a"}, {"url": "b"}])
+        entries = im_module.WEB_DASHBOARD_ACTIVITY.latest()
+        assert [(e["message"], e["details"]) for e in entries] == [("[target] two", {"url": "b"}), ("[target] one", {"url": "a"})]
+        assert len(im_module.DASHBOARD_ACTIVITY.latest()) == 2
+        assert published == [("activity", "target")]
+
+
+class TestActivityEndpoint:
+    def test_activity_cursor_and_user_filter(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        for i, user in enumerate(["a", "b", "a"]):
+            im_module.WEB_DASHBOARD_ACTIVITY.append(_item(f"m{i}"), user)
+
+        everything = client.get("/api/activity").get_json()
+        newer = client.get("/api/activity?after=1&user=a").get_json()
+
+        assert [e["seq"] for e in everything["items"]] == [1, 2, 3]
+        assert everything["last_seq"] == 3 and everything["missed"] is False
+        assert [e["message"] for e in newer["items"]] == ["m2"]
+
+    def test_status_carries_newest_activities_and_cursor(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {}})
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_STATUS_ACTIVITIES", 2)
+        for i in range(3):
+            im_module.WEB_DASHBOARD_ACTIVITY.append(_item(f"m{i}"))
+
+        data = client.get("/api/status").get_json()
+
+        assert [e["message"] for e in data["activities"]] == ["m2", "m1"]
+        assert data["activity_seq"] == 3
+
+    def test_clear_empties_feed(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        im_module.WEB_DASHBOARD_ACTIVITY.append(_item("m"))
+        assert client.post("/api/activity/clear").get_json()["success"] is True
+        assert client.get("/api/activity").get_json()["items"] == []
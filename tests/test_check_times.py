@@ -0,0 +1,116 @@
+"""Tests for the global last/next check aggregation and the cached dashboard config snapshot.
+
+update_check_times keeps the global values in CheckTimesIndex instead of rescanning
+every target, so these tests check that the index gives the same answers a rescan would.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def check_globals(im_module, monkeypatch):
+    monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {}}, raising=False)
+    monkeypatch.setattr(im_module, "DASHBOARD_DATA", {"targets": {}}, raising=False)
+    monkeypatch.setattr(im_module, "DASHBOARD_ENABLED", False, raising=False)
+    monkeypatch.setattr(im_module, "WEB_DASHBOARD_ENABLED", False, raising=False)
+    monkeypatch.setattr(im_module, "LAST_CHECK_TIME", None, raising=False)
+    monkeypatch.setattr(im_module, "NEXT_CHECK_TIME", None, raising=False)
+    monkeypatch.setattr(im_module, "NEXT_CHECK_DISPLAY", None, raising=False)
+    monkeypatch.setattr(im_module, "CHECK_COUNT", 0, raising=False)
+
+
+class TestCheckTimesIndex:
+    def test_earliest_future_check_wins(self, im_module):
+        index = im_module.CheckTimesIndex()
+        index.set_next("a", 300)
+        index.set_next("b", 200)
+        index.set_next("c", 400)
+        assert index.next_due(100) == (200, False, None)
+
+    def test_newer_entry_supersedes_older_one(self, im_module):
+        index = im_module.CheckTimesIndex()
+        index.set_next("a", 200)
+        index.set_next("b", 300)
+        index.set_next("a", 500)
+        assert index.next_due(100)[0] == 300
+        index.set_next("b", label="In Progress")
+        assert index.next_due(100) == (500, True, None)
+
+    def test_passed_entries_turn_into_labels(self, im_module):
+        index = im_module.CheckTimesIndex()
+        index.set_next("a", 200, "12:00")
+        assert index.next_due(100) == (200, False, None)
+        assert index.next_due(300) == (None, False, "12:00")
+        index.set_next("a", label="In Progress")
+        index.set_next("b", label="Paused")
+        assert index.next_due(300) == (None, True, "Paused")
+
+    def test_removed_target_is_ignored(self, im_module):
+        index = im_module.CheckTimesIndex()
+        index.set_next("a", 200)
+        index.set_next("b", label="In Progress")
+        index.remove("a")
+        index.remove("b")
+        assert index.next_due(100) == (None, False, None)
+
+    def test_last_check_is_a_running_max(self, im_module):
+        index = im_module.CheckTimesIndex()
+        index.set_last(200)
+        index.set_last(100)
+        assert index.last_ts == 200
+
+
+class TestUpdateCheckTimes:
+    def test_global_times_follow_all_targets(self, im_module, check_globals):
+        now = datetime.now()
+        im_module.update_check_times(last_time=now - timedelta(minutes=5), user="a")
+        im_module.update_check_times(last_time=now - timedelta(minutes=1), user="b")
+        im_module.update_check_times(next_time=now + timedelta(hours=2), user="a", increment_count=False)
+        im_module.update_check_times(next_time=now + timedelta(hours=1), user="b", increment_count=False)
+
+        assert im_module.CHECK_COUNT == 2
+        assert im_module.LAST_CHECK_TIME == (now - timedelta(minutes=1)).timestamp()
+        assert im_module.NEXT_CHECK_TIME == (now + timedelta(hours=1)).timestamp()
+        assert im_module.WEB_DASHBOARD_DATA["targets"]["b"]["next_check_ts"] == (now + timedelta(hours=1)).timestamp()
+
+    def test_in_progress_target_moves_global_next_to_the_other_one(self, im_module, check_globals):
+        now = datetime.now()
+        im_module.update_check_times(next_time=now + timedelta(hours=1), user="a", increment_count=False)
+        im_module.update_check_times(next_time=now + timedelta(hours=2), user="b", increment_count=False)
+        im_module.update_check_times(next_time="In Progress", user="a", increment_count=False)
+        assert im_module.NEXT_CHECK_TIME == (now + timedelta(hours=2)).timestamp()
+
+    def test_label_is_shown_when_no_target_has_a_future_check(self, im_module, check_globals):
+        im_module.update_check_times(next_time="Paused", user="a", increment_count=False)
+        im_module.update_check_times(next_time="In Progress", user="b", increment_count=False)
+        im_module.update_check_times(next_time="Paused", user="b", increment_count=False)
+        assert im_module.NEXT_CHECK_TIME is None
+        assert im_module.NEXT_CHECK_DISPLAY == "Paused"
+
+
+class TestDashboardConfigCache:
+    def test_snapshot_is_reused_until_invalidated(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "INSTA_CHECK_INTERVAL", 3600, raising=False)
+        first = im_module.get_dashboard_config_data()
+        monkeypatch.setattr(im_module, "INSTA_CHECK_INTERVAL", 7200, raising=False)
+        assert im_module.get_dashboard_config_data()["check_interval"] == 3600
+        im_module.invalidate_dashboard_config_cache()
+        assert im_module.get_dashboard_config_data()["check_interval"] == 7200
+        assert first["check_interval"] == 3600
+
+    def test_callers_get_their_own_copy(self, im_module):
+        im_module.get_dashboard_config_data()["check_interval"] = "mutated"
+        assert im_module.get_dashboard_config_data()["check_interval"] != "mutated"
+
+    def test_calls_with_arguments_bypass_the_cache(self, im_module, monkeypatch):
+        im_module.get_dashboard_config_data()
+        monkeypatch.setattr(im_module, "INSTA_CHECK_INTERVAL", 1234, raising=False)
+        assert im_module.get_dashboard_config_data(targets=["a"])["check_interval"] == 1234
+
+    def test_signal_handler_invalidates_snapshot(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOWERS_NOTIFICATION", False, raising=False)
+        assert im_module.get_dashboard_config_data()["follower_notifications"] is False
+        im_module.toggle_followers_notifications_signal_handler(im_module.signal.SIGINT, None)
+        assert im_module.get_dashboard_config_data()["follower_notifications"] is True
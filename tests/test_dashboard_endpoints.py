@@ -1,6 +1,7 @@
 """Offline tests for Web Dashboard endpoints."""
 
 from datetime import datetime, timedelta
+import json
 import os
 
 
@@ -32,6 +33,97 @@ class TestDashboardStatus:
         assert data["targets"]["realuser"]["status"] == "Watching User1"
         assert "uptime" in data
 
+    # Unchanged targets are served from the same snapshot, and request-time labels never leak into it
+    def test_status_reuses_target_snapshots(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_CHANGES", im_module.DashboardChangeFeed())
+        next_ts = (datetime.now() + timedelta(hours=1)).timestamp()
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {"a": {"status": "OK", "next_check": "In Progress", "next_check_ts": next_ts}}, "activities": []})
+
+        first = client.get("/api/status").get_json()
+        snapshot = im_module.WEB_DASHBOARD_SNAPSHOTS.get("a", im_module.WEB_DASHBOARD_DATA["targets"]["a"])
+        client.get("/api/status")
+
+        assert first["targets"]["a"]["next_check"] != "In Progress"
+        assert snapshot["next_check"] == "In Progress"
+        assert im_module.WEB_DASHBOARD_SNAPSHOTS.get("a", im_module.WEB_DASHBOARD_DATA["targets"]["a"]) is snapshot
+
+        im_module.update_web_dashboard_data(targets={"a": {"status": "Checking"}})
+        assert client.get("/api/status").get_json()["targets"]["a"]["status"] == "Checking"
+        assert snapshot["status"] == "OK"
+
+    # ?since=<version> returns only the targets changed after that version
+    def test_status_since_returns_changed_targets(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_CHANGES", im_module.DashboardChangeFeed())
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {"a": {"status": "OK"}, "b": {"status": "OK"}}, "activities": []})
+
+        full = client.get("/api/status").get_json()
+        im_module.update_web_dashboard_data(targets={"b": {"status": "Checking"}})
+        delta = client.get(f"/api/status?since={full['version']}").get_json()
+        idle = client.get(f"/api/status?since={delta['version']}").get_json()
+
+        assert "delta" not in full and set(full["targets"]) == {"a", "b"}
+        assert delta["delta"] is True and list(delta["targets"]) == ["b"]
+        assert delta["targets"]["b"]["status"] == "Checking"
+        assert "activities" not in delta
+        assert idle["targets"] == {} and idle["version"] == delta["version"]
+
+    # A version the change feed no longer covers gets the full status
+    def test_status_since_stale_version_gets_full_status(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_CHANGES", im_module.DashboardChangeFeed())
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {"a": {}}, "activities": []})
+
+        data = client.get("/api/status?since=99").get_json()
+
+        assert "delta" not in data
+        assert set(data["targets"]) == {"a"}
+
+
+class TestDashboardConditionalResponses:
+    # An unchanged status is answered with 304, even though the uptime ticked in between
+    def test_status_etag_returns_not_modified(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_CHANGES", im_module.DashboardChangeFeed())
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {"a": {"status": "OK"}}, "activities": [], "start_time": datetime.now() - timedelta(seconds=5)})
+
+        first = client.get("/api/status")
+        etag = first.headers["ETag"]
+        again = client.get("/api/status", headers={"If-None-Match": etag})
+        im_module.update_web_dashboard_data(targets={"a": {"status": "Checking"}})
+        changed = client.get("/api/status", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200 and etag.startswith('W/"')
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert "uptime_since" in first.get_json()
+        assert again.status_code == 304 and again.data == b""
+        assert changed.status_code == 200 and changed.headers["ETag"] != etag
+
+    # Large bodies are gzip-compressed for clients which accept it, small ones are sent as they are
+    def test_large_status_is_gzipped(self, im_module, monkeypatch):
+        import gzip
+
+        client = _dashboard_client(im_module, monkeypatch)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_GZIP_MIN_SIZE", 1024)
+        for i in range(100):
+            im_module.WEB_DASHBOARD_ACTIVITY.append({"time": "10:00", "message": f"event {i}", "level": "system", "details": None})
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {}})
+
+        zipped = client.get("/api/status", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/api/status")
+
+        assert zipped.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in zipped.headers["Vary"]
+        assert json.loads(gzip.decompress(zipped.data)) == plain.get_json()
+        assert "Content-Encoding" not in plain.headers
+
+    # Settings GET supports the same conditional requests
+    def test_settings_etag_returns_not_modified(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        etag = client.get("/api/settings").headers["ETag"]
+        assert client.get("/api/settings", headers={"If-None-Match": etag}).status_code == 304
+
 
 class TestDashboardSettings:
     # Settings GET reports whether an SMTP password is configured without exposing the secret
@@ -110,6 +202,35 @@ class TestDashboardConfigAndSession:
         assert "not supported on Windows" in response.get_json()["error"]
 
 
+class TestDashboardFollowLists:
+    # Follow lists are rebuilt from the target's snapshot stores at the requested time
+    def test_follow_lists_at_past_time(self, im_module, monkeypatch, tmp_path):
+        client = _dashboard_client(im_module, monkeypatch)
+        clock = {"now": 1000}
+        monkeypatch.setattr(im_module.time, "time", lambda: clock["now"])
+        followers = im_module.FollowSnapshotStore(str(tmp_path / "instagram_a_followers.json"))
+        followings = im_module.FollowSnapshotStore(str(tmp_path / "instagram_a_followings.json"))
+        followers.save(1, ["x"])
+        clock["now"] = 2000
+        followers.save(2, ["y", "x"])
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_STORES", {"a": {"followers": followers, "followings": followings}})
+
+        past = client.get("/api/targets/a/follow-lists?at=1500").get_json()
+        latest = client.get("/api/targets/a/follow-lists").get_json()
+
+        assert past["followers"] == {"count": 1, "usernames": ["x"]}
+        assert past["followings"] is None
+        assert latest["followers"] == {"count": 2, "usernames": ["y", "x"]}
+
+    def test_follow_lists_errors(self, im_module, monkeypatch, tmp_path):
+        client = _dashboard_client(im_module, monkeypatch)
+        store = im_module.FollowSnapshotStore(str(tmp_path / "f.json"))
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_STORES", {"a": {"followers": store, "followings": store}})
+
+        assert client.get("/api/targets/missing/follow-lists").status_code == 404
+        assert client.get("/api/targets/a/follow-lists?at=yesterday").status_code == 400
+
+
 class TestDashboardTestNotifications:
     # Test email route delegates to send_email and returns success
     def test_test_email_uses_stubbed_sender(self, im_module, monkeypatch):
@@ -139,3 +260,70 @@ class TestDashboardTestNotifications:
         assert response.get_json() == {"success": True}
         assert calls[0][0][0] == "instagram_monitor: test webhook"
         assert im_module.WEBHOOK_ENABLED is False
+
+
+# Returns the parsed (event name, JSON payload) of the next Server-Sent Event from a streamed response
+def _next_event(chunks):
+    while True:
+        chunk = next(chunks).decode("utf-8")
+        if chunk.startswith("event: "):
+            name_line, data_line = chunk.strip().split("\n", 1)
+            return name_line[len("event: "):], json.loads(data_line[len("data: "):])
+
+
+class TestDashboardEvents:
+    # A new client gets the full status first, then only the targets that changed
+    def test_stream_sends_status_then_target_delta(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        feed = im_module.DashboardChangeFeed()
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_CHANGES", feed)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_PUSH_IDLE_INTERVAL", 0.01)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {"a": {"status": "OK"}, "b": {"status": "OK"}}, "activities": []})
+
+        response = client.get("/api/events", buffered=False)
+        chunks = iter(response.response)
+        name, status = _next_event(chunks)
+        im_module.update_web_dashboard_data(targets={"b": {"status": "Checking"}})
+        name_delta, delta = _next_event(chunks)
+        response.close()
+
+        assert response.mimetype == "text/event-stream"
+        assert name == "status" and set(status["targets"]) == {"a", "b"}
+        assert name_delta == "delta"
+        assert list(delta["targets"]) == ["b"]
+        assert delta["targets"]["b"]["status"] == "Checking"
+        assert delta["version"] == feed.version
+        assert "activities" not in delta
+
+    # A client whose version fell out of the change log is sent a full status to resync
+    def test_stale_version_gets_full_status(self, im_module, monkeypatch):
+        client = _dashboard_client(im_module, monkeypatch)
+        feed = im_module.DashboardChangeFeed()
+        for _ in range(feed.MAX_BACKLOG + 5):
+            feed.publish("target", "a")
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_CHANGES", feed)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {"a": {}}, "activities": []})
+
+        response = client.get("/api/events?since=1", buffered=False)
+        name, status = _next_event(iter(response.response))
+        response.close()
+
+        assert name == "status"
+        assert status["version"] == feed.MAX_BACKLOG + 5
+
+
+class TestDashboardChangeFeed:
+    def test_changes_since_collects_users_and_kinds(self, im_module):
+        feed = im_module.DashboardChangeFeed()
+        feed.publish("target", "a")
+        feed.publish("activity", "b")
+        feed.publish("global")
+
+        assert feed.changes_since(1) == (3, {"b"}, {"activity", "global"})
+        assert feed.changes_since(3) == (3, set(), set())
+
+    def test_version_ahead_of_feed_requires_resync(self, im_module):
+        feed = im_module.DashboardChangeFeed()
+        feed.publish("global")
+
+        assert feed.changes_since(7) == (1, None, None)
@@ -0,0 +1,87 @@
+"""Tests for the SQLite events database that mirrors the CSV files (filesystem only)."""
+
+import csv
+import io
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def events_db(im_module, monkeypatch, tmp_path):
+    monkeypatch.setattr(im_module, "EVENTS_DB_ENABLED", True)
+    monkeypatch.setattr(im_module, "EVENTS_DB_FILE", str(tmp_path / "events.db"))
+    yield im_module.EVENT_STORE
+    im_module.EVENT_STORE.close()
+
+
+class TestEventStore:
+    def test_csv_entries_are_mirrored_per_target(self, im_module, events_db, tmp_path):
+        csv_path = str(tmp_path / "out.csv")
+        im_module.write_csv_entry(csv_path, datetime(2024, 3, 9, 16, 0), "Followers Count", 10, 12, target="alice")
+        im_module.write_csv_entry(csv_path, datetime(2024, 3, 9, 17, 0), "Bio Changed", "old", "new", target="bob")
+        assert events_db.query("alice") == [("2024-03-09 16:00:00", "Followers Count", 10, 12)]
+        assert events_db.query("bob") == [("2024-03-09 17:00:00", "Bio Changed", "old", "new")]
+
+    def test_batch_is_one_csv_write_and_one_transaction(self, im_module, events_db, tmp_path):
+        csv_path = str(tmp_path / "out.csv")
+        entries = [(f"2024-03-0{n} 10:00:00", "Added Followers", "", f"user{n}") for n in range(1, 6)]
+        im_module.write_csv_entries(csv_path, entries, target="alice")
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 6
+        assert [row[3] for row in events_db.query("alice")] == [f"user{n}" for n in range(1, 6)]
+
+    def test_date_range_query(self, im_module, events_db, tmp_path):
+        csv_path = str(tmp_path / "out.csv")
+        entries = [("2024-02-29 23:59:59", "New Post", "", "a"), ("2024-03-01 00:00:00", "New Post", "", "b"), ("2024-03-31 12:00:00", "New Reel", "", "c"), ("2024-04-01 00:00:00", "New Post", "", "d")]
+        im_module.write_csv_entries(csv_path, entries, target="alice")
+        march = events_db.query("alice", since="2024-03-01", until="2024-04-01")
+        assert [row[3] for row in march] == ["b", "c"]
+        assert [row[3] for row in events_db.query("alice", since="2024-03-01", until="2024-04-01", event_type="New Post")] == ["b"]
+
+    def test_export_matches_csv_file_format(self, im_module, events_db, tmp_path):
+        csv_path = tmp_path / "out.csv"
+        im_module.write_csv_entry(str(csv_path), datetime(2024, 3, 9, 16, 0), "Followers Count", 10, 12, target="alice")
+        im_module.write_csv_entry(str(csv_path), datetime(2024, 3, 9, 16, 5), "New Story Item", None, "Image", target="alice")
+        exported = io.StringIO()
+        assert events_db.export_csv("alice", exported) == 2
+        assert exported.getvalue() == csv_path.read_bytes().decode("utf-8")
+
+    # Booleans such as "Followed By Viewer" are written unquoted as True / False to the CSV file and must export the same way
+    def test_booleans_export_like_the_csv_file(self, im_module, events_db, tmp_path):
+        csv_path = tmp_path / "out.csv"
+        im_module.write_csv_entry(str(csv_path), datetime(2024, 3, 9, 16, 0), "Followed By Viewer", False, True, target="alice")
+        im_module.write_csv_entry(str(csv_path), datetime(2024, 3, 9, 16, 5), "Followers Count", 1, 0, target="alice")
+        assert events_db.query("alice") == [("2024-03-09 16:00:00", "Followed By Viewer", False, True), ("2024-03-09 16:05:00", "Followers Count", 1, 0)]
+        assert type(events_db.query("alice")[1][2]) is int
+        exported = io.StringIO()
+        events_db.export_csv("alice", exported)
+        assert exported.getvalue() == csv_path.read_bytes().decode("utf-8")
+
+    # A database created before the bools column existed is upgraded in place
+    def test_database_without_bools_column_is_upgraded(self, im_module, events_db, tmp_path):
+        conn = sqlite3.connect(im_module.EVENTS_DB_FILE)
+        conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, target TEXT NOT NULL, ts TEXT NOT NULL, type TEXT NOT NULL, old, new)")
+        conn.execute("INSERT INTO events (target, ts, type, old, new) VALUES ('alice', '2024-03-09 16:00:00', 'New Post', '', 'x')")
+        conn.commit()
+        conn.close()
+        im_module.write_csv_entries(str(tmp_path / "out.csv"), [("2024-03-09 17:00:00", "Followed By Viewer", True, False)], target="alice")
+        assert events_db.query("alice") == [("2024-03-09 16:00:00", "New Post", "", "x"), ("2024-03-09 17:00:00", "Followed By Viewer", True, False)]
+
+    def test_disabled_store_writes_only_csv(self, im_module, monkeypatch, tmp_path):
+        monkeypatch.setattr(im_module, "EVENTS_DB_ENABLED", False)
+        monkeypatch.setattr(im_module, "EVENTS_DB_FILE", str(tmp_path / "events.db"))
+        im_module.write_csv_entry(str(tmp_path / "out.csv"), "t1", "New Post", "", "x", target="alice")
+        assert not (tmp_path / "events.db").exists()
+
+    def test_export_command_writes_file(self, im_module, events_db, tmp_path):
+        im_module.write_csv_entry(str(tmp_path / "out.csv"), "2024-03-09 16:00:00", "New Post", "", "x", target="alice")
+        out_path = tmp_path / "export" / "alice.csv"
+        assert im_module.export_events_csv("alice", str(out_path), since="2024-03-01") == 0
+        assert out_path.read_text(encoding="utf-8") == (tmp_path / "out.csv").read_text(encoding="utf-8")
+
+    def test_export_without_database_fails(self, im_module, events_db):
+        events_db.close()
+        assert im_module.export_events_csv("alice") == 1
@@ -0,0 +1,67 @@
+"""Tests for the bounded, deduplicated recent updates history behind both dashboards."""
+
+import json
+
+
+# Returns a fetched update as produced by the post / story detection code
+def _update(n, kind="Post"):
+    return {"type": kind, "timestamp": 1700000000 + n, "url": f"https://example.com/{n}.jpg", "user": "target"}
+
+
+class TestFetchedUpdatesHistory:
+    def test_duplicates_are_skipped(self, im_module):
+        history = im_module.FetchedUpdatesHistory()
+        assert history.add("target", _update(1)) is True
+        assert history.add("target", dict(_update(1))) is False
+        assert history.add("target", _update(1, kind="Story")) is True
+        assert [u["type"] for u in history.updates("target")] == ["Story", "Post"]
+
+    def test_depth_drops_oldest_and_its_key(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "FETCHED_UPDATES_DEPTH", 2)
+        history = im_module.FetchedUpdatesHistory()
+        for n in range(3):
+            history.add("target", _update(n))
+        assert [u["timestamp"] for u in history.updates("target")] == [1700000002, 1700000001]
+        # The evicted update is no longer a duplicate
+        assert history.add("target", _update(0)) is True
+
+    def test_history_survives_restart(self, im_module, monkeypatch, tmp_path):
+        path = tmp_path / "out" / "history.json"
+        monkeypatch.setattr(im_module, "FETCHED_UPDATES_PERSIST", True)
+        monkeypatch.setattr(im_module, "FETCHED_UPDATES_FILE", str(path))
+        first = im_module.FetchedUpdatesHistory()
+        first.add("target", _update(1))
+        first.add("target", _update(2))
+
+        restarted = im_module.FetchedUpdatesHistory()
+
+        assert [u["timestamp"] for u in json.loads(path.read_text())["target"]] == [1700000002, 1700000001]
+        assert restarted.updates("target") == first.updates("target")
+        assert restarted.add("target", _update(2)) is False
+
+    def test_unreadable_file_starts_empty(self, im_module, monkeypatch, tmp_path):
+        path = tmp_path / "history.json"
+        path.write_text("{not json")
+        monkeypatch.setattr(im_module, "FETCHED_UPDATES_PERSIST", True)
+        monkeypatch.setattr(im_module, "FETCHED_UPDATES_FILE", str(path))
+        assert im_module.FetchedUpdatesHistory().updates("target") == []
+
+
+class TestDashboardStoresMirrorHistory:
+    def test_both_stores_keep_deduplicated_updates(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "DASHBOARD_DATA", {"targets": {}})
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {}})
+        for update in (_update(1), _update(2), _update(1)):
+            im_module.update_terminal_dashboard_data(targets={"target": {"new_update": update}})
+            im_module.update_web_dashboard_data(targets={"target": {"new_update": update}})
+
+        expected = [1700000002, 1700000001]
+        assert [u["timestamp"] for u in im_module.DASHBOARD_DATA["targets"]["target"]["fetched_updates"]] == expected
+        assert [u["timestamp"] for u in im_module.WEB_DASHBOARD_DATA["targets"]["target"]["fetched_updates"]] == expected
+        assert im_module.WEB_DASHBOARD_DATA["targets"]["target"]["last_post"]["timestamp"] == 1700000001
+
+    def test_new_target_is_seeded_from_saved_history(self, im_module, monkeypatch):
+        im_module.FETCHED_UPDATES_HISTORY.add("target", _update(5))
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_DATA", {"targets": {}})
+        im_module.update_web_dashboard_data(targets={"target": {"status": "OK"}})
+        assert [u["timestamp"] for u in im_module.WEB_DASHBOARD_DATA["targets"]["target"]["fetched_updates"]] == [1700000005]
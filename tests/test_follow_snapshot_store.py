@@ -0,0 +1,195 @@
+"""Tests for the follower/following snapshot store.
+
+The store writes a base JSON snapshot and a delta history log under
+``tmp_path``. Timestamps come from a patched clock so history lookups are
+deterministic.
+"""
+
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture
+def clock(im_module, monkeypatch):
+    state = {"now": 1000}
+    monkeypatch.setattr(im_module.time, "time", lambda: state["now"])
+    monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 50, raising=False)
+    return state
+
+
+# Returns the parsed lines of the store's history log
+def _history(store):
+    with open(store.history_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestFollowSnapshotStore:
+    def test_first_save_writes_base_in_legacy_layout(self, im_module, tmp_path, clock):
+        path = tmp_path / "instagram_target_followers.json"
+        store = im_module.FollowSnapshotStore(str(path))
+        store.save(3, ["c", "b", "a"])
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data[:2] == [3, ["c", "b", "a"]]
+        assert _history(store) == []
+
+    def test_changes_are_appended_without_rewriting_base(self, im_module, tmp_path, clock):
+        path = tmp_path / "instagram_target_followers.json"
+        store = im_module.FollowSnapshotStore(str(path))
+        store.save(3, ["c", "b", "a"])
+        base_before = path.read_text(encoding="utf-8")
+        clock["now"] = 2000
+        store.save(3, ["d", "c", "a"])
+        assert path.read_text(encoding="utf-8") == base_before
+        assert _history(store)[-1] == {"ts": 2000, "count": 3, "added": ["d"], "removed": ["b"], "gen": 1}
+
+    def test_load_replays_history_after_base(self, im_module, tmp_path, clock):
+        path = str(tmp_path / "instagram_target_followers.json")
+        store = im_module.FollowSnapshotStore(path)
+        store.save(3, ["c", "b", "a"])
+        clock["now"] = 2000
+        store.save(4, ["e", "d", "c", "a"])
+        assert im_module.FollowSnapshotStore(path).load() == [4, ["e", "d", "c", "a"]]
+
+    def test_unchanged_list_is_not_written(self, im_module, tmp_path, clock):
+        store = im_module.FollowSnapshotStore(str(tmp_path / "f.json"))
+        store.save(2, ["b", "a"])
+        assert store.save(2, ["b", "a"]) is False
+        assert _history(store) == []
+
+    def test_reordered_list_is_stored_in_full(self, im_module, tmp_path, clock):
+        path = str(tmp_path / "f.json")
+        store = im_module.FollowSnapshotStore(path)
+        store.save(2, ["b", "a"])
+        store.save(2, ["a", "b"])
+        assert json.loads((tmp_path / "f.json").read_text(encoding="utf-8"))[1] == ["a", "b"]
+        assert _history(store) == []
+        assert im_module.FollowSnapshotStore(path).load() == [2, ["a", "b"]]
+
+    def test_compaction_rewrites_base(self, im_module, tmp_path, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 2)
+        path = tmp_path / "f.json"
+        store = im_module.FollowSnapshotStore(str(path))
+        store.save(1, ["a"])
+        store.save(2, ["b", "a"])
+        assert json.loads(path.read_text(encoding="utf-8"))[1] == ["a"]
+        store.save(3, ["c", "b", "a"])
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data[:2] == [3, ["c", "b", "a"]]
+        assert data[2]["history_offset"] == 0
+        assert (tmp_path / "f_history.jsonl").stat().st_size == 0
+
+    # The replaced base and its history are kept as archives of their generation
+    def test_compaction_archives_previous_generation(self, im_module, tmp_path, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 2)
+        store = im_module.FollowSnapshotStore(str(tmp_path / "f.json"))
+        store.save(1, ["a"])
+        clock["now"] = 2000
+        store.save(2, ["b", "a"])
+        clock["now"] = 3000
+        store.save(3, ["c", "b", "a"])
+        assert json.loads((tmp_path / "f_base.1.json").read_text(encoding="utf-8"))[:2] == [1, ["a"]]
+        assert [json.loads(line) for line in (tmp_path / "f_history.1.jsonl").read_text(encoding="utf-8").splitlines()] == [
+            {"ts": 2000, "count": 2, "added": ["b"], "removed": [], "gen": 1},
+        ]
+
+    # The history only ever holds the deltas since the last base rewrite, and never a full list
+    def test_history_stays_bounded(self, im_module, tmp_path, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 5)
+        store = im_module.FollowSnapshotStore(str(tmp_path / "f.json"))
+        usernames = [f"user{n}" for n in range(1000)]
+        for n in range(30):
+            clock["now"] += 1
+            usernames = [f"new{n}"] + usernames
+            store.save(len(usernames), usernames)
+            assert len(_history(store)) < 5
+        assert all("full" not in entry for entry in _history(store))
+        assert im_module.FollowSnapshotStore(str(tmp_path / "f.json")).load() == [len(usernames), usernames]
+
+    # A crash between the base rewrite and emptying the log leaves older lines behind, which must not be replayed
+    def test_lines_of_older_generation_are_skipped(self, im_module, tmp_path, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 2)
+        path = str(tmp_path / "f.json")
+        store = im_module.FollowSnapshotStore(path)
+        store.save(1, ["a"])
+        store.save(2, ["b", "a"])
+        stale = (tmp_path / "f_history.jsonl").read_text(encoding="utf-8")
+        store.save(2, ["c", "a"])
+        with open(store.history_path, "a", encoding="utf-8") as f:
+            f.write(stale)
+        assert im_module.FollowSnapshotStore(path).load() == [2, ["c", "a"]]
+
+    def test_snapshot_at_reconstructs_past_lists(self, im_module, tmp_path, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 2)
+        store = im_module.FollowSnapshotStore(str(tmp_path / "f.json"))
+        for ts, usernames in ((1000, ["a"]), (2000, ["b", "a"]), (3000, ["c", "b"]), (4000, ["d", "c", "b"])):
+            clock["now"] = ts
+            store.save(len(usernames), usernames)
+        # Times before the last compaction (at 3000) are rebuilt from the archived generation
+        assert store.snapshot_at(999) is None
+        assert store.snapshot_at(1000) == [1, ["a"]]
+        assert store.snapshot_at(2500) == [2, ["b", "a"]]
+        assert store.snapshot_at(3000) == [2, ["c", "b"]]
+        assert store.snapshot_at(3500) == [2, ["c", "b"]]
+        assert store.snapshot_at(5000) == [3, ["d", "c", "b"]]
+
+    def test_snapshot_at_walks_back_through_several_generations(self, im_module, tmp_path, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 2)
+        store = im_module.FollowSnapshotStore(str(tmp_path / "f.json"))
+        usernames = []
+        for n in range(10):
+            clock["now"] = 1000 * (n + 1)
+            usernames = [f"u{n}"] + usernames
+            store.save(len(usernames), usernames)
+        assert store.generation > 3
+        for n in range(10):
+            assert store.snapshot_at(1000 * (n + 1) + 500) == [n + 1, [f"u{i}" for i in range(n, -1, -1)]]
+
+    # A legacy base replaced on the first save stays available for the time before the migration
+    def test_snapshot_at_uses_archived_legacy_base(self, im_module, tmp_path, clock):
+        path = tmp_path / "f.json"
+        path.write_text(json.dumps([2, ["b", "a"]], indent=2), encoding="utf-8")
+        os.utime(path, (500, 500))
+        store = im_module.FollowSnapshotStore(str(path))
+        store.save(3, ["c", "b", "a"])
+        assert store.snapshot_at(499) is None
+        assert store.snapshot_at(700) == [2, ["b", "a"]]
+        assert store.snapshot_at(1000) == [3, ["c", "b", "a"]]
+
+    # A crash after the base rewrite leaves the previous log in place, loading archives it under its generation
+    def test_unarchived_log_of_previous_generation_is_archived_on_load(self, im_module, tmp_path, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_SNAPSHOT_COMPACT_EVERY", 2)
+        path = str(tmp_path / "f.json")
+        store = im_module.FollowSnapshotStore(path)
+        store.save(1, ["a"])
+        clock["now"] = 2000
+        store.save(2, ["b", "a"])
+        previous_log = (tmp_path / "f_history.jsonl").read_text(encoding="utf-8")
+        clock["now"] = 3000
+        store.save(3, ["c", "b", "a"])
+        (tmp_path / "f_history.1.jsonl").unlink()
+        (tmp_path / "f_history.jsonl").write_text(previous_log, encoding="utf-8")
+
+        reloaded = im_module.FollowSnapshotStore(path)
+        assert reloaded.load() == [3, ["c", "b", "a"]]
+        assert (tmp_path / "f_history.1.jsonl").read_text(encoding="utf-8") == previous_log
+        assert reloaded.snapshot_at(2500) == [2, ["b", "a"]]
+
+    def test_legacy_file_is_migrated_on_first_save(self, im_module, tmp_path, clock):
+        path = tmp_path / "f.json"
+        path.write_text(json.dumps([2, ["b", "a"]], indent=2), encoding="utf-8")
+        store = im_module.FollowSnapshotStore(str(path))
+        assert store.load() == [2, ["b", "a"]]
+        store.save(3, ["c", "b", "a"])
+        assert json.loads(path.read_text(encoding="utf-8"))[:2] == [3, ["c", "b", "a"]]
+        assert im_module.FollowSnapshotStore(str(path)).load() == [3, ["c", "b", "a"]]
+
+    def test_truncated_history_line_is_ignored(self, im_module, tmp_path, clock):
+        path = str(tmp_path / "f.json")
+        store = im_module.FollowSnapshotStore(path)
+        store.save(1, ["a"])
+        store.save(2, ["b", "a"])
+        with open(store.history_path, "a", encoding="utf-8") as f:
+            f.write('{"ts": 1000, "count": 3, "added": ["c"')
+        assert im_module.FollowSnapshotStore(path).load() == [2, ["b", "a"]]
@@ -62,3 +62,23 @@ class TestCompareAndLogFollowerChanges:
         # The added username lands in New and the removed one lands in Old
         assert rows[1][2] == "drop"
         assert rows[2][3] == "join"
+
+    # Every format renders one line per username, exactly as the notifications expect
+    def test_rendered_formats(self, im_module, capsys):
+        added_list, removed_list, added_html, removed_html, added_webhook, removed_webhook, added_mbody, removed_mbody = _run(im_module, capsys, user="u", change_type="followers", old_list=["keep", "old_1"], new_list=["keep", "new_1", "new_2"], csv_file_name="")
+        assert added_list == "- new_1 [ https://www.instagram.com/new_1/ ]\n- new_2 [ https://www.instagram.com/new_2/ ]\n"
+        assert removed_html == "- old_1 [ <a href=\"https://www.instagram.com/old_1/\">https://www.instagram.com/old_1/</a> ]\n"
+        assert added_webhook == "- new\\_1 (<https://www.instagram.com/new_1/>)\n- new\\_2 (<https://www.instagram.com/new_2/>)\n"
+        assert (added_mbody, removed_mbody) == ("\nAdded followers:\n\n", "\nRemoved followers:\n\n")
+        assert removed_list and added_html and removed_webhook
+
+    # A large diff logs its activity as one batch per direction
+    def test_activity_is_logged_in_one_batch(self, im_module, capsys, monkeypatch):
+        batches = []
+        monkeypatch.setattr(im_module, "log_activities", lambda messages, **kwargs: batches.append((messages, kwargs)))
+        old_list = [f"old{n}" for n in range(5000)]
+        new_list = [f"new{n}" for n in range(5000)]
+        _run(im_module, capsys, user="u", change_type="followings", old_list=old_list, new_list=new_list, csv_file_name="")
+        assert [len(messages) for messages, _ in batches] == [5000, 5000]
+        assert batches[0][0][0] == "Removed following: old0"
+        assert batches[1][1]["details"][1] == {"url": "https://www.instagram.com/new1/"}
@@ -0,0 +1,181 @@
+"""Tests for the shared Instaloader pool keyed by session user and proxy, and the shared own-profile cache.
+
+instaloader.Instaloader is replaced with a fake that records session loads, so
+borrowing, reuse and in-place session refresh run fully offline.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class _FakeCookies:
+    def __init__(self):
+        self.cleared = 0
+
+    def clear(self):
+        self.cleared += 1
+
+
+class _FakeBot:
+    def __init__(self):
+        self.context = SimpleNamespace(username=None, iphone_headers={}, _session=SimpleNamespace(cookies=_FakeCookies(), proxies={}, verify=True))
+        self.context.is_logged_in = False
+        self.loaded = []
+
+    def load_session_from_file(self, username):
+        self.loaded.append(username)
+        self.context.username = username
+        self.context.is_logged_in = True
+
+
+@pytest.fixture
+def created(im_module, monkeypatch):
+    bots = []
+
+    def _factory(*args, **kwargs):
+        bot = _FakeBot()
+        bots.append(bot)
+        return bot
+
+    monkeypatch.setattr(im_module.instaloader, "Instaloader", _factory)
+    monkeypatch.setattr(im_module, "SESSION_USERNAME", "session_user", raising=False)
+    monkeypatch.setattr(im_module, "SKIP_SESSION", False, raising=False)
+    monkeypatch.setattr(im_module, "PROXY_ENABLED", False, raising=False)
+    return bots
+
+
+class TestInstaloaderPool:
+    def test_released_bot_is_reused_by_other_target(self, im_module, created):
+        pool = im_module.InstaloaderPool()
+        first = pool.acquire("a")
+        pool.release("a")
+        assert pool.acquire("b") is first
+        assert len(created) == 1
+
+    def test_concurrent_borrowers_get_distinct_bots(self, im_module, created):
+        pool = im_module.InstaloaderPool()
+        assert pool.acquire("a") is not pool.acquire("b")
+        assert len(created) == 2
+
+    def test_acquire_is_reentrant_per_owner(self, im_module, created):
+        pool = im_module.InstaloaderPool()
+        assert pool.acquire("a") is pool.acquire("a")
+
+    def test_new_bot_loads_session_file(self, im_module, created):
+        bot = im_module.InstaloaderPool().acquire("a")
+        assert im_module.bot_has_session(bot) is True
+        assert im_module.InstaloaderPool().acquire("b", skip_session=True).loaded == []
+
+    def test_mobile_user_agent_is_applied(self, im_module, created):
+        bot = im_module.InstaloaderPool().acquire("a")
+        assert bot.context.iphone_headers["User-Agent"] == im_module.USER_AGENT_MOBILE
+
+    def test_key_change_builds_new_bot(self, im_module, created, monkeypatch):
+        pool = im_module.InstaloaderPool()
+        first = pool.acquire("a")
+        pool.release("a")
+        assert pool.acquire("b", skip_session=True) is not first
+
+    def test_refresh_reloads_idle_bots_in_place(self, im_module, created):
+        pool = im_module.InstaloaderPool()
+        bot = pool.acquire("a")
+        pool.release("a")
+        pool.refresh_sessions()
+        assert bot.loaded == ["session_user", "session_user"]
+        assert pool.acquire("b") is bot
+
+    def test_refresh_applies_to_borrowed_bot_on_release(self, im_module, created):
+        pool = im_module.InstaloaderPool()
+        bot = pool.acquire("a")
+        pool.refresh_sessions()
+        assert bot.loaded == ["session_user"]
+        pool.release("a")
+        assert bot.loaded == ["session_user", "session_user"]
+
+    def test_refresh_to_no_login_clears_cookies(self, im_module, created, monkeypatch):
+        pool = im_module.InstaloaderPool()
+        bot = pool.acquire("a")
+        pool.release("a")
+        monkeypatch.setattr(im_module, "SKIP_SESSION", True)
+        pool.refresh_sessions()
+        assert bot.context._session.cookies.cleared == 1
+        assert pool.acquire("b", skip_session=True) is bot
+
+
+class TestBotHasSession:
+    def test_matches_logged_in_session_user(self, im_module, created):
+        bot = _FakeBot()
+        bot.load_session_from_file("session_user")
+        assert im_module.bot_has_session(bot) is True
+
+    def test_other_user_or_anonymous(self, im_module, created):
+        bot = _FakeBot()
+        assert im_module.bot_has_session(bot) is False
+        bot.load_session_from_file("someone_else")
+        assert im_module.bot_has_session(bot) is False
+
+
+class _FakeOwnProfile:
+    def __init__(self, username, followees):
+        self.username = username
+        self._followees = followees
+        self.pulled = 0
+
+    def get_followees(self):
+        for name in self._followees:
+            self.pulled += 1
+            yield SimpleNamespace(username=name)
+
+
+class TestOwnProfileCache:
+    # Loads the own profile once per session user and counts the requests
+    def _patch_own_profile(self, im_module, monkeypatch, followees=("a", "b", "c", "d")):
+        loads = []
+
+        def own_profile(ctx):
+            loads.append(ctx.username)
+            return _FakeOwnProfile(ctx.username, list(followees))
+
+        monkeypatch.setattr(im_module.instaloader.Profile, "own_profile", own_profile)
+        return loads
+
+    def test_profile_is_shared_per_session_user(self, im_module, monkeypatch):
+        loads = self._patch_own_profile(im_module, monkeypatch)
+        cache = im_module.OwnProfileCache()
+        first = cache.profile(SimpleNamespace(username="me"))
+        assert cache.profile(SimpleNamespace(username="me")) is first
+        cache.profile(SimpleNamespace(username="other"))
+        cache.profile(SimpleNamespace(username="me"), refresh=True)
+        assert loads == ["me", "other", "me"]
+
+    def test_followees_sample_is_bounded_and_cached(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "OWN_FOLLOWEES_SAMPLE_SIZE", 2)
+        monkeypatch.setattr(im_module, "OWN_FOLLOWEES_SAMPLE_TTL", 3600)
+        self._patch_own_profile(im_module, monkeypatch)
+        cache = im_module.OwnProfileCache()
+        ctx = SimpleNamespace(username="me")
+        assert cache.followees_sample(ctx) == ["a", "b"]
+        assert cache.profile(ctx).pulled == 2
+        cache.followees_sample(ctx)
+        assert cache.profile(ctx).pulled == 2
+
+    def test_followees_sample_expires(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "OWN_FOLLOWEES_SAMPLE_SIZE", 2)
+        monkeypatch.setattr(im_module, "OWN_FOLLOWEES_SAMPLE_TTL", 60)
+        self._patch_own_profile(im_module, monkeypatch)
+        now = [1000.0]
+        monkeypatch.setattr(im_module.time, "monotonic", lambda: now[0])
+        cache = im_module.OwnProfileCache()
+        ctx = SimpleNamespace(username="me")
+        cache.followees_sample(ctx)
+        now[0] += 100
+        cache.followees_sample(ctx)
+        assert cache.profile(ctx).pulled == 4
+
+    def test_session_refresh_clears_cache(self, im_module, monkeypatch):
+        loads = self._patch_own_profile(im_module, monkeypatch)
+        im_module.OWN_PROFILE_CACHE.profile(SimpleNamespace(username="me"))
+        im_module.signal_session_refreshed()
+        im_module.OWN_PROFILE_CACHE.profile(SimpleNamespace(username="me"))
+        assert loads == ["me", "me"]
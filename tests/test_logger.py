@@ -0,0 +1,79 @@
+"""Tests for the Logger's queued log file writer.
+
+Terminal output goes to an in-memory stream, so only the log files under tmp_path are touched.
+"""
+
+import io
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def logger(im_module, monkeypatch, tmp_path):
+    monkeypatch.setattr(im_module.sys, "stdout", io.StringIO())
+    monkeypatch.setattr(im_module, "COLOR_ENABLED", False, raising=False)
+    monkeypatch.setattr(im_module, "DASHBOARD_ENABLED", False, raising=False)
+    monkeypatch.setattr(im_module, "LOG_WRITE_INTERVAL", 60, raising=False)
+    monkeypatch.setattr(im_module, "LOG_WRITE_BATCH_SIZE", 1000, raising=False)
+    instance = im_module.Logger()
+    instance.add_target_log("a", str(tmp_path / "a.log"))
+    instance.add_target_log("b", str(tmp_path / "b.log"))
+    return instance
+
+
+# Runs fn in a thread named like a target monitoring thread
+def _as_target(target, fn):
+    thread = threading.Thread(target=fn, name=f"instagram_monitor:{target}")
+    thread.start()
+    thread.join()
+
+
+class TestLoggerQueue:
+    def test_terminal_is_immediate_and_files_wait_for_flush(self, logger, tmp_path):
+        _as_target("a", lambda: logger.write("hello\tworld\n"))
+        assert logger.terminal.getvalue() == "hello\tworld\n"
+        assert not (tmp_path / "a.log").exists() or (tmp_path / "a.log").read_text() == ""
+
+        logger.flush()
+        assert (tmp_path / "a.log").read_text() == "hello   world\n"
+        assert not (tmp_path / "b.log").exists()
+
+    def test_common_messages_go_to_every_target_log_in_order(self, logger, tmp_path):
+        _as_target("a", lambda: logger.write("first\n"))
+        logger.write("common\n")
+        _as_target("b", lambda: logger.log_only("\033[31mlast\033[0m\n"))
+        logger.flush()
+        assert (tmp_path / "a.log").read_text() == "first\ncommon\n"
+        assert (tmp_path / "b.log").read_text() == "common\nlast\n"
+
+    def test_batch_size_wakes_the_writer(self, im_module, logger, monkeypatch, tmp_path):
+        monkeypatch.setattr(im_module, "LOG_WRITE_BATCH_SIZE", 2, raising=False)
+        _as_target("a", lambda: [logger.write(f"line {i}\n") for i in range(2)])
+        for _ in range(50):
+            if (tmp_path / "a.log").exists() and (tmp_path / "a.log").read_text() == "line 0\nline 1\n":
+                break
+            threading.Event().wait(0.02)
+        assert (tmp_path / "a.log").read_text() == "line 0\nline 1\n"
+
+    def test_zero_interval_writes_synchronously(self, im_module, logger, monkeypatch, tmp_path):
+        monkeypatch.setattr(im_module, "LOG_WRITE_INTERVAL", 0, raising=False)
+        _as_target("b", lambda: logger.write("now\n"))
+        assert (tmp_path / "b.log").read_text() == "now\n"
+        assert logger._writer is None
+
+    # A fatal exit from a target thread goes through os._exit(), which skips atexit, so the queue is written first
+    def test_signal_handler_flushes_queue_before_exit(self, im_module, logger, monkeypatch, tmp_path):
+        terminal = io.StringIO()
+        exits = []
+        monkeypatch.setattr(im_module.sys, "stdout", logger)
+        monkeypatch.setattr(im_module, "stdout_bck", terminal)
+        monkeypatch.setattr(im_module, "WEB_DASHBOARD_STOP_EVENTS", {}, raising=False)
+        monkeypatch.setattr(im_module.os, "_exit", lambda code: exits.append((code, (tmp_path / "a.log").read_text())))
+
+        def fatal():
+            logger.write("session flagged\n")
+            im_module.signal_handler(im_module.signal.SIGINT, None, message="")
+
+        _as_target("a", fatal)
+        assert exits == [(0, "session flagged\n")]
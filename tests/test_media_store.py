@@ -0,0 +1,357 @@
+"""Tests for the shared content-addressed media store.
+
+Downloads go through a fake ``req.get`` that counts calls, so the tests can
+check that media already held in the store is linked instead of fetched again.
+"""
+
+import io
+import os
+
+import pytest
+
+
+class _FakeResponse:
+    def __init__(self, body, headers=None):
+        self.raw = io.BytesIO(body)
+        self.headers = headers or {}
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def fake_get(im_module, monkeypatch):
+    calls = []
+    bodies = {}
+
+    def _get(url, **kwargs):
+        calls.append(url)
+        return _FakeResponse(bodies[url], {"etag": '"abc"', "last-modified": "Sat, 09 Mar 2024 16:00:00 GMT"})
+
+    monkeypatch.setattr(im_module.req, "get", _get)
+    monkeypatch.setattr(im_module, "get_proxies", lambda: None)
+    monkeypatch.setattr(im_module, "get_proxies_ssl", lambda: True)
+    return calls, bodies
+
+
+class TestMediaStoreKey:
+    def test_key_ignores_host_and_signature(self, im_module):
+        a = im_module.media_store_key("https://scontent-a.cdninstagram.com/v/t51/123_n.jpg?oh=x&oe=1")
+        b = im_module.media_store_key("https://scontent-b.cdninstagram.com/v/t51/123_n.jpg?oh=y")
+        assert a == b == "/v/t51/123_n.jpg"
+
+    # Size and crop variants of one file differ only in stp and must not share a blob
+    def test_key_keeps_stp_variant(self, im_module):
+        a = im_module.media_store_key("https://scontent-a.cdninstagram.com/v/t51/123_n.jpg?stp=dst-jpg_e35_s640x640&oh=x")
+        b = im_module.media_store_key("https://scontent-b.cdninstagram.com/v/t51/123_n.jpg?oh=y&stp=dst-jpg_e35_s640x640")
+        c = im_module.media_store_key("https://scontent-a.cdninstagram.com/v/t51/123_n.jpg?stp=dst-jpg_e35_s1080x1080&oh=x")
+        assert a == b == "/v/t51/123_n.jpg?stp=dst-jpg_e35_s640x640"
+        assert c != a
+
+
+class TestMediaStore:
+    def test_second_target_links_instead_of_downloading(self, im_module, tmp_path, fake_get):
+        calls, bodies = fake_get
+        url_a = "https://scontent-a.cdninstagram.com/v/t51/123_n.jpg?oh=1"
+        url_b = "https://scontent-b.cdninstagram.com/v/t51/123_n.jpg?oh=2"
+        bodies[url_a] = b"jpeg-bytes"
+        store = im_module.MediaStore(str(tmp_path / "store"))
+        first = tmp_path / "a" / "images" / "post.jpg"
+        second = tmp_path / "b" / "images" / "post.jpg"
+
+        store.fetch(url_a, str(first))
+        store.fetch(url_b, str(second))
+
+        assert calls == [url_a]
+        assert first.read_bytes() == second.read_bytes() == b"jpeg-bytes"
+        assert os.stat(first).st_ino == os.stat(second).st_ino
+
+    def test_identical_content_is_stored_once(self, im_module, tmp_path, fake_get):
+        calls, bodies = fake_get
+        bodies["https://x.cdninstagram.com/one.jpg"] = b"same"
+        bodies["https://x.cdninstagram.com/two.jpg"] = b"same"
+        store = im_module.MediaStore(str(tmp_path / "store"))
+
+        a = store.fetch("https://x.cdninstagram.com/one.jpg", str(tmp_path / "one.jpg"))
+        b = store.fetch("https://x.cdninstagram.com/two.jpg", str(tmp_path / "two.jpg"))
+
+        assert a["sha256"] == b["sha256"]
+        assert len(os.listdir(os.path.dirname(store.blob_path(a["sha256"])))) == 1
+
+    def test_index_survives_restart(self, im_module, tmp_path, fake_get):
+        calls, bodies = fake_get
+        url = "https://x.cdninstagram.com/v/reel.mp4"
+        bodies[url] = b"mp4"
+        im_module.MediaStore(str(tmp_path / "store")).fetch(url, str(tmp_path / "first.mp4"))
+
+        entry = im_module.MediaStore(str(tmp_path / "store")).fetch(url, str(tmp_path / "second.mp4"))
+
+        assert calls == [url]
+        assert entry["etag"] == '"abc"'
+        assert (tmp_path / "second.mp4").read_bytes() == b"mp4"
+
+    def test_missing_blob_is_downloaded_again(self, im_module, tmp_path, fake_get):
+        calls, bodies = fake_get
+        url = "https://x.cdninstagram.com/v/pic.jpg"
+        bodies[url] = b"pic"
+        store = im_module.MediaStore(str(tmp_path / "store"))
+        entry = store.fetch(url, str(tmp_path / "first.jpg"))
+        os.remove(store.blob_path(entry["sha256"]))
+
+        store.fetch(url, str(tmp_path / "second.jpg"))
+
+        assert calls == [url, url]
+
+
+class TestSavePicVideoMediaStore:
+    def test_uses_store_and_sets_mtime(self, im_module, tmp_path, fake_get, monkeypatch):
+        calls, bodies = fake_get
+        url = "https://x.cdninstagram.com/v/story.jpg"
+        bodies[url] = b"story"
+        monkeypatch.setattr(im_module, "MEDIA_STORE_ENABLED", True)
+        monkeypatch.setattr(im_module, "MEDIA_STORE_DIR", str(tmp_path / "store"))
+        monkeypatch.setattr(im_module, "MEDIA_STORES", {})
+        dest = tmp_path / "images" / "story.jpg"
+
+        assert im_module.save_pic_video(url, str(dest), 1710000000, use_media_store=True) is True
+        assert im_module.save_pic_video(url, str(tmp_path / "images" / "again.jpg"), 1710000000, use_media_store=True) is True
+
+        assert calls == [url]
+        assert int(os.path.getmtime(dest)) == 1710000000
+
+    # Hard links share one mtime, so a target needing another timestamp gets its own copy and the first keeps its own
+    def test_different_mtimes_are_not_linked(self, im_module, tmp_path, fake_get, monkeypatch):
+        calls, bodies = fake_get
+        url = "https://x.cdninstagram.com/v/collab.jpg"
+        bodies[url] = b"collab"
+        monkeypatch.setattr(im_module, "MEDIA_STORE_ENABLED", True)
+        monkeypatch.setattr(im_module, "MEDIA_STORE_DIR", str(tmp_path / "store"))
+        monkeypatch.setattr(im_module, "MEDIA_STORES", {})
+        first, same, other = (tmp_path / "a.jpg"), (tmp_path / "b.jpg"), (tmp_path / "c.jpg")
+
+        im_module.save_pic_video(url, str(first), 1710000000, use_media_store=True)
+        im_module.save_pic_video(url, str(same), 1710000000, use_media_store=True)
+        im_module.save_pic_video(url, str(other), 1720000000, use_media_store=True)
+
+        assert calls == [url]
+        assert os.stat(first).st_ino == os.stat(same).st_ino != os.stat(other).st_ino
+        assert int(os.path.getmtime(first)) == 1710000000
+        assert int(os.path.getmtime(other)) == 1720000000
+        assert other.read_bytes() == b"collab"
+
+
+class _RangeResponse:
+    # Serves body from the requested Range offset with 206 when If-Range matches its ETag, or in full with 200
+    def __init__(self, body, range_header=None, if_range=None, etag='"v1"'):
+        self.headers = {"last-modified": "Sat, 09 Mar 2024 16:00:00 GMT", "etag": etag}
+        offset = int(range_header[len("bytes="):-1]) if range_header and if_range == etag else 0
+        self.status_code = 206 if offset else 200
+        if offset:
+            self.headers["content-range"] = f"bytes {offset}-{len(body) - 1}/{len(body)}"
+        self.headers["content-length"] = str(len(body) - offset)
+        self.raw = io.BytesIO(body[offset:])
+
+    def raise_for_status(self):
+        pass
+
+
+class TestResumableDownload:
+    def test_partial_file_is_resumed_with_range(self, im_module, tmp_path, monkeypatch):
+        ranges = []
+
+        def _get(url, headers=None, **kwargs):
+            ranges.append((headers.get("Range"), headers.get("If-Range")))
+            return _RangeResponse(b"0123456789", headers.get("Range"), headers.get("If-Range"))
+
+        monkeypatch.setattr(im_module.req, "get", _get)
+        dest = tmp_path / "videos" / "reel.mp4"
+        dest.parent.mkdir()
+        (tmp_path / "videos" / "reel.mp4.part").write_bytes(b"0123")
+        (tmp_path / "videos" / "reel.mp4.part.validator").write_text('"v1"')
+
+        assert im_module.save_pic_video("https://x.cdninstagram.com/reel.mp4", str(dest), 1710000000) is True
+        assert ranges == [("bytes=4-", '"v1"')]
+        assert dest.read_bytes() == b"0123456789"
+        assert not (tmp_path / "videos" / "reel.mp4.part").exists()
+        assert not (tmp_path / "videos" / "reel.mp4.part.validator").exists()
+        assert int(os.path.getmtime(dest)) == 1710000000
+
+    # A part from another version of the file fails If-Range, so the server sends the whole body and the part is replaced
+    def test_stale_partial_is_not_spliced(self, im_module, tmp_path, monkeypatch):
+        monkeypatch.setattr(im_module.req, "get", lambda url, headers=None, **kwargs: _RangeResponse(b"new-body", headers.get("Range"), headers.get("If-Range"), etag='"v2"'))
+        dest = tmp_path / "reel.mp4"
+        (tmp_path / "reel.mp4.part").write_bytes(b"old")
+        (tmp_path / "reel.mp4.part.validator").write_text('"v1"')
+
+        assert im_module.save_pic_video("https://x.cdninstagram.com/reel.mp4", str(dest)) is True
+        assert dest.read_bytes() == b"new-body"
+
+    # Without a saved validator there is nothing to send in If-Range, so the part is not resumed at all
+    def test_partial_without_validator_starts_over(self, im_module, tmp_path, monkeypatch):
+        ranges = []
+        monkeypatch.setattr(im_module.req, "get", lambda url, headers=None, **kwargs: ranges.append(headers.get("Range")) or _RangeResponse(b"0123456789"))
+        dest = tmp_path / "reel.mp4"
+        (tmp_path / "reel.mp4.part").write_bytes(b"xxxx")
+
+        assert im_module.save_pic_video("https://x.cdninstagram.com/reel.mp4", str(dest)) is True
+        assert ranges == [None]
+        assert dest.read_bytes() == b"0123456789"
+
+    def test_ignored_range_starts_over(self, im_module, tmp_path, monkeypatch):
+        monkeypatch.setattr(im_module.req, "get", lambda url, headers=None, **kwargs: _RangeResponse(b"fresh"))
+        dest = tmp_path / "pic.jpg"
+        (tmp_path / "pic.jpg.part").write_bytes(b"stale-partial")
+
+        assert im_module.save_pic_video("https://x.cdninstagram.com/pic.jpg", str(dest)) is True
+        assert dest.read_bytes() == b"fresh"
+
+    def test_oversized_download_is_abandoned(self, im_module, tmp_path, monkeypatch):
+        monkeypatch.setattr(im_module, "MEDIA_DOWNLOAD_MAX_MB", 1)
+        monkeypatch.setattr(im_module.req, "get", lambda url, headers=None, **kwargs: _RangeResponse(b"x" * (1024 * 1024 + 1)))
+        dest = tmp_path / "big.mp4"
+
+        assert im_module.save_pic_video("https://x.cdninstagram.com/big.mp4", str(dest)) is False
+        assert not dest.exists()
+        assert not (tmp_path / "big.mp4.part").exists()
+
+    # Content-Length over the limit fails before any byte is read, and the worker does not retry it
+    def test_oversized_content_length_is_rejected_once(self, im_module, tmp_path, monkeypatch):
+        calls = []
+        response = _RangeResponse(b"x" * 10)
+        response.headers["content-length"] = str(5 * 1024 * 1024)
+        monkeypatch.setattr(im_module, "MEDIA_DOWNLOAD_MAX_MB", 1)
+        monkeypatch.setattr(im_module, "MEDIA_DOWNLOAD_WORKERS", 1)
+        monkeypatch.setattr(im_module.MediaDownloader, "RETRY_DELAY", 0)
+        monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: None)
+        monkeypatch.setattr(im_module.req.Session, "get", lambda self, url, **kwargs: calls.append(url) or response)
+        dest = tmp_path / "big.mp4"
+
+        im_module.MEDIA_DOWNLOADER.submit("https://x.cdninstagram.com/big.mp4", str(dest))
+
+        assert im_module.MEDIA_DOWNLOADER.wait(5) is True
+        assert len(calls) == 1
+        assert response.raw.tell() == 0
+        assert not dest.exists() and not (tmp_path / "big.mp4.part").exists()
+
+
+class TestMediaDownloader:
+    def test_workers_download_in_background_and_report(self, im_module, tmp_path, monkeypatch):
+        activity = []
+        monkeypatch.setattr(im_module, "MEDIA_DOWNLOAD_WORKERS", 2)
+        monkeypatch.setattr(im_module, "log_activity", lambda message, **kwargs: activity.append((message, kwargs.get("user"))))
+        monkeypatch.setattr(im_module, "download_media", lambda url, dest, ts=0, use_media_store=False: open(dest, "wb").close())
+        downloader = im_module.MEDIA_DOWNLOADER
+        dests = [str(tmp_path / f"video{n}.mp4") for n in range(4)]
+
+        for dest in dests:
+            downloader.submit("https://x.cdninstagram.com/v.mp4", dest, user="target", label="Reel video")
+
+        assert downloader.wait(5) is True
+        assert all(os.path.isfile(dest) for dest in dests)
+        assert activity == [("Reel video saved", "target")] * 4
+        assert len(downloader._workers) == 2
+
+    def test_queued_path_counts_as_saved_and_is_not_queued_twice(self, im_module, tmp_path, monkeypatch):
+        release = im_module.threading.Event()
+        calls = []
+        monkeypatch.setattr(im_module, "MEDIA_DOWNLOAD_WORKERS", 1)
+        monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: None)
+        monkeypatch.setattr(im_module, "download_media", lambda url, dest, ts=0, use_media_store=False: calls.append(dest) or release.wait(5))
+        downloader = im_module.MEDIA_DOWNLOADER
+        dest = str(tmp_path / "reel.mp4")
+
+        downloader.submit("https://x.cdninstagram.com/reel.mp4", dest)
+        downloader.submit("https://x.cdninstagram.com/reel.mp4", dest)
+        assert downloader.has(dest) is True
+        release.set()
+
+        assert downloader.wait(5) is True
+        assert calls == [dest]
+        assert downloader.has(dest) is False
+
+    def test_failed_download_is_retried(self, im_module, tmp_path, monkeypatch):
+        results = [False, True]
+
+        def _download(*args, **kwargs):
+            if not results.pop(0):
+                raise OSError("connection reset")
+
+        monkeypatch.setattr(im_module, "MEDIA_DOWNLOAD_WORKERS", 1)
+        monkeypatch.setattr(im_module.MediaDownloader, "RETRY_DELAY", 0)
+        monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: None)
+        monkeypatch.setattr(im_module, "download_media", _download)
+
+        im_module.MEDIA_DOWNLOADER.submit("https://x.cdninstagram.com/reel.mp4", str(tmp_path / "reel.mp4"))
+
+        assert im_module.MEDIA_DOWNLOADER.wait(5) is True
+        assert results == []
+
+    # Two targets queuing the same stored media share one download, the second one is linked once it completes
+    def test_same_media_for_two_targets_is_downloaded_once(self, im_module, tmp_path, monkeypatch):
+        release = im_module.threading.Event()
+        calls = []
+
+        def _get(url, **kwargs):
+            calls.append(url)
+            release.wait(5)
+            return _RangeResponse(b"collab-video")
+
+        monkeypatch.setattr(im_module, "MEDIA_DOWNLOAD_WORKERS", 2)
+        monkeypatch.setattr(im_module, "MEDIA_STORE_ENABLED", True)
+        monkeypatch.setattr(im_module, "MEDIA_STORE_DIR", str(tmp_path / "store"))
+        monkeypatch.setattr(im_module, "MEDIA_STORES", {})
+        monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: None)
+        monkeypatch.setattr(im_module.req.Session, "get", lambda self, url, **kwargs: _get(url, **kwargs))
+        downloader = im_module.MEDIA_DOWNLOADER
+        first, second = tmp_path / "a" / "reel.mp4", tmp_path / "b" / "reel.mp4"
+
+        downloader.submit("https://a.cdninstagram.com/v/reel.mp4?oh=1", str(first), 1710000000, use_media_store=True, user="a")
+        downloader.submit("https://b.cdninstagram.com/v/reel.mp4?oh=2", str(second), 1710000000, use_media_store=True, user="b")
+        assert downloader.has(str(second)) is True
+        release.set()
+
+        assert downloader.wait(5) is True
+        assert len(calls) == 1
+        assert first.read_bytes() == second.read_bytes() == b"collab-video"
+
+
+class TestMediaStoreConcurrency:
+    # Concurrent fetches of one key wait for the first download instead of writing into the same partial file
+    def test_concurrent_fetches_of_one_key_download_once(self, im_module, tmp_path, monkeypatch):
+        started = im_module.threading.Event()
+        release = im_module.threading.Event()
+        calls = []
+        body = bytes(range(256)) * 1280
+
+        def _get(url, **kwargs):
+            calls.append(url)
+            started.set()
+            release.wait(5)
+            return _RangeResponse(body)
+
+        monkeypatch.setattr(im_module.req, "get", _get)
+        store = im_module.MediaStore(str(tmp_path / "store"))
+        dests = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+        errors = []
+
+        def fetch(url, dest):
+            try:
+                store.fetch(url, str(dest))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [im_module.threading.Thread(target=fetch, args=(f"https://{host}.cdninstagram.com/v/collab.mp4", dest)) for host, dest in zip("ab", dests)]
+        threads[0].start()
+        started.wait(5)
+        threads[1].start()
+        # Give the second fetch time to reach the key lock while the first download is still running
+        im_module.threading.Event().wait(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert errors == []
+        assert len(calls) == 1
+        assert all(dest.read_bytes() == body for dest in dests)
+        assert store._fetch_locks == {}
@@ -0,0 +1,165 @@
+"""Tests for the persistent notification outbox.
+
+SMTP and webhook delivery are replaced with recording fakes, and the sender
+thread is not started; the tests drive its delivery steps directly.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+class _FakeSMTP:
+    def __init__(self, sent, fail_first=False):
+        self.sent = sent
+        self.fail_first = fail_first
+        self.closed = False
+
+    def sendmail(self, sender, receiver, message):
+        if self.fail_first:
+            self.fail_first = False
+            raise OSError("connection closed")
+        self.sent.append(message)
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def outbox(im_module, monkeypatch, tmp_path):
+    path = tmp_path / "outbox.json"
+    monkeypatch.setattr(im_module, "NOTIFICATION_OUTBOX", True, raising=False)
+    monkeypatch.setattr(im_module, "NOTIFICATION_OUTBOX_FILE", str(path), raising=False)
+    monkeypatch.setattr(im_module, "NOTIFICATION_DIGEST_INTERVAL", 0, raising=False)
+    monkeypatch.setattr(im_module, "NOTIFICATION_RETRY_ATTEMPTS", 3, raising=False)
+    monkeypatch.setattr(im_module.NotificationOutbox, "_start", lambda self: None)
+    return im_module.NOTIFICATION_OUTBOX_QUEUE
+
+
+@pytest.fixture
+def smtp(im_module, monkeypatch):
+    state = {"sent": [], "connections": []}
+
+    def connect(use_ssl, smtp_timeout=15):
+        connection = _FakeSMTP(state["sent"])
+        state["connections"].append(connection)
+        return connection
+
+    monkeypatch.setattr(im_module, "open_smtp_connection", connect)
+    return state
+
+
+# Gives send_email settings which pass its validation
+def _email_settings(im_module, monkeypatch):
+    monkeypatch.setattr(im_module, "SMTP_HOST", "smtp.example.com", raising=False)
+    monkeypatch.setattr(im_module, "SMTP_PORT", 587, raising=False)
+    monkeypatch.setattr(im_module, "SMTP_USER", "user", raising=False)
+    monkeypatch.setattr(im_module, "SMTP_PASSWORD", "secret", raising=False)
+    monkeypatch.setattr(im_module, "SENDER_EMAIL", "monitor@example.com", raising=False)
+    monkeypatch.setattr(im_module, "RECEIVER_EMAIL", "ops@example.com", raising=False)
+
+
+# Runs one delivery pass of the sender over everything ready now
+def _send_ready(outbox, im_module):
+    with outbox._cond:
+        ready, _ = outbox._due(im_module.time.time())
+    settled = outbox._deliver(ready)
+    return ready, settled
+
+
+class TestNotificationOutbox:
+    def test_send_email_queues_instead_of_connecting(self, im_module, monkeypatch, outbox, smtp):
+        _email_settings(im_module, monkeypatch)
+        assert im_module.send_email("subject", "body", "", True) == 0
+        assert smtp["connections"] == []
+        assert len(outbox) == 1
+        saved = json.loads(Path(outbox.path()).read_text(encoding="utf-8"))
+        assert saved[0]["kind"] == "email" and saved[0]["message"]["subject"] == "subject"
+
+    def test_immediate_email_bypasses_outbox(self, im_module, monkeypatch, outbox, smtp):
+        _email_settings(im_module, monkeypatch)
+        assert im_module.send_email("subject", "body", "", True, immediate=True) == 0
+        assert len(smtp["sent"]) == 1
+        assert len(outbox) == 0
+
+    def test_send_webhook_queues_the_prepared_payload(self, im_module, monkeypatch, outbox):
+        monkeypatch.setattr(im_module, "WEBHOOK_ENABLED", True)
+        monkeypatch.setattr(im_module, "WEBHOOK_URL", "https://example.com/hook")
+        monkeypatch.setattr(im_module, "WEBHOOK_STATUS_NOTIFICATION", True)
+        monkeypatch.setattr(im_module.req, "post", lambda *args, **kwargs: pytest.fail("webhook posted inline"))
+        assert im_module.send_webhook("Title", "desc") == 0
+        message = outbox._items[0]["message"]
+        assert message["provider"] == "discord" and message["payload"]["title"] == "Title"
+
+    def test_queued_emails_are_merged_into_one_digest(self, im_module, outbox, smtp):
+        for n in range(3):
+            outbox.put("email", {"subject": f"subject {n}", "body": f"body {n}", "body_html": "", "use_ssl": True})
+        ready, settled = _send_ready(outbox, im_module)
+        assert len(ready) == 3 and len(settled) == 3
+        assert len(smtp["sent"]) == 1
+        assert "3 notifications" in smtp["sent"][0]
+
+    def test_emails_with_images_are_sent_on_their_own(self, im_module, outbox, smtp):
+        outbox.put("email", {"subject": "a", "body": "a", "body_html": "", "use_ssl": True})
+        outbox.put("email", {"subject": "b", "body": "b", "body_html": "<img src='cid:pic'>", "use_ssl": True, "image_file": "missing.jpg", "image_name": "pic"})
+        _send_ready(outbox, im_module)
+        assert len(smtp["sent"]) == 2
+
+    def test_smtp_connection_is_reused(self, im_module, outbox, smtp):
+        outbox.put("email", {"subject": "a", "body": "a", "body_html": "", "use_ssl": True})
+        _send_ready(outbox, im_module)
+        outbox._items.clear()
+        outbox.put("email", {"subject": "b", "body": "b", "body_html": "", "use_ssl": True})
+        _send_ready(outbox, im_module)
+        assert len(smtp["sent"]) == 2
+        assert len(smtp["connections"]) == 1
+
+    def test_dropped_connection_is_reopened_once(self, im_module, outbox, smtp):
+        outbox._smtp = _FakeSMTP(smtp["sent"], fail_first=True)
+        outbox._smtp_key = (im_module.SMTP_HOST, im_module.SMTP_PORT, im_module.SMTP_USER, True)
+        outbox.put("email", {"subject": "a", "body": "a", "body_html": "", "use_ssl": True})
+        _, settled = _send_ready(outbox, im_module)
+        assert len(settled) == 1
+        assert len(smtp["connections"]) == 1
+
+    def test_digest_interval_holds_new_emails(self, im_module, monkeypatch, outbox):
+        monkeypatch.setattr(im_module, "NOTIFICATION_DIGEST_INTERVAL", 60, raising=False)
+        outbox.put("email", {"subject": "a", "body": "a", "body_html": "", "use_ssl": True})
+        now = im_module.time.time()
+        with outbox._cond:
+            ready, next_ts = outbox._due(now)
+            assert ready == [] and next_ts == pytest.approx(now + 60, abs=5)
+            ready, _ = outbox._due(now + 61)
+        assert len(ready) == 1
+
+    def test_failed_webhook_is_retried_with_backoff_then_dropped(self, im_module, monkeypatch, outbox):
+        calls = []
+        monkeypatch.setattr(im_module, "post_webhook", lambda *args: calls.append(args) or (1, True))
+        outbox.put("webhook", {"provider": "discord", "payload": {"title": "t"}})
+        delays = []
+        for _ in range(3):
+            item = outbox._items[0]
+            item["next_try"] = 0
+            before = im_module.time.time()
+            ready, settled = _send_ready(outbox, im_module)
+            outbox._settle(ready, settled)
+            if outbox._items:
+                delays.append(round(outbox._items[0]["next_try"] - before))
+        assert len(calls) == 3
+        assert delays == [30, 60]
+        assert len(outbox) == 0
+
+    def test_permanent_webhook_failure_is_not_retried(self, im_module, monkeypatch, outbox):
+        monkeypatch.setattr(im_module, "post_webhook", lambda *args: (1, False))
+        outbox.put("webhook", {"provider": "discord", "payload": {"title": "t"}})
+        ready, settled = _send_ready(outbox, im_module)
+        outbox._settle(ready, settled)
+        assert len(outbox) == 0
+
+    def test_outbox_is_loaded_after_restart(self, im_module, outbox):
+        outbox.put("webhook", {"provider": "discord", "payload": {"title": "t"}})
+        restarted = im_module.NotificationOutbox()
+        assert len(restarted) == 1
+        restarted.put("webhook", {"provider": "discord", "payload": {"title": "u"}})
+        assert [item["id"] for item in restarted._items] == [1, 2]
@@ -61,3 +61,74 @@ class TestFetchUsernamesPaginated:
         assert result == ["a", "b"]
         assert stop_event.waits == [1]
         assert len(logs) == 1
+
+
+class TestFetchUsernamesIncremental:
+    # Enables incremental fetching with a short match run and records how many accounts the fake listing yielded
+    def _setup(self, im_module, monkeypatch, usernames):
+        monkeypatch.setattr(im_module, "FOLLOW_INCREMENTAL_FETCH", True, raising=False)
+        monkeypatch.setattr(im_module, "FOLLOW_INCREMENTAL_MATCH_RUN", 2, raising=False)
+        monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: None)
+        pulled = []
+
+        def generator():
+            for username in usernames:
+                pulled.append(username)
+                yield SimpleNamespace(username=username)
+
+        return generator, pulled
+
+    # Paging stops at the known run and the unread tail is reused from the baseline
+    def test_stops_at_known_run_and_reuses_tail(self, im_module, monkeypatch):
+        generator, pulled = self._setup(im_module, monkeypatch, ["new", "b", "c", "d", "e"])
+
+        result, incremental = im_module.fetch_usernames_incremental(None, generator, max_per_batch=0, total_limit=0, fetch_delay=0, advanced_fetch=False, estimated_limit=0, user="target", baseline=["a", "b", "c", "d", "e"], expected_count=5, full_scan_due=False)
+
+        assert (result, incremental) == (["new", "b", "c", "d", "e"], True)
+        assert pulled == ["new", "b", "c"]
+
+    # A tail removal shows up as a count mismatch and forces a full scan
+    def test_count_mismatch_falls_back_to_full_scan(self, im_module, monkeypatch):
+        generator, pulled = self._setup(im_module, monkeypatch, ["a", "b", "c", "e"])
+
+        result, incremental = im_module.fetch_usernames_incremental(None, generator, max_per_batch=0, total_limit=0, fetch_delay=0, advanced_fetch=False, estimated_limit=0, user="target", baseline=["a", "b", "c", "d", "e"], expected_count=4, full_scan_due=False)
+
+        assert (result, incremental) == (["a", "b", "c", "e"], False)
+        assert pulled == ["a", "b", "a", "b", "c", "e"]
+
+    # A reported count that was already off at the last scan is not a mismatch as long as the offset is the same
+    def test_known_count_offset_is_accepted(self, im_module, monkeypatch):
+        generator, pulled = self._setup(im_module, monkeypatch, ["new", "b", "c", "d", "e"])
+
+        result, incremental = im_module.fetch_usernames_incremental(None, generator, max_per_batch=0, total_limit=0, fetch_delay=0, advanced_fetch=False, estimated_limit=0, user="target", baseline=["a", "b", "c", "d", "e"], expected_count=7, baseline_count=7, full_scan_due=False)
+
+        assert (result, incremental) == (["new", "b", "c", "d", "e"], True)
+        assert pulled == ["new", "b", "c"]
+
+    # Scattered matches that never form a contiguous run read the whole listing
+    def test_non_contiguous_matches_read_everything(self, im_module, monkeypatch):
+        generator, pulled = self._setup(im_module, monkeypatch, ["c", "x", "a", "y"])
+
+        result, incremental = im_module.fetch_usernames_incremental(None, generator, max_per_batch=0, total_limit=0, fetch_delay=0, advanced_fetch=False, estimated_limit=0, user="target", baseline=["a", "b", "c"], expected_count=4, full_scan_due=False)
+
+        assert (result, incremental) == (["c", "x", "a", "y"], False)
+
+    # A due full scan ignores the baseline
+    def test_full_scan_due_reads_everything(self, im_module, monkeypatch):
+        generator, pulled = self._setup(im_module, monkeypatch, ["a", "b", "c"])
+
+        result, incremental = im_module.fetch_usernames_incremental(None, generator, max_per_batch=0, total_limit=0, fetch_delay=0, advanced_fetch=False, estimated_limit=0, user="target", baseline=["a", "b", "c"], expected_count=3, full_scan_due=True)
+
+        assert (result, incremental) == (["a", "b", "c"], False)
+        assert pulled == ["a", "b", "c"]
+
+
+class TestFollowFullScanDue:
+    # The first fetch is always a full scan and later ones follow the configured interval
+    def test_interval(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "FOLLOW_INCREMENTAL_FULL_SCAN_INTERVAL", 100, raising=False)
+        monkeypatch.setattr(im_module.time, "time", lambda: 1000)
+
+        assert im_module.follow_full_scan_due(0) is True
+        assert im_module.follow_full_scan_due(950) is False
+        assert im_module.follow_full_scan_due(900) is True
@@ -1,5 +1,6 @@
 """Tests for JSON username extraction, follow-string formatting and user-agent generation."""
 
+import json
 import random
 import re
 
@@ -54,6 +55,32 @@ class TestExtractUsernamesSafely:
             assert im_module.extract_usernames_safely(data) == []
 
 
+class _FakeResponse:
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode("utf-8")
+        self.decodes = 0
+
+    def json(self, **kwargs):
+        self.decodes += 1
+        return json.loads(self.content, **kwargs)
+
+
+class TestExtractUsernamesFromResponse:
+    # The wrapper and the later resp.json() caller share a single decode
+    def test_body_is_decoded_once(self, im_module):
+        resp = _FakeResponse(_followers_payload(["a", "b"]))
+        assert im_module.extract_usernames_from_response(resp) == ["a", "b"]
+        first = resp.json()
+        assert resp.json() is first
+        assert resp.decodes == 1
+
+    # Bodies without follower edges are never decoded by the wrapper
+    def test_unrelated_body_is_not_decoded(self, im_module):
+        resp = _FakeResponse({"data": {"user": {"username": "x"}}})
+        assert im_module.extract_usernames_from_response(resp) == []
+        assert resp.decodes == 0
+
+
 class TestBuildFollowString:
     def test_disabled(self, im_module):
         assert im_module.build_follow_string(False, 0, 0, 0) == "False"
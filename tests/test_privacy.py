@@ -43,3 +43,52 @@ class TestApplyPrivacySubstitutions:
         # Later rules see the output of earlier ones
         monkeypatch.setattr(im_module, "PRIVACY_SUBSTITUTIONS", [("a", "b"), ("b", "c")])
         assert im_module.apply_privacy_substitutions("a") == "c"
+
+
+# Reference implementation: one str.replace per rule, in order
+def _sequential(rules, text):
+    for search, replace in rules:
+        text = text.replace(search, replace)
+    return text
+
+
+class TestPrivacySubstituter:
+    def test_distinct_rules_compile_into_one_stage(self, im_module):
+        rules = [(f"user{i}x", f"User{i}") for i in range(60)]
+        substituter = im_module.PrivacySubstituter(rules)
+        assert len(substituter.stages) == 1
+        assert substituter.apply("user7x follows user42x") == "User7 follows User42"
+
+    def test_chained_and_overlapping_rules_get_their_own_stage(self, im_module):
+        rules = [("a", "b"), ("b", "c"), ("abc", "X"), ("q", ""), ("rs", "T")]
+        substituter = im_module.PrivacySubstituter(rules)
+        assert len(substituter.stages) == 4
+        for text in ("a", "abc", "qrqs", "xxabcab", "rqs"):
+            assert substituter.apply(text) == _sequential(rules, text)
+
+    def test_matches_sequential_replacement(self, im_module):
+        import random
+
+        rng = random.Random(1234)
+        alphabet = "abcd"
+        for _ in range(300):
+            rules = [("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3))), "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 3)))) for _ in range(rng.randint(1, 5))]
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            assert im_module.PrivacySubstituter(rules).apply(text) == _sequential(rules, text), (rules, text)
+
+    def test_recompiled_when_list_is_replaced(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "PRIVACY_SUBSTITUTIONS", [("realuser", "User1")])
+        assert im_module.apply_privacy_substitutions("realuser") == "User1"
+        first = im_module.get_privacy_substituter()
+        assert im_module.get_privacy_substituter() is first
+
+        monkeypatch.setattr(im_module, "PRIVACY_SUBSTITUTIONS", [("realuser", "User2")])
+        assert im_module.apply_privacy_substitutions("realuser") == "User2"
+        assert im_module.get_privacy_substituter() is not first
+
+    def test_short_strings_are_memoized(self, im_module):
+        substituter = im_module.PrivacySubstituter([("realuser", "User1")])
+        assert substituter.apply("realuser") == "User1"
+        assert substituter.memo["realuser"] == "User1"
+        substituter.apply("x" * 300)
+        assert "x" * 300 not in substituter.memo
@@ -1,6 +1,8 @@
 """Offline tests for profile picture change workflows."""
 
 import csv
+import hashlib
+import io
 import os
 import uuid
 from pathlib import Path
@@ -151,3 +153,81 @@ class TestProfilePictureWorkflows:
         assert webhooks[0][0][0].endswith("target Profile Picture Set")
         assert webhooks[0][1]["local_image_file"] == str(profile_pic)
         assert webhooks[0][1]["notification_type"] == "status"
+
+
+class _ConditionalResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.raw = io.BytesIO(body)
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class TestProfilePictureSidecar:
+    URL = "https://scontent.cdninstagram.com/v/t51.2885-19/111_n.jpg?oh=a"
+    NEW_URL = "https://scontent.cdninstagram.com/v/t51.2885-19/222_n.jpg?oh=b"
+
+    # Saves an initial picture through detection so its sidecar is written
+    def _initial(self, im_module, monkeypatch, artifact_dir):
+        profile_pic = artifact_dir / "profile.jpg"
+        _patch_quiet_output(im_module, monkeypatch)
+        monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: None)
+        monkeypatch.setattr(im_module, "save_pic_video", lambda url, file_name, custom_mdate_ts=0: _write_payload(Path(file_name), b"initial", 1700000000) is None)
+        im_module.detect_changed_profile_picture("target", self.URL, str(profile_pic), str(artifact_dir / "profile.tmp.jpg"), str(artifact_dir / "profile.old.jpg"), "", "", 60, False, 1)
+        return profile_pic
+
+    # Fails the test if any download path is used
+    def _forbid_downloads(self, im_module, monkeypatch):
+        def _fail(*args, **kwargs):
+            raise AssertionError("unexpected download")
+
+        monkeypatch.setattr(im_module, "save_pic_video", _fail)
+        monkeypatch.setattr(im_module.req, "get", _fail)
+
+    def test_initial_save_writes_sidecar(self, im_module, monkeypatch):
+        artifact_dir = _profile_picture_artifact_dir()
+        profile_pic = self._initial(im_module, monkeypatch, artifact_dir)
+
+        meta = im_module.read_profile_pic_meta(str(profile_pic))
+
+        assert meta["asset_id"] == "111_n.jpg"
+        assert meta["sha256"] == hashlib.sha256(b"initial").hexdigest()
+
+    def test_unchanged_asset_id_skips_download(self, im_module, monkeypatch):
+        artifact_dir = _profile_picture_artifact_dir()
+        profile_pic = self._initial(im_module, monkeypatch, artifact_dir)
+        self._forbid_downloads(im_module, monkeypatch)
+
+        im_module.detect_changed_profile_picture("target", self.URL.replace("oh=a", "oh=z"), str(profile_pic), str(artifact_dir / "profile.tmp.jpg"), str(artifact_dir / "profile.old.jpg"), "", "", 60, False, 2)
+
+        assert profile_pic.read_bytes() == b"initial"
+        assert not (artifact_dir / "profile.old.jpg").exists()
+
+    def test_not_modified_response_updates_asset_id(self, im_module, monkeypatch):
+        artifact_dir = _profile_picture_artifact_dir()
+        profile_pic = self._initial(im_module, monkeypatch, artifact_dir)
+        requests_seen = []
+        monkeypatch.setattr(im_module.req, "get", lambda url, **kwargs: requests_seen.append(kwargs["headers"]) or _ConditionalResponse(304))
+
+        im_module.detect_changed_profile_picture("target", self.NEW_URL, str(profile_pic), str(artifact_dir / "profile.tmp.jpg"), str(artifact_dir / "profile.old.jpg"), "", "", 60, False, 2)
+
+        assert len(requests_seen) == 1
+        assert im_module.read_profile_pic_meta(str(profile_pic))["asset_id"] == "222_n.jpg"
+        assert not (artifact_dir / "profile.old.jpg").exists()
+
+    def test_changed_asset_is_downloaded_and_detected(self, im_module, monkeypatch):
+        artifact_dir = _profile_picture_artifact_dir()
+        profile_pic = self._initial(im_module, monkeypatch, artifact_dir)
+        logs = []
+        monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: logs.append(args))
+        monkeypatch.setattr(im_module, "send_webhook", lambda *args, **kwargs: 0)
+        monkeypatch.setattr(im_module.req, "get", lambda url, **kwargs: _ConditionalResponse(200, b"new-picture", {"etag": '"v2"', "last-modified": "Sat, 09 Mar 2024 16:00:00 GMT"}))
+
+        im_module.detect_changed_profile_picture("target", self.NEW_URL, str(profile_pic), str(artifact_dir / "profile.tmp.jpg"), str(artifact_dir / "profile.old.jpg"), "", "", 60, False, 2)
+
+        meta = im_module.read_profile_pic_meta(str(profile_pic))
+        assert profile_pic.read_bytes() == b"new-picture"
+        assert logs[0] == ("Profile picture changed",)
+        assert (meta["asset_id"], meta["etag"]) == ("222_n.jpg", '"v2"')
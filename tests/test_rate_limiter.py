@@ -0,0 +1,107 @@
+"""Tests for the token-bucket request rate limiter used by the HTTP wrappers.
+
+time.monotonic and time.sleep are replaced with a fake clock, so bucket refill
+and waiting are deterministic and instant.
+"""
+
+import pytest
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(im_module, monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(im_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(im_module.time, "sleep", fake.sleep)
+    monkeypatch.setattr(im_module, "RATE_LIMIT_GLOBAL_PER_MIN", 0)
+    monkeypatch.setattr(im_module, "RATE_LIMIT_GRAPHQL_PER_MIN", 60)
+    monkeypatch.setattr(im_module, "RATE_LIMIT_IPHONE_PER_MIN", 0)
+    monkeypatch.setattr(im_module, "RATE_LIMIT_CDN_PER_MIN", 0)
+    monkeypatch.setattr(im_module, "RATE_LIMIT_BURST", 2)
+    return fake
+
+
+GRAPHQL_URL = "https://www.instagram.com/graphql/query/?doc_id=1"
+
+
+class TestClassifyInstagramUrl:
+    @pytest.mark.parametrize("url, expected", [
+        (GRAPHQL_URL, "graphql"),
+        ("https://i.instagram.com/api/v1/users/1/info/", "iphone"),
+        ("https://www.instagram.com/api/v1/users/web_profile_info/?username=x", "iphone"),
+        ("https://scontent-waw1-1.cdninstagram.com/v/t51/abc.jpg", "cdn"),
+        ("https://instagram.fwaw1-1.fna.fbcdn.net/v/abc.mp4", "cdn"),
+        ("https://www.instagram.com/someone/", "web"),
+        ("https://discord.com/api/webhooks/1/abc", None),
+        ("https://notinstagram.com/graphql", None),
+        (None, None),
+    ])
+    def test_classification(self, im_module, url, expected):
+        assert im_module.classify_instagram_url(url) == expected
+
+
+class TestRequestRateLimiter:
+    def test_burst_passes_then_waits_for_refill(self, im_module, clock):
+        limiter = im_module.RequestRateLimiter()
+        assert limiter.acquire(GRAPHQL_URL) == 0
+        assert limiter.acquire(GRAPHQL_URL) == 0
+        # 60/min refills one token per second
+        assert limiter.acquire(GRAPHQL_URL) == pytest.approx(1.0)
+
+    def test_concurrent_reservations_queue_up(self, im_module, clock, monkeypatch):
+        limiter = im_module.RequestRateLimiter()
+        monkeypatch.setattr(im_module.time, "sleep", lambda seconds: None)
+        waits = [limiter.acquire(GRAPHQL_URL) for _ in range(4)]
+        assert waits == [0, 0, pytest.approx(1.0), pytest.approx(2.0)]
+
+    def test_idle_time_refills_up_to_burst(self, im_module, clock):
+        limiter = im_module.RequestRateLimiter()
+        limiter.acquire(GRAPHQL_URL)
+        limiter.acquire(GRAPHQL_URL)
+        clock.now += 3600
+        assert [limiter.acquire(GRAPHQL_URL) for _ in range(2)] == [0, 0]
+        assert limiter.acquire(GRAPHQL_URL) > 0
+
+    def test_global_budget_spans_endpoint_classes(self, im_module, clock, monkeypatch):
+        monkeypatch.setattr(im_module, "RATE_LIMIT_GLOBAL_PER_MIN", 60)
+        monkeypatch.setattr(im_module, "RATE_LIMIT_GRAPHQL_PER_MIN", 0)
+        limiter = im_module.RequestRateLimiter()
+        limiter.acquire(GRAPHQL_URL)
+        limiter.acquire("https://i.instagram.com/api/v1/users/1/info/")
+        assert limiter.acquire("https://scontent.cdninstagram.com/a.jpg") > 0
+
+    def test_unlimited_class_and_foreign_hosts_never_wait(self, im_module, clock):
+        limiter = im_module.RequestRateLimiter()
+        for _ in range(10):
+            assert limiter.acquire("https://i.instagram.com/api/v1/users/1/info/") == 0
+            assert limiter.acquire("https://discord.com/api/webhooks/1/abc") == 0
+        assert clock.slept == []
+
+
+class TestRateLimitActive:
+    @pytest.mark.parametrize("targets, expected", [
+        ([], False),
+        (["alice"], False),
+        (["alice", "bob"], True),
+    ])
+    def test_only_active_with_several_targets(self, im_module, monkeypatch, targets, expected):
+        monkeypatch.setattr(im_module, "RATE_LIMIT_ENABLED", True)
+        monkeypatch.setitem(im_module.DASHBOARD_DATA, "targets_list", targets)
+        assert im_module.rate_limit_active() is expected
+
+    def test_disabled_limiter_is_never_active(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "RATE_LIMIT_ENABLED", False)
+        monkeypatch.setitem(im_module.DASHBOARD_DATA, "targets_list", ["alice", "bob"])
+        assert im_module.rate_limit_active() is False
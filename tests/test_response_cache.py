@@ -0,0 +1,95 @@
+"""Tests for the per-cycle web_profile_info response cache.
+
+A fake context counts get_iphone_json calls, so the tests can verify that the
+helpers of one check cycle share a single request. They run fully offline.
+"""
+
+import pytest
+
+
+def _profile_info(username="target"):
+    return {
+        "status": "ok",
+        "data": {
+            "user": {
+                "username": username,
+                "id": "123",
+                "edge_owner_to_timeline_media": {
+                    "edges": [
+                        {"node": {"id": "1", "shortcode": "OLD", "taken_at_timestamp": 100}},
+                        {"node": {"id": "2", "shortcode": "NEW", "taken_at_timestamp": 200, "owner": {"username": username}}},
+                    ]
+                },
+                "edge_reels_media": {"edges": [{"node": {"shortcode": "REEL"}}]},
+            }
+        },
+    }
+
+
+class _FakeContext:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+        self.is_logged_in = False
+
+    def get_iphone_json(self, path, params):
+        self.calls.append(path)
+        return self.response
+
+
+class _FakeBot:
+    def __init__(self, response):
+        self.context = _FakeContext(response)
+
+
+@pytest.fixture
+def cache_ttl(im_module, monkeypatch):
+    monkeypatch.setattr(im_module, "PROFILE_INFO_CACHE_TTL", 120, raising=False)
+
+
+class TestGetIphoneJsonCached:
+    def test_helpers_share_one_request_per_cycle(self, im_module, cache_ttl):
+        bot = _FakeBot(_profile_info())
+        post, source = im_module.latest_post_mobile("target", bot)
+        leaked = im_module.fetch_leaked_collab_posts("target", bot)
+        reel = im_module.get_real_reel_code(bot, "target")
+        assert (post.shortcode, source) == ("NEW", "post")
+        assert [p["shortcode"] for p in leaked] == ["OLD", "NEW"]
+        assert reel == "REEL"
+        assert bot.context.calls == ["api/v1/users/web_profile_info/?username=target"]
+
+    def test_invalidate_forces_fresh_request(self, im_module, cache_ttl):
+        bot = _FakeBot(_profile_info())
+        im_module.get_web_profile_info(bot, "target")
+        im_module.invalidate_response_cache(bot)
+        im_module.get_web_profile_info(bot, "target")
+        assert len(bot.context.calls) == 2
+
+    def test_entries_are_keyed_by_username(self, im_module, cache_ttl):
+        bot = _FakeBot(_profile_info())
+        im_module.get_web_profile_info(bot, "a")
+        im_module.get_web_profile_info(bot, "b")
+        im_module.get_web_profile_info(bot, "a")
+        assert len(bot.context.calls) == 2
+
+    def test_expired_entry_is_refetched(self, im_module, cache_ttl, monkeypatch):
+        bot = _FakeBot(_profile_info())
+        clock = iter([1000.0, 1200.0])
+        monkeypatch.setattr(im_module.time, "monotonic", lambda: next(clock))
+        im_module.get_web_profile_info(bot, "target")
+        im_module.get_web_profile_info(bot, "target")
+        assert len(bot.context.calls) == 2
+
+    def test_failed_response_is_not_cached(self, im_module, cache_ttl):
+        bot = _FakeBot({"status": "fail", "message": "please wait"})
+        im_module.get_web_profile_info(bot, "target")
+        im_module.get_web_profile_info(bot, "target")
+        assert len(bot.context.calls) == 2
+
+    def test_zero_ttl_disables_cache(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "PROFILE_INFO_CACHE_TTL", 0, raising=False)
+        bot = _FakeBot(_profile_info())
+        im_module.get_web_profile_info(bot, "target")
+        im_module.get_web_profile_info(bot, "target")
+        assert len(bot.context.calls) == 2
+        assert not hasattr(bot.context, "_im_response_cache")
@@ -124,3 +124,56 @@ class TestRandomizeNumber:
 
         assert im_module.randomize_number(100, 900, 50) == 100
         assert calls == [(100, 150)]
+
+
+class TestCheckScheduler:
+    def test_due_target_is_dispatched(self, im_module):
+        sched = im_module.CheckScheduler()
+        sched.schedule("a", 0)
+        assert sched.wait_turn("a", timeout=2) is True
+
+    def test_not_dispatched_before_due(self, im_module):
+        sched = im_module.CheckScheduler()
+        sched.schedule("a", 60)
+        assert sched.wait_turn("a", timeout=0.05) is False
+
+    def test_concurrency_limit_queues_until_slot_is_released(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "MULTI_TARGET_MAX_CONCURRENT_CHECKS", 1)
+        sched = im_module.CheckScheduler()
+        sched.schedule("a", 0)
+        assert sched.wait_turn("a", timeout=2) is True
+        sched.schedule("b", 0)
+        assert sched.wait_turn("b", timeout=0.1) is False
+        # Rescheduling "a" returns its slot, so the queued "b" runs next
+        sched.schedule("a", 60)
+        assert sched.wait_turn("b", timeout=2) is True
+
+    def test_run_now_bypasses_queue(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "MULTI_TARGET_MAX_CONCURRENT_CHECKS", 1)
+        sched = im_module.CheckScheduler()
+        sched.schedule("a", 0)
+        assert sched.wait_turn("a", timeout=2) is True
+        sched.schedule("b", 60)
+        sched.run_now("b")
+        sched.wake("b")
+        assert sched.wait_turn("b", timeout=2) is True
+
+
+class TestWaitForNextCheck:
+    def test_stop_event_wins(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "CHECK_SCHEDULER", im_module.CheckScheduler())
+        stop_event = im_module.threading.Event()
+        stop_event.set()
+        assert im_module.wait_for_next_check("a", 60, stop_event) == "stop"
+
+    def test_recheck_event_is_consumed(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "CHECK_SCHEDULER", im_module.CheckScheduler())
+        recheck = im_module.threading.Event()
+        recheck.set()
+        monkeypatch.setitem(im_module.WEB_DASHBOARD_RECHECK_EVENTS, "a", recheck)
+        assert im_module.wait_for_next_check("a", 60) == "recheck"
+        assert not recheck.is_set()
+
+    def test_returns_due_when_delay_expires(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "CHECK_SCHEDULER", im_module.CheckScheduler())
+        assert im_module.wait_for_next_check("a", 0) == "due"
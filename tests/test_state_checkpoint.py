@@ -0,0 +1,96 @@
+"""Tests for per-target state checkpoints and warm restarts of instagram_monitor_user."""
+
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+# Returns a valid checkpoint dict for the given target
+def _state(user="target", **overrides):
+    state = {"user": user, "session_key": "", "session_username": None, "insta_username": user, "insta_userid": 123, "followers_count": 10, "followings_count": 5, "bio": "bio", "is_private": False, "followed_by_viewer": False, "posts_count": 2, "reels_count": 0, "has_story": False, "story_flag": False, "stories_count": 0, "stories_old_count": 0, "processed_stories": [], "last_shortcode": "ABC", "highestinsta_ts": 1700000000, "highest_collab_ts": 0, "profile_pic_sha256": None}
+    state.update(overrides)
+    return state
+
+
+# Turns on state checkpoints on top of the shared startup-only monitor settings
+@pytest.fixture
+def checkpoint_monitor_defaults(im_module, monkeypatch, startup_monitor_defaults):
+    monkeypatch.setattr(im_module, "STATE_CHECKPOINT_ENABLED", True, raising=False)
+    monkeypatch.setattr(im_module, "STATE_CHECKPOINT_MAX_AGE", 3600, raising=False)
+
+
+class TestStateCheckpointFile:
+    def test_round_trip(self, im_module, monkeypatch, tmp_path):
+        monkeypatch.setattr(im_module, "STATE_CHECKPOINT_ENABLED", True)
+        path = str(tmp_path / "json" / "instagram_target_state.json")
+        im_module.save_state_checkpoint(path, _state())
+        loaded = im_module.load_state_checkpoint(path, "target", "")
+        assert loaded["followers_count"] == 10 and loaded["version"] == im_module.STATE_CHECKPOINT_VERSION
+        assert [name for name in os.listdir(tmp_path / "json")] == ["instagram_target_state.json"]
+
+    def test_rejects_other_target_session_or_version(self, im_module, monkeypatch, tmp_path):
+        monkeypatch.setattr(im_module, "STATE_CHECKPOINT_ENABLED", True)
+        path = str(tmp_path / "state.json")
+        im_module.save_state_checkpoint(path, _state())
+        assert im_module.load_state_checkpoint(path, "other", "") is None
+        assert im_module.load_state_checkpoint(path, "target", "session_user") is None
+        data = json.loads(open(path).read())
+        data["version"] = 0
+        open(path, "w").write(json.dumps(data))
+        assert im_module.load_state_checkpoint(path, "target", "") is None
+
+    def test_rejects_stale_or_corrupt_checkpoint(self, im_module, monkeypatch, tmp_path):
+        monkeypatch.setattr(im_module, "STATE_CHECKPOINT_ENABLED", True)
+        monkeypatch.setattr(im_module, "STATE_CHECKPOINT_MAX_AGE", 60)
+        path = str(tmp_path / "state.json")
+        im_module.save_state_checkpoint(path, _state())
+        data = json.loads(open(path).read())
+        data["saved_at"] = int(time.time()) - 120
+        open(path, "w").write(json.dumps(data))
+        assert im_module.load_state_checkpoint(path, "target", "") is None
+        open(path, "w").write("{broken")
+        assert im_module.load_state_checkpoint(path, "target", "") is None
+
+    def test_rejects_changed_profile_picture(self, im_module, monkeypatch, tmp_path):
+        monkeypatch.setattr(im_module, "STATE_CHECKPOINT_ENABLED", True)
+        monkeypatch.setattr(im_module, "DETECT_CHANGED_PROFILE_PIC", True)
+        pic = tmp_path / "pic.jpg"
+        pic.write_bytes(b"first")
+        im_module.write_profile_pic_meta(str(pic), "asset")
+        path = str(tmp_path / "state.json")
+        im_module.save_state_checkpoint(path, _state(profile_pic_sha256=im_module.read_profile_pic_meta(str(pic))["sha256"]))
+        assert im_module.load_state_checkpoint(path, "target", "", str(pic)) is not None
+        pic.write_bytes(b"second picture")
+        im_module.write_profile_pic_meta(str(pic), "asset")
+        assert im_module.load_state_checkpoint(path, "target", "", str(pic)) is None
+
+
+class TestWarmRestart:
+    # The second start resumes from the checkpoint written by the first one, without any baseline requests
+    def test_restart_skips_baseline_requests(self, im_module, monkeypatch, tmp_path, checkpoint_monitor_defaults):
+        calls = []
+        updates = []
+        fake_profile = SimpleNamespace(username="target", userid=123, followers=7, followees=3, biography="bio", is_private=False, followed_by_viewer=False, mediacount=0, profile_pic_url_no_iphone="https://example.com/profile.jpg", has_public_story=False)
+        context = SimpleNamespace(is_logged_in=False, iphone_headers={})
+        fake_bot = SimpleNamespace(context=context)
+        monkeypatch.setattr(im_module.instaloader, "Instaloader", lambda *args, **kwargs: fake_bot)
+        monkeypatch.setattr(im_module, "profile_from_username_resilient", lambda bot, username: calls.append(username) or fake_profile)
+        monkeypatch.setattr(im_module, "update_ui_data", lambda *args, **kwargs: updates.append(kwargs))
+        stop_event = threading.Event()
+        stop_event.set()
+
+        def run():
+            im_module.instagram_monitor_user("target", "", skip_session=True, skip_followers=True, skip_followings=True, skip_getting_story_details=True, skip_getting_posts_details=True, get_more_post_details=False, stop_event=stop_event, user_root_path=str(tmp_path), skip_follow_changes=True)
+
+        run()
+        checkpoint = json.loads((tmp_path / "json" / "instagram_target_state.json").read_text())
+        run()
+
+        assert calls == ["target"]
+        assert checkpoint["followers_count"] == 7 and checkpoint["bio"] == "bio"
+        resumed_counts = [u["targets"]["target"] for u in updates if "followers" in u.get("targets", {}).get("target", {})]
+        assert resumed_counts[-1]["followers"] == 7 and resumed_counts[-1]["following"] == 3
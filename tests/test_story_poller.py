@@ -0,0 +1,126 @@
+"""Tests for batching the story requests of several targets.
+
+A fake bot records every get_stories call, so the tests can verify which user
+ids share one request and when a cached result is reused. They run offline.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+class _FakeBot:
+    def __init__(self, with_story=(), error=None, session="session_user"):
+        self.context = SimpleNamespace(username=session)
+        self.with_story = set(with_story)
+        self.error = error
+        self.calls = []
+
+    def get_stories(self, userids):
+        self.calls.append(list(userids))
+        if self.error is not None:
+            raise self.error
+        return iter([SimpleNamespace(owner_id=userid) for userid in userids if userid in self.with_story])
+
+
+class TestStoryPoller:
+    def test_single_target_fetches_its_own_story(self, im_module):
+        bot = _FakeBot(with_story={1})
+        story = im_module.STORY_POLLER.story(bot, "a", 1)
+        assert story.owner_id == 1
+        assert bot.calls == [[1]]
+
+    def test_missing_story_returns_none(self, im_module):
+        bot = _FakeBot()
+        assert im_module.STORY_POLLER.story(bot, "a", 1) is None
+
+    def test_result_is_reused_within_ttl(self, im_module):
+        bot = _FakeBot(with_story={1})
+        first = im_module.STORY_POLLER.story(bot, "a", 1)
+        second = im_module.STORY_POLLER.story(bot, "a", 1)
+        assert first is second
+        assert len(bot.calls) == 1
+
+    def test_expired_result_is_refetched(self, im_module, monkeypatch):
+        bot = _FakeBot(with_story={1})
+        now = [1000.0]
+        monkeypatch.setattr(im_module.time, "monotonic", lambda: now[0])
+        im_module.STORY_POLLER.story(bot, "a", 1)
+        now[0] += 61
+        im_module.STORY_POLLER.story(bot, "a", 1)
+        assert len(bot.calls) == 2
+
+    def test_cached_missing_story_is_refetched_when_expected(self, im_module):
+        bot = _FakeBot()
+        assert im_module.STORY_POLLER.story(bot, "a", 1) is None
+        bot.with_story.add(1)
+        assert im_module.STORY_POLLER.story(bot, "a", 1) is None
+        assert im_module.STORY_POLLER.story(bot, "a", 1, expected=True).owner_id == 1
+        assert len(bot.calls) == 2
+
+    def test_concurrent_targets_share_one_request(self, im_module, monkeypatch):
+        monkeypatch.setattr(im_module, "STORY_BATCH_WINDOW", 0.3, raising=False)
+        bot = _FakeBot(with_story={1, 2})
+        poller = im_module.STORY_POLLER
+        # Both targets are known from an earlier cycle, so the first check waits for the second one to join
+        with poller._lock:
+            poller._userids["session_user"] = {"a": 1, "b": 2}
+        results = {}
+
+        def check(user, userid):
+            results[user] = poller.story(bot, user, userid)
+
+        first = threading.Thread(target=check, args=("a", 1))
+        first.start()
+        time.sleep(0.05)
+        check("b", 2)
+        first.join(5)
+        assert bot.calls == [[1, 2]]
+        assert results["a"].owner_id == 1 and results["b"].owner_id == 2
+
+    def test_sessions_are_batched_separately(self, im_module):
+        bot_a = _FakeBot(with_story={1}, session="one")
+        bot_b = _FakeBot(with_story={1}, session="two")
+        im_module.STORY_POLLER.story(bot_a, "a", 1)
+        im_module.STORY_POLLER.story(bot_b, "a", 1)
+        assert bot_a.calls == [[1]] and bot_b.calls == [[1]]
+
+    def test_targets_due_soon_are_prefetched(self, im_module):
+        bot = _FakeBot(with_story={2})
+        poller = im_module.STORY_POLLER
+        poller.story(bot, "a", 1)
+        poller.story(_FakeBot(), "b", 2)
+        poller.story(_FakeBot(), "c", 3)
+        scheduler = im_module.CHECK_SCHEDULER
+        scheduler.schedule("b", 30)
+        scheduler.schedule("c", 3600)
+        bot.calls.clear()
+        poller._results.clear()
+        poller.story(bot, "a", 1)
+        # "b" is due before the result expires and rides along, "c" is not
+        assert bot.calls == [[1, 2]]
+        assert poller.story(bot, "b", 2).owner_id == 2
+        assert len(bot.calls) == 1
+        scheduler.release("b")
+        scheduler.release("c")
+
+    def test_error_is_raised_and_not_cached(self, im_module):
+        bot = _FakeBot(error=RuntimeError("please wait"))
+        with pytest.raises(RuntimeError):
+            im_module.STORY_POLLER.story(bot, "a", 1)
+        with pytest.raises(RuntimeError):
+            im_module.STORY_POLLER.story(bot, "a", 1)
+        assert len(bot.calls) == 2
+
+    def test_discarded_target_is_not_prefetched(self, im_module):
+        poller = im_module.STORY_POLLER
+        poller.story(_FakeBot(), "b", 2)
+        im_module.CHECK_SCHEDULER.schedule("b", 10)
+        poller.discard("b")
+        poller._results.clear()
+        bot = _FakeBot()
+        poller.story(bot, "a", 1)
+        assert bot.calls == [[1]]
+        im_module.CHECK_SCHEDULER.release("b")
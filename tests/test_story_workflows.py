@@ -21,36 +21,9 @@ def _read_csv_rows(path: Path) -> list[list[str]]:
         return list(csv.reader(csv_file))
 
 
-# Applies deterministic monitor settings for a startup-only story workflow run
-def _patch_startup_monitor_defaults(im_module, monkeypatch) -> None:
-    monkeypatch.setattr(im_module, "LOCAL_TIMEZONE", "UTC", raising=False)
-    monkeypatch.setattr(im_module, "SESSION_USERNAME", "", raising=False)
-    monkeypatch.setattr(im_module, "NEXT_OPERATION_DELAY", 0, raising=False)
-    monkeypatch.setattr(im_module, "INSTA_CHECK_INTERVAL", 1, raising=False)
-    monkeypatch.setattr(im_module, "RANDOM_SLEEP_DIFF_LOW", 0, raising=False)
-    monkeypatch.setattr(im_module, "RANDOM_SLEEP_DIFF_HIGH", 0, raising=False)
-    monkeypatch.setattr(im_module, "DETECT_CHANGED_PROFILE_PIC", False, raising=False)
-    monkeypatch.setattr(im_module, "DOWNLOAD_THUMBNAILS", False, raising=False)
-    monkeypatch.setattr(im_module, "DETECT_COLLAB_POSTS", False, raising=False)
-    monkeypatch.setattr(im_module, "FOLLOWERS_CHURN_DETECTION", False, raising=False)
-    monkeypatch.setattr(im_module, "DASHBOARD_ENABLED", False, raising=False)
-    monkeypatch.setattr(im_module, "WEB_DASHBOARD_ENABLED", False, raising=False)
-    monkeypatch.setattr(im_module, "RICH_AVAILABLE", False, raising=False)
-    monkeypatch.setattr(im_module, "PROXY_ENABLED", False, raising=False)
-    monkeypatch.setattr(im_module, "HOURS_VERBOSE", False, raising=False)
-    monkeypatch.setattr(im_module, "print_cur_ts", lambda *args, **kwargs: None)
-    monkeypatch.setattr(im_module, "log_activity", lambda *args, **kwargs: None)
-    monkeypatch.setattr(im_module, "update_check_times", lambda *args, **kwargs: None)
-    monkeypatch.setattr(im_module, "get_dashboard_config_data", lambda: {})
-    monkeypatch.setattr(im_module, "randomize_number", lambda value, low, high: value)
-    monkeypatch.setattr(im_module, "compute_next_check_with_hours_range", lambda now, sleep_time: (sleep_time, now))
-    monkeypatch.setattr(im_module, "refresh_proxy_if_needed", lambda *args, **kwargs: None)
-    monkeypatch.setattr(im_module.time, "sleep", lambda seconds: None)
-
-
 class TestStoryWorkflows:
     # Startup story loading writes one CSV row and publishes last story dashboard metadata
-    def test_startup_story_item_writes_csv_and_ui_update(self, im_module, monkeypatch):
+    def test_startup_story_item_writes_csv_and_ui_update(self, im_module, monkeypatch, startup_monitor_defaults):
         artifact_dir = _story_artifact_dir()
         csv_path = artifact_dir / "events.csv"
         updates = []
@@ -64,13 +37,12 @@ class TestStoryWorkflows:
             url="https://example.com/story.jpg",
             video_url="",
         )
-        story = SimpleNamespace(itemcount=1, get_items=lambda: iter([story_item]))
+        story = SimpleNamespace(owner_id=123, itemcount=1, get_items=lambda: iter([story_item]))
         context = SimpleNamespace(is_logged_in=True, iphone_headers={}, _session=SimpleNamespace(request=lambda *args, **kwargs: None))
         fake_bot = SimpleNamespace(context=context, get_stories=lambda userids: iter([story]))
         fake_profile = SimpleNamespace(username="target", userid=123, followers=0, followees=0, biography="bio", is_private=False, followed_by_viewer=False, mediacount=0, profile_pic_url_no_iphone="https://example.com/profile.jpg", has_public_story=True)
         stop_event = threading.Event()
         stop_event.set()
-        _patch_startup_monitor_defaults(im_module, monkeypatch)
         monkeypatch.setattr(im_module.instaloader, "Instaloader", lambda *args, **kwargs: fake_bot)
         monkeypatch.setattr(im_module.instaloader.Profile, "own_profile", lambda ctx: SimpleNamespace(username="session_user"))
         monkeypatch.setattr(im_module, "profile_from_username_resilient", lambda bot, username: fake_profile)
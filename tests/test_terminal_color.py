@@ -17,3 +17,39 @@ def test_port_mapping_is_not_colored_as_a_time(im_module, monkeypatch):
 
     assert im_module._colorize_line(port_hint) == port_hint
     assert im_module._colorize_line("Next check at 21:07:39") == "Next check at \033[35m21:07:39\033[0m"
+
+
+# Verifies a time inside a highlighted date is not coloured a second time by the one-pass inline highlighter
+def test_inline_highlights_do_not_nest(im_module, monkeypatch):
+    monkeypatch.setattr(im_module, "COLOR_ENABLED", True)
+    monkeypatch.setattr(im_module, "_COLOR_STYLES", {"date": "\033[35m", "duration": "\033[32m", "count_down": "\033[31m"})
+
+    line = "Last post date: Mon 12 Jan 2024, 21:07:39 (2 days ago), from 5 to 3 (-2)"
+    expected = "Last post date: \033[35mMon 12 Jan 2024, 21:07:39\033[0m (\033[32m2 days\033[0m ago), from \033[31m5\033[0m to \033[31m3\033[0m \033[31m(-2)\033[0m"
+    assert im_module._colorize_line(line) == expected
+
+
+# Verifies the content type with the highest priority wins when a line mentions several
+def test_content_type_keyword_priority(im_module, monkeypatch):
+    monkeypatch.setattr(im_module, "COLOR_ENABLED", True)
+    monkeypatch.setattr(im_module, "_COLOR_STYLES", {"post": "\033[92m", "webhook": "\033[94m"})
+
+    assert im_module._colorize_line("Sending webhook for new post for target") == "\033[92mSending webhook for new post for target\033[0m"
+    assert im_module._colorize_line("Sending webhook") == "\033[94mSending webhook\033[0m"
+
+
+# Verifies repeated lines come from the cache and a style change drops the cached results
+def test_colorize_cache_follows_style_changes(im_module, monkeypatch):
+    monkeypatch.setattr(im_module, "COLOR_ENABLED", True)
+    monkeypatch.setattr(im_module, "_COLOR_STYLES", {"boolean_true": "\033[32m"})
+    calls = []
+    original = im_module._colorize_line_uncached
+    monkeypatch.setattr(im_module, "_colorize_line_uncached", lambda line: calls.append(line) or original(line))
+
+    assert im_module._colorize_line("Active: True") == "Active: \033[32mTrue\033[0m"
+    assert im_module._colorize_line("Active: True") == "Active: \033[32mTrue\033[0m"
+    assert len(calls) == 1
+
+    monkeypatch.setattr(im_module, "_COLOR_STYLES", {"boolean_true": "\033[33m"})
+    assert im_module._colorize_line("Active: True") == "Active: \033[33mTrue\033[0m"
+    assert len(calls) == 2